@@ -0,0 +1,17 @@
+#!/usr/bin/env bash
+# Report the slowest glyphd tests and profile the forecast tests.
+#
+# Usage: glyphd/scripts/profile_tests.sh [pytest args...]
+# Extra arguments are passed to the --durations run, e.g. -k persist.
+# pyinstrument is pulled in for the profiling run only; it is not a project dependency.
+
+set -euo pipefail
+
+cd "$(dirname "$0")/.."
+
+echo "== Slowest tests (anything over 100ms is worth a look) =="
+uv run pytest tests --durations=20 --durations-min=0.005 -q "$@"
+
+echo
+echo "== pyinstrument profile of tests/test_api_forecast.py =="
+uv run --with pyinstrument pyinstrument -r text -m pytest tests/test_api_forecast.py -q
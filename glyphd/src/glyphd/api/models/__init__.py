@@ -10,7 +10,7 @@ from glyphd.api.models.imports import (
     PipelineImportRequestDTO,
     RowErrorDTO,
 )
-from glyphd.api.models.listings import GPUListingDTO
+from glyphd.api.models.listings import GPUListingDTO, ListingPageDTO
 from glyphd.api.models.models import GPUModelDTO
 from glyphd.api.models.reports import ReportDTO
 from glyphd.api.models.schema_version import (
@@ -27,6 +27,7 @@ __all__ = [
     "ImportRequestDTO",
     "ImportResultDTO", 
     "ImportSummaryStatsDTO",
+    "ListingPageDTO",
     "PipelineImportRequestDTO", 
     "ReportDTO",
     "RowErrorDTO",
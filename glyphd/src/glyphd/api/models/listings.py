@@ -2,7 +2,7 @@
 DTO models for GPU listings.
 """
 
-from typing import Optional
+from typing import List, Optional
 
 from pydantic import BaseModel, Field
 
@@ -40,3 +40,24 @@ class GPUListingDTO(BaseModel):
                 "import_index": 1,
             }
         }
+
+
+class ListingPageDTO(BaseModel):
+    """
+    Data Transfer Object for one page of GPU listings.
+
+    Pass ``next_cursor`` as ``after_id`` to fetch the following page.
+    """
+
+    items: List[GPUListingDTO] = Field(..., description="The listings on this page, in insertion order")
+    next_cursor: Optional[int] = Field(None, description="Cursor for the next page; absent on the last page")
+
+    class Config:
+        """Pydantic model configuration."""
+
+        json_schema_extra = {
+            "example": {
+                "items": [GPUListingDTO.model_config["json_schema_extra"]["example"]],
+                "next_cursor": 100,
+            }
+        }
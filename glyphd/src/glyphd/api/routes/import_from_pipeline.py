@@ -10,6 +10,7 @@ from pathlib import Path
 from typing import List
 
 from fastapi import APIRouter, Depends, HTTPException
+from pydantic import TypeAdapter
 
 from glyphd.api.models import GPUListingDTO, ImportResultDTO, PipelineImportRequestDTO
 from glyphd.core.dependencies.storage import get_storage_engine
@@ -17,6 +18,9 @@ from glyphd.core.storage.sqlite_store import SqliteListingStore
 
 logger = logging.getLogger(__name__)
 
+# Built once so per-row validation dispatches straight into the compiled core schema
+_LISTING_ADAPTER = TypeAdapter(GPUListingDTO)
+
 router = APIRouter(
     prefix="/imports",
     tags=["Persist"],
@@ -119,31 +123,44 @@ def _parse_pipeline_csv(csv_path: Path, import_id: str) -> List[GPUListingDTO]:
     }
     
     try:
-        with open(csv_path, 'r', encoding='utf-8') as csvfile:
-            reader = csv.DictReader(csvfile)
+        with open(csv_path, 'r', newline='', encoding='utf-8') as csvfile:
+            reader = csv.reader(csvfile)
+            header = next(reader, [])
             
             # Validate required fields exist in CSV
-            if not required_fields.issubset(set(reader.fieldnames or [])):
-                missing_fields = required_fields - set(reader.fieldnames or [])
+            if not required_fields.issubset(header):
+                missing_fields = required_fields - set(header)
                 raise ValueError(f"Missing required fields in CSV: {missing_fields}")
             
-            for index, row in enumerate(reader):
+            # Resolve column positions once; rows are plain lists indexed positionally
+            column = {name: position for position, name in enumerate(header)}
+            model_i = column['canonical_model']
+            vram_i = column['vram_gb']
+            mig_i = column['mig_support']
+            nvlink_i = column['nvlink']
+            tdp_i = column['tdp_watts']
+            price_i = column['price']
+            score_i = column['score']
+            validate = _LISTING_ADAPTER.validate_python
+            
+            # Blank lines are skipped without consuming an import index, as DictReader did
+            for index, row in enumerate(row for row in reader if row):
                 try:
                     # Convert string values to appropriate types
-                    listing = GPUListingDTO(
-                        canonical_model=row['canonical_model'],
-                        vram_gb=int(row['vram_gb']),
-                        mig_support=int(row['mig_support']),
-                        nvlink=row['nvlink'].lower() in ('true', '1', 'yes'),
-                        tdp_watts=int(row['tdp_watts']),
-                        price=float(row['price']),
-                        score=float(row['score']),
-                        import_id=import_id,
-                        import_index=index,
-                    )
+                    listing = validate({
+                        'canonical_model': row[model_i],
+                        'vram_gb': int(row[vram_i]),
+                        'mig_support': int(row[mig_i]),
+                        'nvlink': row[nvlink_i].lower() in ('true', '1', 'yes'),
+                        'tdp_watts': int(row[tdp_i]),
+                        'price': float(row[price_i]),
+                        'score': float(row[score_i]),
+                        'import_id': import_id,
+                        'import_index': index,
+                    })
                     listings.append(listing)
                     
-                except (ValueError, KeyError) as e:
+                except (ValueError, IndexError) as e:
                     logger.warning(f"Skipping invalid row {index} in CSV: {e}")
                     continue
                     
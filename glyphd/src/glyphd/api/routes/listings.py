@@ -1,15 +1,17 @@
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from starlette import status
 
-from glyphd.api.models import GPUListingDTO
-from glyphd.core.dependencies.gpu_listings import get_gpu_listings
+from glyphd.api.models import GPUListingDTO, ListingPageDTO
+from glyphd.core.dependencies.gpu_listings import get_gpu_listings, get_gpu_listings_arrow
 from glyphd.core.dependencies.listing_repository import get_listing_repository
 from glyphd.core.storage.interface import ListingStore
 
 router = APIRouter(tags=["Listings"])
 
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+
 
 @router.get(
     "/listings/legacy",
@@ -55,6 +57,36 @@ async def get_listings_legacy(
     return filtered_listings
 
 
+@router.get(
+    "/listings.arrow",
+    response_class=Response,
+    status_code=status.HTTP_200_OK,
+    summary="Get GPU Listings as Arrow",
+    description="Retrieve all scored GPU listings (legacy data) as an Arrow IPC stream",
+    responses={200: {"content": {ARROW_STREAM_MEDIA_TYPE: {}}}},
+)
+def get_listings_arrow():
+    """
+    Get all scored GPU listings as an Arrow IPC stream.
+
+    A plain ``def`` so FastAPI runs it in the threadpool: the first call reads and parses
+    the scored CSV, which would otherwise block the event loop.
+
+    Returns:
+        Response: Arrow IPC stream of the scored listings.
+
+    Raises:
+        HTTPException: 501 if pyarrow is not installed, 404 if the listings file is missing
+    """
+    try:
+        content = get_gpu_listings_arrow()
+    except ImportError as e:
+        raise HTTPException(status_code=status.HTTP_501_NOT_IMPLEMENTED, detail=str(e))
+    except FileNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Listings not found: {e!s}")
+    return Response(content=content, media_type=ARROW_STREAM_MEDIA_TYPE)
+
+
 @router.get(
     "/listings",
     response_model=List[GPUListingDTO],
@@ -64,6 +96,7 @@ async def get_listings_legacy(
     description="Retrieve GPU listings from SQLite database with filtering, fuzzy matching, and pagination",
 )
 async def get_listings(
+    *,
     model: Optional[str] = Query(None, description="Filter by model name (supports fuzzy matching)"),
     min_price: Optional[float] = Query(None, ge=0, description="Minimum price filter"),
     max_price: Optional[float] = Query(None, ge=0, description="Maximum price filter"),
@@ -113,3 +146,66 @@ async def get_listings(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Invalid query parameters: {e!s}")
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Internal server error: {e!s}")
+
+
+@router.get(
+    "/listings/page",
+    response_model=ListingPageDTO,
+    response_model_exclude_none=True,
+    status_code=status.HTTP_200_OK,
+    summary="Page Through GPU Listings from Database",
+    description=(
+        "Retrieve GPU listings from SQLite database one page at a time with a cursor, so deep pages cost "
+        "the same as the first"
+    ),
+)
+async def get_listings_page(
+    *,
+    after_id: int = Query(0, ge=0, description="Cursor from the previous page's next_cursor (0 for the first page)"),
+    limit: int = Query(100, ge=1, le=1000, description="Maximum number of results (default: 100, max: 1000)"),
+    model: Optional[str] = Query(None, description="Filter by model name (supports fuzzy matching)"),
+    min_price: Optional[float] = Query(None, ge=0, description="Minimum price filter"),
+    max_price: Optional[float] = Query(None, ge=0, description="Maximum price filter"),
+    import_id: Optional[str] = Query(None, description="Filter by import batch ID"),
+    store: ListingStore = Depends(get_listing_repository),
+):
+    """
+    Query one page of GPU listings from the SQLite database.
+
+    Args:
+        after_id: Cursor returned with the previous page (0 for the first page)
+        limit: Maximum number of results to return (default: 100, max: 1000)
+        model: Optional filter by model name (supports fuzzy matching)
+        min_price: Optional minimum price filter
+        max_price: Optional maximum price filter
+        import_id: Optional filter by import batch ID
+        store: Listing repository from dependency injection
+
+    Returns:
+        ListingPageDTO: The page of listings and the cursor for the next page.
+
+    Raises:
+        HTTPException: 400 for invalid query parameters
+    """
+    try:
+        if min_price is not None and max_price is not None and min_price > max_price:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="min_price cannot be greater than max_price"
+            )
+
+        items, next_cursor = store.query_listings_page(
+            after_id=after_id,
+            limit=limit,
+            model=model,
+            min_price=min_price,
+            max_price=max_price,
+            import_id=import_id,
+        )
+        return ListingPageDTO(items=items, next_cursor=next_cursor)
+
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Invalid query parameters: {e!s}")
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Internal server error: {e!s}")
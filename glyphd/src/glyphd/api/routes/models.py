@@ -1,6 +1,7 @@
 from typing import List
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response
+from pydantic import TypeAdapter
 from starlette import status
 
 from glyphd.api.models import GPUModelDTO
@@ -8,6 +9,8 @@ from glyphd.core.dependencies.gpu_models import get_gpu_models
 
 router = APIRouter(tags=["Models"])
 
+_MODELS_ADAPTER = TypeAdapter(List[GPUModelDTO])
+
 
 @router.get(
     "/models",
@@ -28,4 +31,6 @@ async def get_models(models: List[GPUModelDTO] = Depends(get_gpu_models)):
     Returns:
         List[GPUModelDTO]: A list of GPU models with their metadata.
     """
-    return models
+    # The models were validated when loaded; serialize them directly instead of letting
+    # FastAPI re-validate them against the response model on every request
+    return Response(content=_MODELS_ADAPTER.dump_json(models, exclude_none=True), media_type="application/json")
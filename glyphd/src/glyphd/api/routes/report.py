@@ -1,6 +1,6 @@
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from starlette import status
 
 from glyphd.api.models import ReportDTO
@@ -8,6 +8,26 @@ from glyphd.core.dependencies.insight_report import get_insight_report
 
 router = APIRouter(tags=["Report"])
 
+# Last serialized report under a single key, with the (lru_cached) DTO it was built from;
+# mutated in place so the handler never rebinds a module global
+_report_json_cache: Dict[str, Tuple[ReportDTO, bytes]] = {}
+
+
+def _report_json(report: ReportDTO) -> bytes:
+    """
+    Serialize the report on first request and reuse the bytes while the same DTO is served.
+
+    Args:
+        report: The insight report to serialize
+
+    Returns:
+        JSON-encoded report
+    """
+    cached = _report_json_cache.get("report")
+    if cached is None or cached[0] is not report:
+        cached = _report_json_cache["report"] = (report, report.model_dump_json(exclude_none=True).encode())
+    return cached[1]
+
 
 @router.get(
     "/report",
@@ -30,4 +50,6 @@ async def get_report(report: Optional[ReportDTO] = Depends(get_insight_report)):
     if report is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Report not found")
 
-    return report
+    # The report was validated when loaded; serve its cached JSON instead of letting
+    # FastAPI re-validate and re-serialize it against the response model on every request
+    return Response(content=_report_json(report), media_type="application/json")
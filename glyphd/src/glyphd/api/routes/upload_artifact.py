@@ -17,6 +17,14 @@ from glyphd.api.models import ArtifactValidationResultDTO, GPUListingDTO
 
 logger = logging.getLogger(__name__)
 
+# Prefer orjson, which parses UTF-8 bytes directly without a separate decode step
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 router = APIRouter(
     prefix="/ingest",
     tags=["Validation"],
@@ -224,8 +232,7 @@ async def _validate_json_artifact(content: bytes, result: ArtifactValidationResu
         Updated validation result
     """
     try:
-        json_content = content.decode('utf-8')
-        data = json.loads(json_content)
+        data = _json_loads(content)
         
         # Handle different JSON structures
         if isinstance(data, list):
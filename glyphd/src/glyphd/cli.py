@@ -3,6 +3,7 @@ Command-line interface for glyphd.
 """
 
 import json
+import logging
 import os
 import sys
 from pathlib import Path
@@ -14,10 +15,26 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
 
+def _configure_logging() -> None:
+    """Install the root log handler, using Rich when it is available."""
+    try:
+        from rich.logging import RichHandler
+
+        logging.basicConfig(
+            level=logging.INFO,
+            format="%(message)s",
+            datefmt="[%X]",
+            handlers=[RichHandler(rich_tracebacks=True)],
+        )
+    except ImportError:
+        # Fall back to standard logging if rich is not available
+        logging.basicConfig(level=logging.INFO)
+
+
 @click.group()
 def cli():
     """GlyphD: FastAPI daemon for GPU scoring tool."""
-    pass
+    _configure_logging()
 
 
 @cli.command()
@@ -42,11 +59,13 @@ def serve(host: str, port: int, reload: bool):
 
 @cli.command()
 @click.argument("output_path", type=click.Path(), default="openapi.json")
-def export_openapi(output_path: str):
+@click.option("--compact", is_flag=True, help="Write the schema without indentation.")
+def export_openapi(output_path: str, compact: bool):
     """Export the OpenAPI schema to a JSON file.
 
     Args:
         output_path: Path where the OpenAPI schema will be saved.
+        compact: Write minified JSON instead of 2-space indented JSON.
     """
     # Import here to avoid circular imports
     from glyphd.api.router import create_app
@@ -68,12 +87,51 @@ def export_openapi(output_path: str):
     os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
 
     # Write the schema to the output file
-    with open(output_path, "w") as f:
-        json.dump(openapi_schema, f, indent=2)
+    if compact:
+        # Serialize once and hand the whole buffer to a single write
+        try:
+            import orjson
+
+            payload = orjson.dumps(openapi_schema)
+        except ImportError:
+            payload = json.dumps(openapi_schema, separators=(",", ":")).encode("utf-8")
+        with open(output_path, "wb") as f:
+            f.write(payload)
+    else:
+        with open(output_path, "w") as f:
+            json.dump(openapi_schema, f, indent=2)
 
     click.echo(f"✅ OpenAPI schema exported to {output_path}")
 
 
+@cli.command()
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(),
+    help="Where to write the Feather file (defaults to the glyphd resources directory)",
+)
+def compile_resources(output: str | None):
+    """Precompile GPU specs from gpu_specs.yaml into an Arrow Feather file.
+
+    The Feather file is read instead of the YAML registry at startup when pyarrow is
+    installed and the file is newer than gpu_specs.yaml.
+    """
+    from importlib.resources import files
+
+    from glyphd.core.resources.loaders.gpu_metadata import SPECS_FEATHER, write_specs_feather
+
+    output_path = Path(output) if output else Path(str(files("glyphd.resources"))) / SPECS_FEATHER
+
+    try:
+        count = write_specs_feather(output_path)
+    except ImportError as e:
+        click.echo(f"❌ {e}")
+        sys.exit(1)
+
+    click.echo(f"✅ Wrote {count} GPU specs to {output_path}")
+
+
 def get_db_path(db_path: str | None = None) -> str:
     """
     Get the database path from the provided argument, environment variable, or use default.
@@ -132,7 +190,9 @@ def init_db(db_path: str, force: bool):
         ListingDelta
     )
 
-    engine = create_engine(f"sqlite:///{db_path}")
+    from glyphd.sqlite.pragmas import install_pragmas
+
+    engine = install_pragmas(create_engine(f"sqlite:///{db_path}"))
     Base.metadata.create_all(engine)
 
     # Create a session and insert initial schema version
@@ -1,12 +1,18 @@
 import logging
 from functools import lru_cache
+from pathlib import Path
 from typing import List, cast
 
 from glyphd.api.models import GPUListingDTO
-from glyphd.core.resources.resource_context import GlyphdResourceContext
+from glyphd.core.resources.loaders.scored_listings import load_scored_listings_arrow
+from glyphd.core.resources.resource_context import GLYPHD_RESOURCE_CONTEXT
+
+try:
+    import pyarrow as pa
+except ImportError:  # pyarrow is optional; the Arrow endpoint is then unavailable
+    pa = None
 
 logger = logging.getLogger(__name__)
-resource_context = GlyphdResourceContext()
 
 
 @lru_cache
@@ -18,10 +24,35 @@ def get_gpu_listings() -> List[GPUListingDTO]:
         List of GPUListingDTO objects
     """
     try:
-        return cast(List[GPUListingDTO], resource_context.load(GPUListingDTO, "scored_sample.csv"))
+        return cast(List[GPUListingDTO], GLYPHD_RESOURCE_CONTEXT.load(GPUListingDTO, "scored_sample.csv"))
     except FileNotFoundError:
         logger.warning("Scored listings file not found: scored_sample.csv")
         return []
     except Exception as e:
         logger.error(f"Error loading scored listings: {e}")
         return []
+
+
+@lru_cache
+def get_gpu_listings_arrow() -> bytes:
+    """
+    Serialize the scored listings resource as an Arrow IPC stream.
+
+    The table is read straight from the CSV and written once; no DTOs are built.
+
+    Returns:
+        Arrow IPC stream bytes
+
+    Raises:
+        ImportError: If pyarrow is not installed
+        FileNotFoundError: If the scored listings file does not exist
+    """
+    if pa is None:
+        raise ImportError("pyarrow is required to serve listings as Arrow")
+
+    table = load_scored_listings_arrow(Path("scored_sample.csv"))
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    logger.info(f"Serialized {table.num_rows} listings to Arrow IPC")
+    return sink.getvalue().to_pybytes()
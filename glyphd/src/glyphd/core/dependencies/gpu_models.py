@@ -2,12 +2,119 @@ import csv
 import logging
 from functools import lru_cache
 from pathlib import Path
-from typing import List
+from typing import List, Optional
+
+from pydantic import TypeAdapter
 
 from glyphd.api.models import GPUModelDTO
+from glyphd.core.resources.csv_loader import CSV_BUFFER_SIZE
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:  # pyarrow is optional; fall back to the csv module
+    pa = None
+    pa_csv = None
 
 logger = logging.getLogger(__name__)
 
+# Built once so per-row validation dispatches straight into the compiled core schema
+_MODEL_ADAPTER = TypeAdapter(GPUModelDTO)
+
+# Market summary CSV column -> GPUModelDTO field
+CSV_COLUMNS = {
+    "Model": "model",
+    "Listing_Count": "listing_count",
+    "Min_Price": "min_price",
+    "Median_Price": "median_price",
+    "Max_Price": "max_price",
+    "Avg_Price": "avg_price",
+}
+
+
+def _load_gpu_models_arrow(csv_file_path: Path) -> Optional[List[GPUModelDTO]]:
+    """
+    Load GPU models by casting whole CSV columns with pyarrow.
+
+    Numeric columns are parsed and cast by Arrow's C kernels, then converted to Python
+    scalars column by column. Only the first row is validated; the rest use ``model_construct``.
+
+    Args:
+        csv_file_path: Path to the market summary CSV
+
+    Returns:
+        List of GPUModelDTO objects, or None if the file has missing or malformed values
+        and must go through the row-by-row path, which skips bad rows individually
+    """
+    convert_options = pa_csv.ConvertOptions(
+        column_types={
+            "Model": pa.string(),
+            "Listing_Count": pa.int64(),
+            "Min_Price": pa.float64(),
+            "Median_Price": pa.float64(),
+            "Max_Price": pa.float64(),
+            "Avg_Price": pa.float64(),
+        },
+        include_columns=list(CSV_COLUMNS),
+    )
+    try:
+        table = pa_csv.read_csv(str(csv_file_path), convert_options=convert_options)
+    except (pa.ArrowInvalid, KeyError) as e:
+        logger.info(f"Falling back to row-by-row GPU model parsing: {e}")
+        return None
+    if any(column.null_count for column in table.columns):
+        return None
+
+    fields = list(CSV_COLUMNS.values())
+    rows = [dict(zip(fields, values)) for values in zip(*(table.column(name).to_pylist() for name in CSV_COLUMNS))]
+    if not rows:
+        return []
+    return [_MODEL_ADAPTER.validate_python(rows[0])] + [GPUModelDTO.model_construct(**row) for row in rows[1:]]
+
+
+def _load_gpu_models_csv(csv_file_path: Path) -> List[GPUModelDTO]:
+    """
+    Load GPU models row by row with the csv module, skipping invalid rows.
+
+    Args:
+        csv_file_path: Path to the market summary CSV
+
+    Returns:
+        List of GPUModelDTO objects
+    """
+    gpu_models = []
+
+    with open(csv_file_path, 'r', buffering=CSV_BUFFER_SIZE, newline='', encoding='utf-8') as csvfile:
+        reader = csv.reader(csvfile)
+        header = next(reader, [])
+        missing = [name for name in CSV_COLUMNS if name not in header]
+        if missing:
+            logger.warning(f"GPU model metadata file is missing columns: {missing}")
+            return gpu_models
+
+        # Resolve column positions once and index each row list positionally
+        model_i, count_i, min_i, median_i, max_i, avg_i = (header.index(name) for name in CSV_COLUMNS)
+
+        for row in reader:
+            if not row:
+                continue
+            try:
+                # Map CSV field names to GPUModelDTO field names
+                gpu_model = _MODEL_ADAPTER.validate_python({
+                    "model": row[model_i],
+                    "listing_count": int(row[count_i]),
+                    "min_price": float(row[min_i]),
+                    "median_price": float(row[median_i]),
+                    "max_price": float(row[max_i]),
+                    "avg_price": float(row[avg_i]),
+                })
+                gpu_models.append(gpu_model)
+            except (ValueError, IndexError) as e:
+                logger.warning(f"Skipping invalid GPU model row: {row}. Error: {e}")
+                continue
+
+    return gpu_models
+
 
 @lru_cache
 def get_gpu_models() -> List[GPUModelDTO]:
@@ -23,30 +130,10 @@ def get_gpu_models() -> List[GPUModelDTO]:
         resources_dir = Path(__file__).parent.parent.parent / "resources"
         csv_file_path = resources_dir / "market_value_gpu_summary.csv"
         
-        if not csv_file_path.exists():
-            logger.warning(f"GPU model metadata file not found: {csv_file_path}")
-            return []
-        
-        gpu_models = []
-        
-        with open(csv_file_path, 'r', encoding='utf-8') as csvfile:
-            reader = csv.DictReader(csvfile)
-            
-            for row in reader:
-                try:
-                    # Map CSV field names to GPUModelDTO field names
-                    gpu_model = GPUModelDTO(
-                        model=row["Model"],
-                        listing_count=int(row["Listing_Count"]),
-                        min_price=float(row["Min_Price"]),
-                        median_price=float(row["Median_Price"]),
-                        max_price=float(row["Max_Price"]),
-                        avg_price=float(row["Avg_Price"]),
-                    )
-                    gpu_models.append(gpu_model)
-                except (ValueError, KeyError) as e:
-                    logger.warning(f"Skipping invalid GPU model row: {row}. Error: {e}")
-                    continue
+        # A missing file is reported by open() below; no separate exists() stat
+        gpu_models = _load_gpu_models_arrow(csv_file_path) if pa_csv is not None else None
+        if gpu_models is None:
+            gpu_models = _load_gpu_models_csv(csv_file_path)
         
         logger.info(f"Successfully loaded {len(gpu_models)} GPU models")
         return gpu_models
@@ -3,10 +3,9 @@ from functools import lru_cache
 from typing import Optional, cast
 
 from glyphd.api.models import ReportDTO
-from glyphd.core.resources.resource_context import GlyphdResourceContext
+from glyphd.core.resources.resource_context import GLYPHD_RESOURCE_CONTEXT
 
 logger = logging.getLogger(__name__)
-resource_context = GlyphdResourceContext()
 
 
 @lru_cache
@@ -18,7 +17,7 @@ def get_insight_report() -> Optional[ReportDTO]:
         ReportDTO object or None if the file is not found
     """
     try:
-        return cast(ReportDTO, resource_context.load(ReportDTO, "insight.yaml"))
+        return cast(ReportDTO, GLYPHD_RESOURCE_CONTEXT.load(ReportDTO, "insight.yaml"))
     except FileNotFoundError:
         logger.warning("Insight report not found: insight.yaml")
         return None
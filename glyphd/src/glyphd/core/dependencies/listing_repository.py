@@ -2,25 +2,18 @@
 Dependency injection for listing repository.
 """
 
-import os
-from functools import lru_cache
-
+from glyphd.core.dependencies.storage import get_storage_engine
 from glyphd.core.storage.interface import ListingStore
-from glyphd.core.storage.sqlite_store import SqliteListingStore
 
 
-@lru_cache
 def get_listing_repository() -> ListingStore:
     """
     Get the listing repository instance.
 
+    The repository is the cached storage engine, so listing queries and imports share one
+    store and its connection pool instead of each opening their own on the same database.
+
     Returns:
         ListingStore: The listing repository instance
     """
-    # Get database path from environment or use default
-    db_path = os.getenv("GLYPHD_DB_PATH", "data/gpu.sqlite")
-
-    # Ensure the data directory exists
-    os.makedirs(os.path.dirname(db_path), exist_ok=True)
-
-    return SqliteListingStore(db_path)
+    return get_storage_engine()
@@ -6,6 +6,11 @@ from glyphd.core.storage.sqlite_store import SqliteListingStore
 
 logger = logging.getLogger(__name__)
 
+# Resolve the database location once at import time rather than on every call.
+DB_PATH = os.getenv("GLYPHD_DB_PATH", "data/gpu.sqlite")
+DB_DIR = os.path.dirname(DB_PATH) or "."
+os.makedirs(DB_DIR, exist_ok=True)
+
 
 @lru_cache
 def get_storage_engine() -> SqliteListingStore:
@@ -15,11 +20,8 @@ def get_storage_engine() -> SqliteListingStore:
     Returns:
         SqliteListingStore: The configured storage engine instance
     """
-    # Get database path from environment or use default
-    db_path = os.getenv("GLYPHD_DB_PATH", "data/gpu.sqlite")
-
     try:
-        return SqliteListingStore(db_path=db_path)
+        return SqliteListingStore(db_path=DB_PATH)
     except Exception as e:
         logger.error(f"Error creating storage engine: {e}")
         raise
@@ -5,26 +5,52 @@ This module provides functionality to capture listing snapshots and compute
 deltas between successive snapshots for price volatility analysis and forecasting.
 """
 
-from datetime import datetime
-from typing import Optional
+import sys
+from datetime import UTC, datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import DateTime, bindparam, text
 
 from glyphd.sqlite.models import ListingDelta, ListingSnapshot
 
+# Pairs each snapshot of an import batch with the most recent earlier snapshot of the same
+# model and source URL, and writes the deltas in one statement. Mirrors _delta_values,
+# including a zero percentage change from a zero previous price.
+_SQL_INSERT_IMPORT_DELTAS = text(
+    """
+    INSERT INTO listing_deltas (
+        current_snapshot_id, previous_snapshot_id, price_delta, price_delta_pct, score_delta,
+        model, region, source_url, timestamp
+    )
+    SELECT curr.id, prev.id, curr.price_usd - prev.price_usd,
+           CASE WHEN prev.price_usd = 0 THEN 0.0
+                ELSE (curr.price_usd - prev.price_usd) / prev.price_usd * 100 END,
+           curr.score - prev.score, curr.model, curr.region, curr.source_url, :timestamp
+    FROM listing_snapshots AS curr
+    JOIN listing_snapshots AS prev ON prev.id = (
+        SELECT p.id FROM listing_snapshots AS p
+        WHERE p.source_url = curr.source_url AND p.model = curr.model AND p.id < curr.id
+        ORDER BY p.seen_at DESC, p.id DESC
+        LIMIT 1
+    )
+    WHERE curr.import_id = :import_id AND curr.seen_at = :seen_at AND curr.source_url IS NOT NULL
+    """
+).bindparams(bindparam("seen_at", type_=DateTime), bindparam("timestamp", type_=DateTime))
 
-def compute_delta(prev: ListingSnapshot, curr: ListingSnapshot) -> ListingDelta:
+
+def _delta_values(prev: ListingSnapshot, curr: ListingSnapshot) -> Dict[str, Any]:
     """
-    Compute delta between two listing snapshots.
-    
+    Compute the column values of a delta between two listing snapshots.
+
     Args:
         prev: Previous snapshot
         curr: Current snapshot
-        
+
     Returns:
-        ListingDelta: Computed delta with price and score changes
-        
+        Dictionary of ListingDelta column values (without timestamp)
+
     Raises:
         ValueError: If snapshots are for different models or sources
-        ZeroDivisionError: If previous price is zero (handled gracefully)
     """
     # Validate that snapshots are comparable
     if prev.model != curr.model:
@@ -42,53 +68,143 @@ def compute_delta(prev: ListingSnapshot, curr: ListingSnapshot) -> ListingDelta:
     else:
         price_delta_pct = (price_delta / prev.price_usd) * 100
     
-    # Compute score delta
-    score_delta = curr.score - prev.score
+    return {
+        "current_snapshot_id": curr.id,
+        "previous_snapshot_id": prev.id,
+        "price_delta": price_delta,
+        "price_delta_pct": price_delta_pct,
+        "score_delta": curr.score - prev.score,
+        "model": curr.model,
+        "region": curr.region,
+        "source_url": curr.source_url,
+    }
+
+
+def compute_delta(
+    prev: ListingSnapshot, curr: ListingSnapshot, seen_at: Optional[datetime] = None
+) -> ListingDelta:
+    """
+    Compute delta between two listing snapshots.
     
-    # Create and return delta object
-    return ListingDelta(
-        current_snapshot_id=curr.id,
-        previous_snapshot_id=prev.id,
-        price_delta=price_delta,
-        price_delta_pct=price_delta_pct,
-        score_delta=score_delta,
-        model=curr.model,
-        region=curr.region,
-        source_url=curr.source_url,
-        timestamp=datetime.utcnow(),
-    )
+    Args:
+        prev: Previous snapshot
+        curr: Current snapshot
+        seen_at: Timestamp for the delta (defaults to now, in UTC)
+        
+    Returns:
+        ListingDelta: Computed delta with price and score changes
+        
+    Raises:
+        ValueError: If snapshots are for different models or sources
+        ZeroDivisionError: If previous price is zero (handled gracefully)
+    """
+    return ListingDelta(**_delta_values(prev, curr), timestamp=seen_at or datetime.now(UTC))
+
+
+def compute_deltas(
+    pairs: Iterable[Tuple[ListingSnapshot, ListingSnapshot]], seen_at: Optional[datetime] = None
+) -> List[Dict[str, Any]]:
+    """
+    Compute deltas for many (previous, current) snapshot pairs at once.
 
+    Returns plain column dictionaries instead of ORM objects so callers can write
+    them in a single executemany via ``session.bulk_insert_mappings(ListingDelta, rows)``.
 
-def create_snapshot_from_listing(listing_data: dict, seen_at: Optional[datetime] = None) -> ListingSnapshot:
+    Args:
+        pairs: Iterable of (previous, current) snapshot pairs
+        seen_at: Timestamp shared by every delta (defaults to now, in UTC)
+
+    Returns:
+        List of ListingDelta column dictionaries
+
+    Raises:
+        ValueError: If any pair is for different models or sources
+    """
+    timestamp = seen_at or datetime.now(UTC)
+    return [{**_delta_values(prev, curr), "timestamp": timestamp} for prev, curr in pairs]
+
+
+def compute_deltas_for_import(conn, import_id: str, seen_at: datetime) -> int:
+    """
+    Compute and store the deltas for one import batch's snapshots in a single SQL pass.
+
+    Equivalent to pairing every snapshot of the batch with its predecessor and writing
+    ``compute_deltas(pairs, seen_at)``, without loading any snapshot into Python. Snapshots
+    without a source URL or without an earlier snapshot get no delta.
+
+    Args:
+        conn: Database connection with an open transaction; the snapshots must be flushed
+        import_id: Import batch ID the snapshots were stamped with
+        seen_at: Timestamp shared by the batch's snapshots, also used for the deltas
+
+    Returns:
+        The number of deltas inserted
+    """
+    params = {"import_id": import_id, "seen_at": seen_at, "timestamp": seen_at}
+    return conn.execute(_SQL_INSERT_IMPORT_DELTAS, params).rowcount
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    """Intern a repeated string field, passing None through."""
+    return sys.intern(value) if value is not None else None
+
+
+def snapshot_row(
+    listing_data: dict, seen_at: Optional[datetime] = None, import_id: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Build the listing_snapshots column values for listing data.
+
+    The row can be written with ``bulk_insert_listings`` without creating an ORM object.
+
+    Args:
+        listing_data: Dictionary containing listing information
+        seen_at: Timestamp when listing was seen (defaults to now, in UTC)
+        import_id: Import batch the snapshot belongs to
+
+    Returns:
+        Dictionary of column name to value
+    """
+    if seen_at is None:
+        seen_at = datetime.now(UTC)
+
+    return {
+        'model': _intern(listing_data.get('canonical_model', listing_data.get('model'))),
+        'price_usd': float(listing_data['price']),
+        'score': float(listing_data['score']),
+        **ListingSnapshot.capacity_columns(listing_data.get('quantization_capacity')),
+        'seen_at': seen_at,
+        'seller': listing_data.get('seller'),
+        'region': _intern(listing_data.get('region')),
+        'source_url': _intern(listing_data.get('source_url')),
+        'heuristics': listing_data.get('heuristics'),
+        'import_id': import_id,
+    }
+
+
+def create_snapshot_from_listing(
+    listing_data: dict, seen_at: Optional[datetime] = None, import_id: Optional[str] = None
+) -> ListingSnapshot:
     """
     Create a ListingSnapshot from listing data.
     
     Args:
         listing_data: Dictionary containing listing information
-        seen_at: Timestamp when listing was seen (defaults to now)
+        seen_at: Timestamp when listing was seen (defaults to now, in UTC)
+        import_id: Import batch the snapshot belongs to
         
     Returns:
         ListingSnapshot: New snapshot object
     """
-    if seen_at is None:
-        seen_at = datetime.utcnow()
-    
-    return ListingSnapshot(
-        model=listing_data.get('canonical_model', listing_data.get('model')),
-        price_usd=float(listing_data['price']),
-        score=float(listing_data['score']),
-        quantization_capacity=listing_data.get('quantization_capacity'),
-        seen_at=seen_at,
-        seller=listing_data.get('seller'),
-        region=listing_data.get('region'),
-        source_url=listing_data.get('source_url'),
-        heuristics=listing_data.get('heuristics'),
-    )
+    return ListingSnapshot(**snapshot_row(listing_data, seen_at, import_id))
 
 
 __all__ = [
     "ListingDelta",
     "ListingSnapshot",
     "compute_delta",
+    "compute_deltas",
+    "compute_deltas_for_import",
     "create_snapshot_from_listing",
+    "snapshot_row",
 ]
\ No newline at end of file
@@ -1,7 +1,99 @@
+import csv
+import sys
+from importlib.resources import files
+from typing import Any, Callable, Dict, Iterable, List, Optional, Type, get_args
+
 from glyphsieve.core.resources.base_csv_loader import BaseCsvLoader
+from glyphsieve.core.resources.base_resource_loader import T
+
+# Read CSVs with a 1 MiB buffer; newline="" leaves line handling to the csv module
+CSV_BUFFER_SIZE = 1 << 20
+
+_TRUE_STRINGS = frozenset({"true", "1", "yes", "y", "t", "on"})
+
+
+def _parse_bool(value: str) -> bool:
+    return value.strip().lower() in _TRUE_STRINGS
+
+
+def _converter_for(annotation: Any) -> Optional[Callable[[str], Any]]:
+    """Return a str -> value converter for a scalar field annotation, or None if unsupported."""
+    args = [arg for arg in get_args(annotation) if arg is not type(None)]
+    base = args[0] if len(args) == 1 else annotation
+    if base is bool:
+        return _parse_bool
+    if base in (int, float, str):
+        return base
+    return None
 
 
 class GlyphdCSVLoader(BaseCsvLoader):
     @property
     def resource_uri(self) -> str:
         return "glyphd.resources"
+
+    def load_trusted(self, model: Type[T], resource_name: str, intern_fields: Iterable[str] = ()) -> List[T]:
+        """
+        Load a trusted CSV resource, validating only the first row.
+
+        The first row goes through full Pydantic validation as a sanity check on the
+        header and value formats. Remaining rows are converted with plain scalar casts
+        and built with ``model_construct``, skipping per-row validation. Models with
+        non-scalar fields fall back to validating every row.
+
+        Values of ``intern_fields`` are passed through ``sys.intern`` so repeated
+        strings (model names, regions) share a single object across rows.
+
+        Args:
+            model: The Pydantic model to build for each row
+            resource_name: The name of the CSV resource
+            intern_fields: Names of string columns whose values should be interned
+
+        Returns:
+            List of model instances, one per CSV row
+        """
+        converters: Dict[str, Callable[[str], Any]] = {}
+        for name, field in model.model_fields.items():
+            converter = _converter_for(field.annotation)
+            if converter is None:
+                return self.load(model, resource_name)
+            converters[name] = converter
+
+        resource_path = files(self.resource_uri).joinpath(resource_name)
+        with resource_path.open("r", buffering=CSV_BUFFER_SIZE, newline="", encoding="utf-8") as f:
+            reader = csv.reader(f)
+            header = next(reader, None)
+            first_row = next(reader, None)
+            if header is None or first_row is None:
+                return []
+            first: Dict[str, Any] = dict(zip(header, first_row))
+            intern_set = frozenset(intern_fields)
+            for name in intern_set:
+                if first.get(name) is not None:
+                    first[name] = sys.intern(first[name])
+            results = [model.model_validate(first)]
+
+            # Resolve column positions, converters and interning once from the header,
+            # so the row loop indexes lists instead of building a dict per row
+            columns = [
+                (name, index, converters[name], name in intern_set)
+                for index, name in enumerate(header)
+                if name in converters
+            ]
+            width = len(header)
+            intern = sys.intern
+            construct = model.model_construct
+            append = results.append
+            for row in reader:
+                if not row:
+                    continue
+                padded = row + [""] * (width - len(row)) if len(row) < width else row
+                fields = {}
+                for name, index, convert, interned in columns:
+                    value = padded[index]
+                    if value == "":
+                        fields[name] = None
+                    else:
+                        fields[name] = convert(intern(value) if interned else value)
+                append(construct(**fields))
+            return results
@@ -1,14 +1,138 @@
 import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from importlib.resources import files
 from pathlib import Path
-from typing import List, cast
+from typing import Any, Dict, List, Optional, cast
 
 from glyphd.api.models import GPUModelDTO
-from glyphd.core.resources.resource_context import GlyphdResourceContext
+from glyphd.core.resources.csv_loader import GlyphdCSVLoader
+from glyphd.core.resources.resource_context import GLYPHD_RESOURCE_CONTEXT
 from glyphsieve.core.resources.yaml_loader import GlyphSieveYamlLoader
 from glyphsieve.models.gpu import GPURegistry
 
+try:
+    import pyarrow as pa
+    import pyarrow.feather as pa_feather
+except ImportError:  # pyarrow is optional; specs are then always read from YAML
+    pa = None
+    pa_feather = None
+
 logger = logging.getLogger(__name__)
 
+# Maps a market-data model name ("H100 PCIe 80GB") onto the spec key form ("H100_PCIE_80GB")
+_CANON = str.maketrans(" ", "_")
+
+# GPU spec fields copied onto GPUModelDTO during enrichment
+SPEC_FIELDS = (
+    "vram_gb",
+    "tdp_watts",
+    "mig_support",
+    "nvlink",
+    "generation",
+    "cuda_cores",
+    "slot_width",
+    "pcie_generation",
+)
+
+# Precompiled Arrow copy of glyphsieve's gpu_specs.yaml, written by `glyphd compile-resources`
+SPECS_FEATHER = "gpu_specs.feather"
+
+
+def _specs_from_registry() -> Dict[str, Dict[str, Any]]:
+    """
+    Build the spec lookup from glyphsieve's gpu_specs.yaml.
+
+    Returns:
+        Dictionary of canonical model name to spec field values
+    """
+    gpu_registry = GlyphSieveYamlLoader().load(GPURegistry, "gpu_specs.yaml")
+    return {
+        gpu.canonical_model: {field: getattr(gpu, field) for field in SPEC_FIELDS}
+        for gpu in gpu_registry.gpus
+        if gpu.canonical_model
+    }
+
+
+def _specs_from_feather(path: Path) -> Dict[str, Dict[str, Any]]:
+    """
+    Build the spec lookup from a precompiled Feather file by zipping its columns.
+
+    Args:
+        path: Path to the Feather file
+
+    Returns:
+        Dictionary of canonical model name to spec field values
+    """
+    table = pa_feather.read_table(str(path))
+    columns = [table.column(field).to_pylist() for field in SPEC_FIELDS]
+    return {
+        model: dict(zip(SPEC_FIELDS, values))
+        for model, *values in zip(table.column("canonical_model").to_pylist(), *columns)
+    }
+
+
+def _load_specs_by_model() -> Dict[str, Dict[str, Any]]:
+    """
+    Load the spec lookup, preferring the precompiled Feather file when it is up to date.
+
+    The Feather file is only used when pyarrow is installed and the file is at least
+    as new as gpu_specs.yaml; otherwise the YAML registry is parsed.
+
+    Returns:
+        Dictionary of canonical model name to spec field values
+    """
+    feather_path = files("glyphd.resources").joinpath(SPECS_FEATHER)
+    yaml_path = files(GlyphSieveYamlLoader().resource_uri).joinpath("gpu_specs.yaml")
+    if pa_feather is not None and isinstance(feather_path, Path) and isinstance(yaml_path, Path):
+        try:
+            feather_mtime = feather_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return _specs_from_registry()
+        if feather_mtime >= yaml_path.stat().st_mtime_ns:
+            return _specs_from_feather(feather_path)
+    return _specs_from_registry()
+
+
+@lru_cache(maxsize=1)
+def _specs_lookup() -> Dict[str, Dict[str, Any]]:
+    """
+    Build the spec lookup once per process, keyed by both the original and canonical names.
+
+    Returns:
+        Dictionary of model name (original or canonicalized) to spec field values
+    """
+    specs_by_model = _load_specs_by_model()
+    logger.info(f"Loaded specs for {len(specs_by_model)} GPU models")
+    return {**specs_by_model, **{k.translate(_CANON).upper(): v for k, v in specs_by_model.items()}}
+
+
+def write_specs_feather(output_path: Path) -> int:
+    """
+    Serialize the GPU spec registry to an uncompressed Feather file.
+
+    Args:
+        output_path: Where to write the Feather file
+
+    Returns:
+        Number of GPU specs written
+
+    Raises:
+        ImportError: If pyarrow is not installed
+    """
+    if pa_feather is None:
+        raise ImportError("pyarrow is required to compile GPU specs to Feather")
+
+    specs = _specs_from_registry()
+    table = pa.table(
+        {
+            "canonical_model": list(specs),
+            **{field: [spec[field] for spec in specs.values()] for field in SPEC_FIELDS},
+        }
+    )
+    pa_feather.write_feather(table, str(output_path), compression="uncompressed")
+    return table.num_rows
+
 
 def load_gpu_model_metadata(path: Path) -> List[GPUModelDTO]:
     """
@@ -24,36 +148,40 @@ def load_gpu_model_metadata(path: Path) -> List[GPUModelDTO]:
         FileNotFoundError: If the file does not exist
         ValidationError: If the data does not match the expected schema
     """
-    if not path.exists():
-        logger.error(f"GPU model metadata file not found: {path}")
-        raise FileNotFoundError(f"File not found: {path}")
+    # On a cold start, build the spec lookup on a worker thread while the market CSV loads;
+    # the two reads are independent. Once cached, the lookup is fetched inline.
+    executor: Optional[ThreadPoolExecutor] = None
+    specs_future: Optional[Future] = None
+    if _specs_lookup.cache_info().currsize == 0:
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="gpu-specs")
+        specs_future = executor.submit(_specs_lookup)
 
-    models = cast(List[GPUModelDTO], GlyphdResourceContext().load(GPUModelDTO, path.name))
+    try:
+        # Market data is generated by our own pipeline; validate the first row only.
+        # A missing file surfaces from open() itself rather than a separate exists() stat.
+        csv_loader = cast(GlyphdCSVLoader, GLYPHD_RESOURCE_CONTEXT.loader_for(path.name))
+        try:
+            models = cast(List[GPUModelDTO], csv_loader.load_trusted(GPUModelDTO, path.name))
+        except FileNotFoundError:
+            logger.error(f"GPU model metadata file not found: {path}")
+            raise
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=False)
 
     # Enrich with specs
     try:
-        loader = GlyphSieveYamlLoader()
-        gpu_registry = loader.load(GPURegistry, "gpu_specs.yaml")
-        specs_by_model = {
-            gpu.canonical_model: {
-                "vram_gb": gpu.vram_gb,
-                "tdp_watts": gpu.tdp_watts,
-                "mig_support": gpu.mig_support,
-                "nvlink": gpu.nvlink,
-                "generation": gpu.generation,
-                "cuda_cores": gpu.cuda_cores,
-                "slot_width": gpu.slot_width,
-                "pcie_generation": gpu.pcie_generation,
-            }
-            for gpu in gpu_registry.gpus
-            if gpu.canonical_model
-        }
+        specs_lookup = specs_future.result() if specs_future is not None else _specs_lookup()
+        enriched_count = 0
         for model in models:
-            enriched = specs_by_model.get(model.model.replace(" ", "_").upper())
+            enriched = specs_lookup.get(model.model.translate(_CANON).upper())
             if enriched:
-                for key, value in enriched.items():
-                    setattr(model, key, value)
-        logger.info(f"Enriched {len(specs_by_model)} models with specs")
+                # GPUModelDTO has no assignment validators or computed fields, so write all
+                # spec fields in one dict update instead of one __setattr__ per field
+                model.__dict__.update(enriched)
+                model.__pydantic_fields_set__.update(enriched)
+                enriched_count += 1
+        logger.info(f"Enriched {enriched_count} models with specs")
     except Exception as e:
         logger.warning(f"Error loading GPU specs: {e}. Will continue with market data only.")
 
@@ -2,7 +2,7 @@ import logging
 from typing import cast
 
 from glyphd.api.models import ReportDTO
-from glyphd.core.resources.resource_context import GlyphdResourceContext
+from glyphd.core.resources.resource_context import GLYPHD_RESOURCE_CONTEXT
 
 logger = logging.getLogger(__name__)
 
@@ -18,8 +18,7 @@ def load_insight_report() -> ReportDTO:
         Exception: if the file cannot be found or loaded
     """
     try:
-        context = GlyphdResourceContext()
-        return cast(ReportDTO, context.load(ReportDTO, "insight.yaml"))
+        return cast(ReportDTO, GLYPHD_RESOURCE_CONTEXT.load(ReportDTO, "insight.yaml"))
     except Exception as e:
         logger.error(f"Error loading insight report: {e}")
         raise
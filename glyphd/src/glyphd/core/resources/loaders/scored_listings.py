@@ -1,16 +1,102 @@
 import logging
+import sys
+from importlib.resources import files
 from pathlib import Path
 from typing import List, cast
 
 from glyphd.api.models import GPUListingDTO
-from glyphd.core.resources.resource_context import GlyphdResourceContext
+from glyphd.core.resources.csv_loader import GlyphdCSVLoader
+from glyphd.core.resources.resource_context import GLYPHD_RESOURCE_CONTEXT
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:  # pyarrow is optional; fall back to the csv module
+    pa = None
+    pa_csv = None
 
 logger = logging.getLogger(__name__)
 
 
+def load_scored_listings_arrow(path: Path) -> "pa.Table":
+    """
+    Parse a scored CSV into a typed Arrow table without building any DTOs.
+
+    Arrow parses and type-casts the whole file in C, so no per-field Python
+    conversion runs. Used directly by endpoints that forward listings as Arrow IPC.
+
+    Args:
+        path: Path to the scored CSV file; only its name is resolved against the resources package
+
+    Returns:
+        Arrow table with one column per scored CSV column
+
+    Raises:
+        ImportError: If pyarrow is not installed
+    """
+    if pa_csv is None:
+        raise ImportError("pyarrow is required to load scored listings as Arrow")
+
+    resource_name = path.name
+    convert_options = pa_csv.ConvertOptions(
+        column_types={
+            "canonical_model": pa.string(),
+            "vram_gb": pa.int32(),
+            "mig_support": pa.int8(),
+            "nvlink": pa.bool_(),
+            "tdp_watts": pa.int32(),
+            # float64 rather than float32 so scores round-trip exactly
+            "price": pa.float64(),
+            "score": pa.float64(),
+        },
+        true_values=["true", "True", "1"],
+        false_values=["false", "False", "0"],
+    )
+    # Large blocks parsed on pyarrow's worker threads, with the GIL released
+    read_options = pa_csv.ReadOptions(block_size=4 << 20, use_threads=True)
+    loader = cast(GlyphdCSVLoader, GLYPHD_RESOURCE_CONTEXT.loader_for(resource_name))
+    resource_path = files(loader.resource_uri).joinpath(resource_name)
+    if isinstance(resource_path, Path):
+        table = pa_csv.read_csv(str(resource_path), read_options=read_options, convert_options=convert_options)
+    else:
+        with resource_path.open("rb") as f:
+            table = pa_csv.read_csv(f, read_options=read_options, convert_options=convert_options)
+    return table
+
+
+def _load_scored_listings_arrow(path: Path) -> List[GPUListingDTO]:
+    """
+    Build DTOs from the columns of the Arrow table returned by ``load_scored_listings_arrow``.
+
+    Only the first row is validated; the rest use ``model_construct``.
+
+    Args:
+        path: Path to the scored CSV file
+
+    Returns:
+        List of GPUListingDTO objects
+    """
+    table = load_scored_listings_arrow(path)
+    names = [name for name in GPUListingDTO.model_fields if name in table.column_names]
+    columns = [table.column(name).to_pylist() for name in names]
+    if "canonical_model" in names:
+        index = names.index("canonical_model")
+        columns[index] = [sys.intern(value) if value is not None else None for value in columns[index]]
+
+    rows = [dict(zip(names, values)) for values in zip(*columns)]
+    if not rows:
+        return []
+    return [GPUListingDTO.model_validate(rows[0])] + [GPUListingDTO.model_construct(**row) for row in rows[1:]]
+
+
 def load_scored_listings(path: Path) -> List[GPUListingDTO]:
     """
-    Load scored GPU listings from a CSV file using GlyphdResourceContext.
+    Load scored GPU listings from a CSV file.
+
+    The scored CSV is produced by our own pipeline, so only the first row is fully
+    validated; the rest are built with ``model_construct``. Model names repeat across
+    rows and are interned, since the result is cached for the life of the process.
+    When pyarrow is installed the file is parsed column-wise with ``pyarrow.csv``.
 
     Args:
         path: Path to the scored.csv file
@@ -19,5 +105,8 @@ def load_scored_listings(path: Path) -> List[GPUListingDTO]:
         List of GPUListingDTO objects
     """
     logger.info(f"Loading GPU listings from {path}")
-    context = GlyphdResourceContext()
-    return cast(List[GPUListingDTO], context.load(GPUListingDTO, path.name))
+    if pa_csv is not None:
+        return _load_scored_listings_arrow(path)
+    loader = cast(GlyphdCSVLoader, GLYPHD_RESOURCE_CONTEXT.loader_for(path.name))
+    listings = loader.load_trusted(GPUListingDTO, path.name, intern_fields=("canonical_model",))
+    return cast(List[GPUListingDTO], listings)
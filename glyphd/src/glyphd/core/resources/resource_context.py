@@ -12,3 +12,7 @@ class GlyphdResourceContext(ResourceContext):
             ".yaml": GlyphdYamlLoader(),
             ".yml": GlyphdYamlLoader(),
         }
+
+
+# Shared context; loaders are created lazily on first use
+GLYPHD_RESOURCE_CONTEXT = GlyphdResourceContext()
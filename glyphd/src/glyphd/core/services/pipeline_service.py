@@ -5,14 +5,23 @@ Pipeline service for processing raw CSV data through glyphsieve normalization.
 import asyncio
 import csv
 import logging
+import os
 import tempfile
 from pathlib import Path
-from typing import List
+from typing import Dict, List
 
 from glyphd.api.models import GPUListingDTO
 
+try:
+    import pyarrow.csv as pa_csv
+except ImportError:  # pyarrow is optional; fall back to pandas
+    pa_csv = None
+
 logger = logging.getLogger(__name__)
 
+# Intermediate pipeline CSVs go to a RAM-backed tmpfs when one is available
+SCRATCH_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
 
 class PipelineService:
     """
@@ -96,20 +105,14 @@ class PipelineService:
         Returns:
             List of processed GPUListingDTO objects
         """
-        # Create temporary file for processing
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as temp_file:
-            temp_file.write(csv_data)
-            temp_path = Path(temp_file.name)
-        
-        try:
-            # Process the temporary file through glyphsieve pipeline
-            processed_listings = await self._run_glyphsieve_pipeline(temp_path, import_id)
-            return processed_listings
+        # Write the raw CSV and all pipeline stages into one scratch directory,
+        # removed as a whole once processing finishes
+        with tempfile.TemporaryDirectory(prefix=f"glyphd_{import_id}_", dir=SCRATCH_DIR) as work_dir:
+            temp_path = Path(work_dir) / "raw.csv"
+            temp_path.write_text(csv_data)
             
-        finally:
-            # Clean up temporary file
-            if temp_path.exists():
-                temp_path.unlink()
+            # Process the temporary file through glyphsieve pipeline
+            return await self._run_glyphsieve_pipeline(temp_path, import_id)
     
     async def _run_glyphsieve_pipeline(self, csv_path: Path, import_id: str) -> List[GPUListingDTO]:
         """
@@ -128,17 +131,12 @@ class PipelineService:
             from glyphsieve.core.normalization import normalize_csv
             from glyphsieve.core.scoring import score_csv
             
-            # Create temporary files for pipeline stages
-            with tempfile.NamedTemporaryFile(mode='w', suffix='_normalized.csv', delete=False) as norm_file:
-                normalized_path = Path(norm_file.name)
-            
-            with tempfile.NamedTemporaryFile(mode='w', suffix='_enriched.csv', delete=False) as enrich_file:
-                enriched_path = Path(enrich_file.name)
-            
-            with tempfile.NamedTemporaryFile(mode='w', suffix='_scored.csv', delete=False) as score_file:
-                scored_path = Path(score_file.name)
-            
-            try:
+            # Pipeline stage outputs share a scratch directory that is removed as a whole
+            with tempfile.TemporaryDirectory(prefix=f"glyphd_{import_id}_stages_", dir=SCRATCH_DIR) as stage_dir:
+                normalized_path = Path(stage_dir) / "normalized.csv"
+                enriched_path = Path(stage_dir) / "enriched.csv"
+                scored_path = Path(stage_dir) / "scored.csv"
+                
                 # Step 1: Run normalization: raw CSV -> normalized CSV
                 logger.info(f"Step 1: Normalizing CSV file: {csv_path}")
                 await asyncio.to_thread(
@@ -149,11 +147,7 @@ class PipelineService:
                     use_ml=False
                 )
                 
-                # Debug: Check normalized CSV columns
-                import pandas as pd
-                norm_df = pd.read_csv(normalized_path)
-                logger.info(f"Normalized CSV columns: {list(norm_df.columns)}")
-                logger.info(f"Normalized CSV shape: {norm_df.shape}")
+                self._log_csv_header("Normalized", normalized_path)
                 
                 # Step 2: Run enrichment: normalized CSV -> enriched CSV
                 logger.info(f"Step 2: Enriching normalized CSV file: {normalized_path}")
@@ -163,10 +157,7 @@ class PipelineService:
                     str(enriched_path)
                 )
                 
-                # Debug: Check enriched CSV columns
-                enrich_df = pd.read_csv(enriched_path)
-                logger.info(f"Enriched CSV columns: {list(enrich_df.columns)}")
-                logger.info(f"Enriched CSV shape: {enrich_df.shape}")
+                self._log_csv_header("Enriched", enriched_path)
                 
                 # Step 3: Run scoring: enriched CSV -> scored CSV
                 logger.info(f"Step 3: Scoring enriched CSV file: {enriched_path}")
@@ -176,28 +167,31 @@ class PipelineService:
                     str(scored_path)
                 )
                 
-                # Debug: Check scored CSV columns
-                scored_df = pd.read_csv(scored_path)
-                logger.info(f"Scored CSV columns: {list(scored_df.columns)}")
-                logger.info(f"Scored CSV shape: {scored_df.shape}")
+                self._log_csv_header("Scored", scored_path)
                 
                 # Parse and merge enriched + scored data to create GPUListingDTO objects
                 gpu_listings = self._merge_enriched_and_scored_data(enriched_path, scored_path, import_id)
                 
                 logger.info(f"Successfully processed {len(gpu_listings)} listings")
                 return gpu_listings
-                
-            finally:
-                # Clean up temporary files
-                for temp_path in [normalized_path, enriched_path, scored_path]:
-                    if temp_path.exists():
-                        temp_path.unlink()
             
         except ImportError as e:
             raise RuntimeError(f"Failed to import glyphsieve modules: {e}") from e
         except Exception as e:
             raise RuntimeError(f"Pipeline processing failed: {e}") from e
     
+    def _log_csv_header(self, stage: str, csv_path: Path) -> None:
+        """
+        Log the columns of an intermediate pipeline CSV by reading only its header row.
+        
+        Args:
+            stage: Pipeline stage name used in the log message
+            csv_path: Path to the CSV file
+        """
+        with open(csv_path, 'r', newline='', encoding='utf-8') as csvfile:
+            header = next(csv.reader(csvfile), [])
+        logger.info(f"{stage} CSV columns: {header}")
+    
     def _parse_raw_csv(self, csv_path: Path) -> List[dict]:
         """
         Parse raw CSV file into list of dictionaries.
@@ -239,10 +233,38 @@ class PipelineService:
             raise ValueError(f"Error parsing CSV file: {e}")
     
     
+    def _read_csv_columns(self, csv_path: Path) -> Dict[str, list]:
+        """
+        Read a CSV file into a mapping of column name to list of values.
+
+        Uses pyarrow's multithreaded C parser when available and falls back to pandas.
+        Missing values are returned as None in both cases.
+
+        Args:
+            csv_path: Path to the CSV file
+
+        Returns:
+            Dictionary of column name to column values
+        """
+        if pa_csv is not None:
+            convert_options = pa_csv.ConvertOptions(strings_can_be_null=True)
+            table = pa_csv.read_csv(csv_path, convert_options=convert_options)
+            logger.debug(f"Read {table.num_rows} rows from {csv_path.name}: {table.schema.names}")
+            return {name: table.column(name).to_pylist() for name in table.column_names}
+
+        import pandas as pd
+
+        df = pd.read_csv(csv_path)
+        df = df.astype(object).where(df.notna(), None)
+        return {name: df[name].tolist() for name in df.columns}
+
     def _merge_enriched_and_scored_data(self, enriched_path: Path, scored_path: Path, import_id: str) -> List[GPUListingDTO]:
         """
         Merge enriched CSV data with scored CSV data to create GPUListingDTO objects.
         
+        Both files are read column-wise and walked in lockstep, so no per-row
+        indexing into a DataFrame takes place.
+        
         Args:
             enriched_path: Path to the enriched CSV file
             scored_path: Path to the scored CSV file
@@ -255,34 +277,51 @@ class PipelineService:
             ValueError: If CSV files are malformed or missing required fields
         """
         try:
-            import pandas as pd
-            
             # Load both CSV files
-            enriched_df = pd.read_csv(enriched_path)
-            scored_df = pd.read_csv(scored_path)
+            enriched = self._read_csv_columns(enriched_path)
+            scored = self._read_csv_columns(scored_path)
             
-            if len(enriched_df) != len(scored_df):
-                raise ValueError(f"Row count mismatch: enriched={len(enriched_df)}, scored={len(scored_df)}")
+            enriched_count = len(enriched['canonical_model'])
+            scored_count = len(scored['final_score'])
+            if enriched_count != scored_count:
+                raise ValueError(f"Row count mismatch: enriched={enriched_count}, scored={scored_count}")
             
             gpu_listings = []
             
-            for index in range(len(enriched_df)):
-                enriched_row = enriched_df.iloc[index]
-                scored_row = scored_df.iloc[index]
-                
+            columns = zip(
+                enriched['canonical_model'],
+                enriched['vram_gb'],
+                enriched['mig_capable'],
+                enriched['nvlink'],
+                enriched['tdp_w'],
+                enriched['price'],
+                scored['final_score'],
+            )
+            for index, (canonical_model, vram_gb, mig_capable, nvlink, tdp_w, price, final_score) in enumerate(columns):
                 try:
                     # Map enriched field names to GPUListingDTO field names
-                    gpu_listing = GPUListingDTO(
-                        canonical_model=enriched_row['canonical_model'],
-                        vram_gb=int(float(enriched_row['vram_gb'])) if pd.notna(enriched_row['vram_gb']) else 0,
-                        mig_support=int(float(enriched_row['mig_capable'])) if pd.notna(enriched_row['mig_capable']) else 0,
-                        nvlink=self._parse_boolean(enriched_row['nvlink']) if pd.notna(enriched_row['nvlink']) else False,
-                        tdp_watts=int(float(enriched_row['tdp_w'])) if pd.notna(enriched_row['tdp_w']) else 0,
-                        price=float(enriched_row['price']),
-                        score=float(scored_row['final_score']) if pd.notna(scored_row['final_score']) else 0.0,
-                        import_id=import_id,
-                        import_index=index,
-                    )
+                    if not isinstance(canonical_model, str):
+                        raise ValueError(f"missing canonical_model: {canonical_model!r}")
+                    if price is None:
+                        raise ValueError("missing price")
+                    fields = {
+                        'canonical_model': canonical_model,
+                        'vram_gb': int(float(vram_gb)) if vram_gb is not None else 0,
+                        'mig_support': int(float(mig_capable)) if mig_capable is not None else 0,
+                        'nvlink': self._parse_boolean(nvlink) if nvlink is not None else False,
+                        'tdp_watts': int(float(tdp_w)) if tdp_w is not None else 0,
+                        'price': float(price),
+                        'score': float(final_score) if final_score is not None else 0.0,
+                        'import_id': import_id,
+                        'import_index': index,
+                    }
+                    # Every field is explicitly cast above, so only the first row needs full
+                    # validation as a schema smoke test. Never model_construct raw upload rows
+                    # from process_raw_csv: construct skips validation and trusts its input.
+                    if gpu_listings:
+                        gpu_listing = GPUListingDTO.model_construct(**fields)
+                    else:
+                        gpu_listing = GPUListingDTO.model_validate(fields)
                     gpu_listings.append(gpu_listing)
                     
                 except (ValueError, KeyError) as e:
@@ -6,7 +6,7 @@ This module defines the interfaces for storage backends used by glyphd.
 
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from glyphd.api.models import GPUListingDTO, ImportMetadata
 
@@ -36,6 +36,7 @@ class ListingStore(ABC):
     @abstractmethod
     def query_listings(
         self,
+        *,
         model: Optional[str] = None,
         min_price: Optional[float] = None,
         max_price: Optional[float] = None,
@@ -66,9 +67,50 @@ class ListingStore(ABC):
         pass
 
     @abstractmethod
-    def list_imports(self) -> List[ImportMetadata]:
+    def query_listings_page(
+        self,
+        after_id: int = 0,
+        limit: int = 100,
+        *,
+        model: Optional[str] = None,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+        min_score: Optional[float] = None,
+        max_score: Optional[float] = None,
+        region: Optional[str] = None,
+        after: Optional[datetime] = None,
+        import_id: Optional[str] = None,
+    ) -> Tuple[List[GPUListingDTO], Optional[int]]:
+        """
+        Query one page of listings in insertion order, resuming after a cursor.
+
+        Unlike offset pagination, each page costs the same however deep it is.
+
+        Args:
+            after_id: Cursor returned with the previous page (0 for the first page)
+            limit: Maximum number of results to return
+            model: Filter by canonical model name (supports fuzzy matching)
+            min_price: Filter by minimum price
+            max_price: Filter by maximum price
+            min_score: Filter by minimum score
+            max_score: Filter by maximum score
+            region: Filter by region
+            after: Filter by listings seen after this timestamp
+            import_id: Filter by import batch ID
+
+        Returns:
+            Tuple of (listings, next_cursor); next_cursor is None on the last page
         """
-        List all import batches in the store.
+        pass
+
+    @abstractmethod
+    def list_imports(self, limit: Optional[int] = None, offset: Optional[int] = None) -> List[ImportMetadata]:
+        """
+        List import batches in the store, newest first.
+
+        Args:
+            limit: Maximum number of results to return
+            offset: Number of results to skip for pagination
 
         Returns:
             A list of import batch metadata
@@ -4,34 +4,257 @@ SQLite storage backend for GPU listings.
 This module implements a SQLite storage backend for GPU listings using SQLAlchemy Core.
 """
 
+import json
 import logging
 import os
-from datetime import datetime
-from typing import List, Optional
-
-from rich.logging import RichHandler
-from sqlalchemy import create_engine, text
+import threading
+from datetime import UTC, datetime
+from functools import lru_cache
+from operator import attrgetter
+from typing import Dict, List, Optional, Set, Tuple
+
+from rapidfuzz import fuzz, process
+from sqlalchemy import TextClause, create_engine, text
 from sqlalchemy.engine import Engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.pool import QueuePool, StaticPool
 
 from glyphd.api.models import GPUListingDTO, ImportMetadata
-from glyphd.core.forecast import compute_delta, create_snapshot_from_listing
+from glyphd.core.forecast import compute_deltas_for_import, snapshot_row
 from glyphd.core.storage.interface import ListingStore
-from glyphd.sqlite.models import ListingDelta, ListingSnapshot
-from glyphsieve.core.normalization import fuzzy_match
-
-# Configure logging
-try:
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(message)s",
-        datefmt="[%X]",
-        handlers=[RichHandler(rich_tracebacks=True)],
+from glyphd.sqlite.bulk import bulk_insert_listings, insert_rows, lookup_ids
+from glyphd.sqlite.market_stats import refresh_model_market_stats
+from glyphd.sqlite.models import Condition, ListingSnapshot, Region
+from glyphd.sqlite.pragmas import install_pragmas, optimize
+
+logger = logging.getLogger(__name__)
+
+# Persistent connections kept per engine: one writer plus readers, so requests reuse open
+# file handles instead of reopening the database and its WAL files
+SQLITE_POOL_SIZE = 5
+
+# One write lock per database file, shared by every store opened on that file. SQLite allows a
+# single writer at a time; serializing in-process writers avoids busy-timeout waits and retries.
+_WRITE_LOCKS: Dict[str, threading.Lock] = {}
+_WRITE_LOCKS_GUARD = threading.Lock()
+
+
+def _now() -> datetime:
+    """
+    Get the current time in UTC.
+
+    Snapshot timestamps come from here, so tests can patch it to control them.
+
+    Returns:
+        The current time, timezone-aware
+    """
+    return datetime.now(UTC)
+
+
+def _write_lock_for(db_path: str) -> threading.Lock:
+    """
+    Get the process-wide write lock for a database file.
+
+    Args:
+        db_path: Path to the SQLite database file, or ":memory:"
+
+    Returns:
+        The lock serializing writes to that database
+    """
+    if db_path == ":memory:":
+        # Every in-memory store is its own database
+        return threading.Lock()
+    key = os.path.realpath(db_path)
+    with _WRITE_LOCKS_GUARD:
+        return _WRITE_LOCKS.setdefault(key, threading.Lock())
+
+
+# Database files whose schema has already been checked or created in this process, keyed by
+# (realpath, device, inode) so a file deleted and recreated at the same path is checked again
+_SCHEMA_READY: Set[Tuple[str, int, int]] = set()
+
+
+def _schema_key(db_path: str) -> Optional[Tuple[str, int, int]]:
+    """
+    Identify a database file for the schema-ready cache.
+
+    Args:
+        db_path: Path to the SQLite database file, or ":memory:"
+
+    Returns:
+        The file's (realpath, device, inode), or None for in-memory or not-yet-created databases
+    """
+    if db_path == ":memory:":
+        return None
+    try:
+        stat = os.stat(db_path)
+    except OSError:
+        return None
+    return os.path.realpath(db_path), stat.st_dev, stat.st_ino
+
+
+# GPUListingDTO values written to scored_listings, fetched together per listing
+_LISTING_VALUES = attrgetter("canonical_model", "price", "vram_gb", "tdp_watts", "mig_support", "nvlink", "score")
+
+# GPUListingDTO fields in the column order selected by query_listings; the row id follows them
+_DTO_FIELDS = (
+    "canonical_model",
+    "price",
+    "vram_gb",
+    "tdp_watts",
+    "mig_support",
+    "nvlink",
+    "score",
+    "import_id",
+    "import_index",
+)
+
+# Number of trigram full-text candidates passed on to fuzzy matching
+FTS_CANDIDATE_LIMIT = 5
+
+# Minimum RapidFuzz score (0-100) for a model filter to match a listed model
+FUZZY_MATCH_THRESHOLD = 70.0
+
+# Model that glyphsieve's fuzzy matching prefers for A2000 queries over A2-like names
+_A2000_MODEL = "RTX_A2000_12GB"
+
+# Fixed statements, built once per process instead of a text() construct per call
+_SQL_SCHEMA_EXISTS = text("SELECT name FROM sqlite_master WHERE type='table' AND name='schema_version'")
+_SQL_UPSERT_IMPORT_BATCH = text(
+    """
+    INSERT INTO import_batches (import_id, source, record_count, description)
+    VALUES (:import_id, :source, :record_count, :description)
+    ON CONFLICT(import_id) DO UPDATE SET record_count = excluded.record_count
+    """
+)
+_SQL_INSERT_MODELS = "INSERT INTO models (model, vram_gb, tdp_watts, mig_support, nvlink, import_id, import_index)"
+# Later batches refresh a known model's specs in the same statement; rows whose specs are
+# unchanged are left alone so updated_at only moves when something did. The pipeline writes
+# 0 for specs it could not resolve, so a listing with vram_gb = 0 never overwrites known
+# specs, and an unknown tdp_watts keeps the stored one
+_SQL_UPSERT_MODELS_SUFFIX = """
+    ON CONFLICT(model) DO UPDATE SET
+        vram_gb = excluded.vram_gb,
+        tdp_watts = CASE WHEN excluded.tdp_watts > 0 THEN excluded.tdp_watts ELSE models.tdp_watts END,
+        mig_support = excluded.mig_support,
+        nvlink = excluded.nvlink,
+        updated_at = CURRENT_TIMESTAMP
+    WHERE excluded.vram_gb > 0
+      AND (vram_gb IS NOT excluded.vram_gb
+           OR (excluded.tdp_watts > 0 AND tdp_watts IS NOT excluded.tdp_watts)
+           OR mig_support IS NOT excluded.mig_support
+           OR nvlink IS NOT excluded.nvlink)
+"""
+_SQL_DELETE_IMPORT_LISTINGS = text(
+    "DELETE FROM scored_listings WHERE import_id = :import_id RETURNING canonical_model"
+)
+_SQL_MAX_LISTING_ROWID = text("SELECT COALESCE(MAX(rowid), 0) FROM scored_listings")
+_SQL_DISTINCT_MODELS = text("SELECT DISTINCT canonical_model FROM scored_listings")
+_SQL_FTS_CANDIDATES = text(
+    """
+    SELECT model FROM models_fts
+    WHERE models_fts MATCH :query
+      AND EXISTS (SELECT 1 FROM scored_listings WHERE canonical_model = models_fts.model)
+    ORDER BY rank
+    LIMIT :limit
+    """
+)
+_SQL_LIST_IMPORTS = text(
+    """
+    SELECT import_id, imported_at, source, record_count, description
+    FROM import_batches
+    ORDER BY imported_at DESC
+    LIMIT :limit OFFSET :offset
+    """
+)
+
+
+# query_listings filter clauses in SQL order, one per optional parameter. The model set is bound
+# as one JSON array so the SQL text is the same for any number of models.
+_LISTING_FILTERS = (
+    ("models_json", " AND canonical_model IN (SELECT value FROM json_each(:models_json))"),
+    ("min_price", " AND price >= :min_price"),
+    ("max_price", " AND price <= :max_price"),
+    ("min_score", " AND score >= :min_score"),
+    ("max_score", " AND score <= :max_score"),
+    ("region", " AND region_id = (SELECT id FROM regions WHERE name = :region)"),
+    ("after", " AND seen_at >= :after"),
+    ("import_id", " AND import_id = :import_id"),
+    # Keyset pagination: resume after the last id of the previous page, in id order
+    ("after_id", " AND id > :after_id ORDER BY id"),
+    ("limit", " LIMIT :limit"),
+    ("offset", " OFFSET :offset"),
+)
+
+
+@lru_cache(maxsize=64)
+def _listing_sql(filter_sig: Tuple[bool, ...]) -> str:
+    """
+    Build the query_listings SQL for one combination of set filters.
+
+    Args:
+        filter_sig: One flag per _LISTING_FILTERS entry, True where that filter is set
+
+    Returns:
+        The SQL string, identical for every call with the same signature
+    """
+    query = (
+        "SELECT canonical_model, price, vram_gb, tdp_watts, mig_support, nvlink, score, import_id, import_index, id"
+        " FROM scored_listings WHERE 1=1"
     )
-    logger = logging.getLogger("sqlite_store")
-except ImportError:
-    # Fall back to standard logging if rich is not available
-    logging.basicConfig(level=logging.INFO)
-    logger = logging.getLogger("sqlite_store")
+    return query + "".join(clause for (_, clause), is_set in zip(_LISTING_FILTERS, filter_sig) if is_set)
+
+
+@lru_cache(maxsize=128)
+def _listing_query(query: str) -> TextClause:
+    """
+    Get the text() construct for a query_listings SQL string.
+
+    The SQL only depends on which filters are set, so each filter combination is
+    constructed once and reused.
+
+    Args:
+        query: SQL built by _build_query_with_filters
+
+    Returns:
+        The cached TextClause
+    """
+    return text(query)
+
+
+def _best_fuzzy_match(model: str, choices: List[str]) -> Optional[str]:
+    """
+    Find the choice most similar to a model name, scoring the whole list inside RapidFuzz.
+
+    Matches glyphsieve's ``fuzzy_match``: A2000 queries prefer RTX_A2000_12GB over A2-like
+    names, and otherwise each choice scores the higher of ``token_set_ratio`` and
+    ``partial_ratio`` on lowercased strings, with the first of equally scored choices winning.
+
+    Args:
+        model: Model name to match
+        choices: Candidate model names
+
+    Returns:
+        The best matching choice, or None if none scores at least FUZZY_MATCH_THRESHOLD
+    """
+    query = model.lower().strip()
+    if (
+        ("a2000" in query or "a 2000" in query)
+        and _A2000_MODEL in choices
+        and fuzz.token_set_ratio(_A2000_MODEL.lower(), query) >= FUZZY_MATCH_THRESHOLD
+    ):
+        return _A2000_MODEL
+
+    scores = [0.0] * len(choices)
+    for scorer in (fuzz.token_set_ratio, fuzz.partial_ratio):
+        for _, score, index in process.extract(query, choices, scorer=scorer, processor=str.lower, limit=None):
+            if score > scores[index]:
+                scores[index] = score
+    if not scores:
+        return None
+    # max() keeps the first of equal scores, like glyphsieve's strict ">" scan
+    best = max(range(len(scores)), key=scores.__getitem__)
+    return choices[best] if scores[best] >= FUZZY_MATCH_THRESHOLD else None
 
 
 class SqliteListingStore(ListingStore):
@@ -51,6 +274,9 @@ class SqliteListingStore(ListingStore):
         """
         self.db_path = db_path
         self.engine = self._create_engine()
+        self._write_lock = _write_lock_for(db_path)
+        # (max scored_listings rowid, distinct model names) of the last catalog scan
+        self._models_cache: Tuple[int, List[str]] = (-1, [])
         self._ensure_schema()
 
     def _create_engine(self) -> Engine:
@@ -65,26 +291,55 @@ class SqliteListingStore(ListingStore):
         if db_dir and not os.path.exists(db_dir):
             os.makedirs(db_dir)
 
-        # Create the engine
-        engine = create_engine(f"sqlite:///{self.db_path}")
+        # Create the engine with a persistent pool: one writer (serialized by the write lock)
+        # plus readers. In-memory databases only exist per connection, so they share a single one.
+        connect_args = {"check_same_thread": False, "timeout": 30}
+        if self.db_path == ":memory:":
+            engine = create_engine("sqlite://", poolclass=StaticPool, connect_args=connect_args)
+        else:
+            engine = create_engine(
+                f"sqlite:///{self.db_path}",
+                poolclass=QueuePool,
+                pool_size=SQLITE_POOL_SIZE,
+                max_overflow=0,
+                connect_args=connect_args,
+            )
+        install_pragmas(engine)
         logger.info(f"Connected to SQLite database at {self.db_path}")
         return engine
 
+    def close(self) -> None:
+        """
+        Close all pooled connections held by the engine.
+
+        Each connection runs ``PRAGMA optimize`` as it closes. Once the last connection
+        is closed SQLite checkpoints the WAL and removes the -wal/-shm sidecar files.
+        """
+        self.engine.dispose()
+
     def _ensure_schema(self) -> None:
         """
         Ensure that the database schema exists.
 
-        If the database is empty, this method will create the schema.
+        If the database is empty, this method will create the schema. The check runs once per
+        database file per process; later stores on the same file skip the connection and query.
         """
+        if _schema_key(self.db_path) in _SCHEMA_READY:
+            return
+
         # Check if the schema_version table exists
         with self.engine.connect() as conn:
-            result = conn.execute(text("SELECT name FROM sqlite_master WHERE type='table' AND name='schema_version'"))
+            result = conn.execute(_SQL_SCHEMA_EXISTS)
             if result.fetchone() is None:
                 logger.info("Schema not found, initializing database...")
                 self._initialize_schema()
             else:
                 logger.info("Schema already exists")
 
+        key = _schema_key(self.db_path)
+        if key is not None:
+            _SCHEMA_READY.add(key)
+
     def _initialize_schema(self) -> None:
         """
         Initialize the database schema.
@@ -92,18 +347,14 @@ class SqliteListingStore(ListingStore):
         This method reads the schema.sql file and executes it to create the database schema.
         """
         # Read the schema.sql file using ResourceContext
-        from glyphd.core.resources.resource_context import GlyphdResourceContext
+        from glyphd.core.resources.resource_context import GLYPHD_RESOURCE_CONTEXT
 
-        resource_context = GlyphdResourceContext()
-        schema_sql = resource_context.load_text("sql/schema.sql")
+        schema_sql = GLYPHD_RESOURCE_CONTEXT.load_text("sql/schema.sql")
 
         # Execute the schema SQL directly using SQLite's executescript
         # This bypasses SQLAlchemy's statement preparation and allows SQLite to handle
         # the script natively, including triggers with BEGIN...END blocks
         with self.engine.connect() as conn:
-            # Enable foreign keys
-            conn.execute(text("PRAGMA foreign_keys = ON"))
-
             # Use raw connection to execute the script
             raw_conn = conn.connection
             raw_conn.executescript(schema_sql)
@@ -128,129 +379,105 @@ class SqliteListingStore(ListingStore):
             logger.warning("No listings to insert")
             return 0
 
-        # Create or update the import batch and insert the listings
-        with self.engine.connect() as conn:
-            # Check if the import batch already exists
-            result = conn.execute(
-                text("SELECT import_id FROM import_batches WHERE import_id = :import_id"),
-                {"import_id": import_id},
+        # Create or update the import batch and insert the listings, snapshots and deltas
+        # in one transaction: a single commit (and WAL sync) per batch, rolled back on error
+        with self._write_lock, self.engine.begin() as conn:
+            # Create the import batch, or update its record count if it already exists
+            conn.execute(
+                _SQL_UPSERT_IMPORT_BATCH,
+                {
+                    "import_id": import_id,
+                    "source": "api",
+                    "record_count": len(listings),
+                    "description": f"Import batch {import_id}",
+                },
             )
-            if result.fetchone() is None:
-                # Create the import batch
-                conn.execute(
-                    text(
-                        """
-                        INSERT INTO import_batches (import_id, source, record_count, description)
-                        VALUES (:import_id, :source, :record_count, :description)
-                        """
-                    ),
-                    {
-                        "import_id": import_id,
-                        "source": "api",
-                        "record_count": len(listings),
-                        "description": f"Import batch {import_id}",
-                    },
-                )
-                logger.info(f"Created import batch {import_id}")
-            else:
-                # Update the import batch
-                conn.execute(
-                    text(
-                        """
-                        UPDATE import_batches
-                        SET record_count = :record_count
-                        WHERE import_id = :import_id
-                        """
-                    ),
-                    {"import_id": import_id, "record_count": len(listings)},
-                )
-                logger.info(f"Updated import batch {import_id}")
 
-                # Delete existing listings with the same import ID to ensure idempotent inserts
-                conn.execute(
-                    text("DELETE FROM scored_listings WHERE import_id = :import_id"),
-                    {"import_id": import_id},
-                )
-                logger.info(f"Deleted existing listings with import ID {import_id}")
-
-            # Insert the listings with sequential import_index
-            for import_index, listing in enumerate(listings, start=1):
-                # Ensure the model exists
-                conn.execute(
-                    text(
-                        """
-                        INSERT OR IGNORE INTO models (
-                            model, vram_gb, tdp_watts, mig_support, nvlink, import_id, import_index
-                        )
-                        VALUES (:model, :vram_gb, :tdp_watts, :mig_support, :nvlink, :import_id, :import_index)
-                        """
-                    ),
-                    {
-                        "model": listing.canonical_model,
-                        "vram_gb": listing.vram_gb,
-                        "tdp_watts": listing.tdp_watts,
-                        "mig_support": listing.mig_support,
-                        "nvlink": 1 if listing.nvlink else 0,
-                        "import_id": import_id,
-                        "import_index": import_index,
-                    },
+            # Delete existing listings with the same import ID to ensure idempotent inserts;
+            # a no-op for a new batch. The replaced rows' models need their market stats refreshed.
+            replaced_models = conn.execute(_SQL_DELETE_IMPORT_LISTINGS, {"import_id": import_id}).scalars().all()
+            if replaced_models:
+                logger.debug("Deleted %d existing listings with import ID %s", len(replaced_models), import_id)
+
+            # Resolve region and condition names to lookup ids, creating new entries once per
+            # batch; listings without them (plain GPUListingDTOs) resolve to NULL
+            regions = [getattr(listing, "region", None) for listing in listings]
+            conditions = [getattr(listing, "condition", None) for listing in listings]
+            region_ids = lookup_ids(conn, Region, regions)
+            condition_ids = lookup_ids(conn, Condition, conditions)
+
+            # Insert the listings with sequential import_index, many rows per statement.
+            # Attributes are fetched in one attrgetter call per listing and nvlink is
+            # normalized once.
+            listing_rows = [
+                (
+                    model,
+                    price,
+                    vram_gb,
+                    tdp_watts,
+                    mig_support,
+                    1 if nvlink else 0,
+                    score,
+                    import_id,
+                    import_index,
+                    region_ids.get(region),
+                    condition_ids.get(condition),
                 )
+                for import_index, ((model, price, vram_gb, tdp_watts, mig_support, nvlink, score), region, condition)
+                in enumerate(zip(map(_LISTING_VALUES, listings), regions, conditions), start=1)
+            ]
+
+            # One models row per distinct model, sliced from its first listing
+            distinct_models = {}
+            for row in listing_rows:
+                if row[0] not in distinct_models:
+                    distinct_models[row[0]] = (row[0], row[2], row[3], row[4], row[5], import_id, row[8])
+            model_rows = list(distinct_models.values())
+
+            # Create new models and refresh the specs of known ones, one upsert per chunk
+            insert_rows(conn, _SQL_INSERT_MODELS, model_rows, suffix=_SQL_UPSERT_MODELS_SUFFIX)
+            insert_rows(
+                conn,
+                "INSERT INTO scored_listings "
+                "(canonical_model, price, vram_gb, tdp_watts, mig_support, nvlink, score, import_id, import_index, "
+                "region_id, condition_id)",
+                listing_rows,
+            )
 
-                # Insert the scored listing
-                conn.execute(
-                    text(
-                        """
-                        INSERT INTO scored_listings (
-                            canonical_model, price, vram_gb, tdp_watts, mig_support, nvlink, score,
-                            import_id, import_index
-                        )
-                        VALUES (
-                            :model, :price, :vram_gb, :tdp_watts, :mig_support, :nvlink, :score,
-                            :import_id, :import_index
-                        )
-                        """
-                    ),
-                    {
-                        "model": listing.canonical_model,
-                        "price": listing.price,
-                        "vram_gb": listing.vram_gb,
-                        "tdp_watts": listing.tdp_watts,
-                        "mig_support": listing.mig_support,
-                        "nvlink": 1 if listing.nvlink else 0,
-                        "score": listing.score,
-                        "import_id": import_id,
-                        "import_index": import_index,
-                    },
-                )
+            # Create snapshots (and deltas) for forecasting
+            self._create_listing_snapshots(conn, listings, import_id)
 
-                # Create snapshot for forecasting
-                self._create_listing_snapshot(conn, listing, import_id)
+            # Rebuild the market aggregates of the touched models in the same transaction
+            refresh_model_market_stats(conn, [*distinct_models, *replaced_models])
 
-            # Commit the transaction
-            conn.commit()
-            logger.info(f"Inserted {len(listings)} listings with import ID {import_id}")
+            # Refresh planner statistics for the tables the batch grew, committed with it
+            optimize(conn)
+
+            self._models_cache = (-1, [])
+            logger.debug("Inserted %d listings with import ID %s", len(listings), import_id)
             return len(listings)
 
-    def _create_listing_snapshot(self, conn, listing: GPUListingDTO, import_id: str) -> None:
+    def _create_listing_snapshots(self, conn, listings: List[GPUListingDTO], import_id: str) -> None:
         """
-        Create a listing snapshot and compute delta if previous snapshot exists.
-        
+        Create listing snapshots and compute deltas against previous snapshots.
+
+        Snapshots are written as plain rows with multi-row inserts, without ORM objects, and
+        the deltas are computed and written by a single INSERT ... SELECT without loading
+        earlier snapshots. Nothing is committed here; the rows become durable with the
+        caller's transaction.
+
         Args:
             conn: Database connection
-            listing: GPU listing data
+            listings: GPU listings of the import batch
             import_id: Import batch ID
         """
-        from sqlalchemy.orm import sessionmaker
-        
-        # Create session from connection
-        Session = sessionmaker(bind=conn)
-        session = Session()
-        
-        try:
-            # Create snapshot data
+        # Stamp the whole batch with a single timestamp
+        now = _now()
+
+        rows = []
+        for listing in listings:
             snapshot_data = {
                 'canonical_model': listing.canonical_model,
-                'model': listing.canonical_model,
                 'price': listing.price,
                 'score': listing.score,
                 'seller': getattr(listing, 'seller', None),
@@ -259,80 +486,102 @@ class SqliteListingStore(ListingStore):
                 'quantization_capacity': getattr(listing, 'quantization_capacity', None),
                 'heuristics': getattr(listing, 'heuristics', None),
             }
-            
-            # Create new snapshot
-            current_snapshot = create_snapshot_from_listing(snapshot_data)
-            session.add(current_snapshot)
-            session.flush()  # Get the ID
-            
-            # Look up most recent previous snapshot for the same source_url
-            if current_snapshot.source_url:
-                previous_snapshot = session.query(ListingSnapshot).filter(
-                    ListingSnapshot.source_url == current_snapshot.source_url,
-                    ListingSnapshot.model == current_snapshot.model,
-                    ListingSnapshot.id != current_snapshot.id
-                ).order_by(ListingSnapshot.seen_at.desc()).first()
-                
-                # Compute and store delta if previous snapshot exists
-                if previous_snapshot:
-                    try:
-                        delta = compute_delta(previous_snapshot, current_snapshot)
-                        session.add(delta)
-                        logger.debug(
-                            f"Created delta for {current_snapshot.model}: "
-                            f"price_delta={delta.price_delta:.2f} "
-                            f"({delta.price_delta_pct:.1f}%)"
-                        )
-                    except Exception as e:
-                        logger.warning(f"Failed to compute delta: {e}")
-            
-            session.commit()
-            
-        except Exception as e:
-            session.rollback()
-            logger.error(f"Failed to create snapshot: {e}")
-            raise
-        finally:
-            session.close()
-
-    def _get_fuzzy_matched_models(self, model: str) -> List[str]:
+            rows.append(snapshot_row(snapshot_data, seen_at=now, import_id=import_id))
+        bulk_insert_listings(conn, ListingSnapshot, rows)
+
+        # Pair each snapshot with its predecessor for the same source_url and store the
+        # deltas in one INSERT ... SELECT
+        delta_count = compute_deltas_for_import(conn, import_id, now)
+        if delta_count:
+            logger.debug("Created %d deltas for import %s", delta_count, import_id)
+
+    def _get_model_names(self, conn) -> List[str]:
+        """
+        Get the distinct listed model names to fuzzy match against.
+
+        The catalog is only rescanned when the highest scored_listings rowid changes, which
+        covers inserts from any store on the same file; otherwise the cached list is reused.
+
+        Args:
+            conn: Database connection
+
+        Returns:
+            List of distinct model names
+        """
+        version = conn.execute(_SQL_MAX_LISTING_ROWID).scalar()
+        cached_version, model_names = self._models_cache
+        if version == cached_version:
+            return model_names
+
+        model_names = [row[0] for row in conn.execute(_SQL_DISTINCT_MODELS)]
+
+        self._models_cache = (version, model_names)
+        return model_names
+
+    def _get_fts_candidate_models(self, conn, model: str) -> List[str]:
+        """
+        Look up listed models containing the given name via the models_fts trigram index.
+
+        Args:
+            conn: Database connection
+            model: Model name to search for
+
+        Returns:
+            Up to FTS_CANDIDATE_LIMIT model names ordered by FTS5 rank, empty if the query is
+            shorter than one trigram or the database predates models_fts
+        """
+        if len(model) < 3:
+            return []
+
+        # Quote the name as a single FTS5 string so punctuation is matched literally
+        query = '"' + model.replace('"', '""') + '"'
+        try:
+            result = conn.execute(_SQL_FTS_CANDIDATES, {"query": query, "limit": FTS_CANDIDATE_LIMIT})
+            return [row[0] for row in result]
+        except OperationalError as e:
+            logger.debug(f"Full-text model search unavailable: {e}")
+            return []
+
+    def _get_fuzzy_matched_models(self, conn, model: str) -> List[str]:
         """
         Get fuzzy matched models for the given model name.
 
         Args:
+            conn: Database connection
             model: Model name to match against
 
         Returns:
             List of matched model names, empty if no match found
         """
-        # Get all unique models from the database for fuzzy matching
-        with self.engine.connect() as conn:
-            model_result = conn.execute(text("SELECT DISTINCT canonical_model FROM scored_listings"))
-            all_models = [row[0] for row in model_result.fetchall()]
-
-        # Create a models dictionary for fuzzy matching (format expected by fuzzy_match)
-        models_dict = {m: [m] for m in all_models}
-
-        # Apply fuzzy matching
-        matched_model, score, match_notes = fuzzy_match(model, models_dict, threshold=70.0)
+        # Score only the listed models that contain the query as a substring, when there are any
+        candidates = self._get_fts_candidate_models(conn, model)
+        if candidates:
+            matched_model = _best_fuzzy_match(model, candidates)
+            if matched_model:
+                return [matched_model]
+
+        # Otherwise fall back to fuzzy matching over the whole catalog
+        matched_model = _best_fuzzy_match(model, self._get_model_names(conn))
         if matched_model:
             return [matched_model]
         else:
-            logger.info(f"No fuzzy match found for model: {model}")
+            logger.debug("No fuzzy match found for model: %s", model)
             return []
 
     def _build_query_with_filters(
         self,
         fuzzy_matched_models: List[str],
-        min_price: Optional[float],
-        max_price: Optional[float],
-        min_score: Optional[float],
-        max_score: Optional[float],
-        region: Optional[str],
-        after: Optional[datetime],
-        import_id: Optional[str],
-        limit: Optional[int],
-        offset: Optional[int],
+        *,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+        min_score: Optional[float] = None,
+        max_score: Optional[float] = None,
+        region: Optional[str] = None,
+        after: Optional[datetime] = None,
+        import_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        after_id: Optional[int] = None,
     ) -> tuple[str, dict]:
         """
         Build SQL query with filters and return query string and parameters.
@@ -340,74 +589,76 @@ class SqliteListingStore(ListingStore):
         Returns:
             Tuple of (query_string, parameters_dict)
         """
-        query = """
-            SELECT canonical_model, price, vram_gb, tdp_watts, mig_support, nvlink, score, import_id, import_index
-            FROM scored_listings
-            WHERE 1=1
-        """
-        params = {}
-
-        # Handle fuzzy matched models
-        if fuzzy_matched_models:
-            placeholders = ", ".join(f":model_{i}" for i in range(len(fuzzy_matched_models)))
-            query += f" AND canonical_model IN ({placeholders})"
-            for i, matched_model in enumerate(fuzzy_matched_models):
-                params[f"model_{i}"] = matched_model
-
-        # Declarative filter specs
-        filter_specs = [
-            ("price", ">=", "min_price", min_price),
-            ("price", "<=", "max_price", max_price),
-            ("score", ">=", "min_score", min_score),
-            ("score", "<=", "max_score", max_score),
-            ("region", "=", "region", region),
-            ("seen_at", ">=", "after", after.isoformat() if after else None),
-            ("import_id", "=", "import_id", import_id),
-        ]
-
-        for column, op, param_name, value in filter_specs:
-            if value is not None:
-                query += f" AND {column} {op} :{param_name}"
-                params[param_name] = value
-
-        if limit is not None:
-            query += " LIMIT :limit"
-            params["limit"] = limit
-
-        if offset is not None:
-            query += " OFFSET :offset"
-            params["offset"] = offset
+        # The SQL only depends on which filters are set; it is built once per combination
+        values = (
+            json.dumps(fuzzy_matched_models) if fuzzy_matched_models else None,
+            min_price,
+            max_price,
+            min_score,
+            max_score,
+            region,
+            after.isoformat() if after else None,
+            import_id,
+            after_id,
+            limit,
+            offset,
+        )
+        query = _listing_sql(tuple(value is not None for value in values))
+        params = {name: value for (name, _), value in zip(_LISTING_FILTERS, values) if value is not None}
 
         return query, params
 
-    def _convert_rows_to_dtos(self, rows) -> List[GPUListingDTO]:
+    def _convert_rows_to_dtos(self, rows, trusted: bool = True) -> List[GPUListingDTO]:
         """
         Convert database rows to GPUListingDTO objects.
 
+        Rows come from our own schema, whose column types already match the DTO, so by
+        default they are built with ``model_construct`` and skip per-row validation.
+
         Args:
-            rows: Database result rows
+            rows: Database result rows, either a list or a result being streamed
+            trusted: Build DTOs without validation; pass False to validate every row
 
         Returns:
             List of GPUListingDTO objects
         """
+        if not trusted:
+            return [self._row_to_dto(row) for row in rows]
+
+        construct = GPUListingDTO.model_construct
         listings = []
         for row in rows:
-            listing = GPUListingDTO(
-                canonical_model=row[0],
-                price=row[1],
-                vram_gb=row[2],
-                tdp_watts=row[3],
-                mig_support=row[4],
-                nvlink=bool(row[5]),
-                score=row[6],
-                import_id=row[7],
-                import_index=row[8],
-            )
-            listings.append(listing)
+            fields = dict(zip(_DTO_FIELDS, row))
+            fields["nvlink"] = bool(fields["nvlink"])
+            listings.append(construct(**fields))
         return listings
 
+    @staticmethod
+    def _row_to_dto(row) -> GPUListingDTO:
+        """
+        Convert a single scored_listings row to a validated GPUListingDTO.
+
+        Args:
+            row: Database result row
+
+        Returns:
+            GPUListingDTO object
+        """
+        return GPUListingDTO(
+            canonical_model=row[0],
+            price=row[1],
+            vram_gb=row[2],
+            tdp_watts=row[3],
+            mig_support=row[4],
+            nvlink=bool(row[5]),
+            score=row[6],
+            import_id=row[7],
+            import_index=row[8],
+        )
+
     def query_listings(
         self,
+        *,
         model: Optional[str] = None,
         min_price: Optional[float] = None,
         max_price: Optional[float] = None,
@@ -437,59 +688,151 @@ class SqliteListingStore(ListingStore):
         Returns:
             A list of listings matching the filters
         """
-        # Handle fuzzy matching for model if provided
-        fuzzy_matched_models = []
-        if model:
-            fuzzy_matched_models = self._get_fuzzy_matched_models(model)
-            if not fuzzy_matched_models:
-                return []
+        listings = self._select_listings(
+            model,
+            min_price=min_price,
+            max_price=max_price,
+            min_score=min_score,
+            max_score=max_score,
+            region=region,
+            after=after,
+            import_id=import_id,
+            limit=limit,
+            offset=offset,
+        )[0]
+        logger.debug("Found %d listings matching the filters", len(listings))
+        return listings
 
-        # Build the query with filters
-        query, params = self._build_query_with_filters(
-            fuzzy_matched_models, min_price, max_price, min_score, max_score, region, after, import_id, limit, offset
+    def query_listings_page(
+        self,
+        after_id: int = 0,
+        limit: int = 100,
+        *,
+        model: Optional[str] = None,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+        min_score: Optional[float] = None,
+        max_score: Optional[float] = None,
+        region: Optional[str] = None,
+        after: Optional[datetime] = None,
+        import_id: Optional[str] = None,
+    ) -> Tuple[List[GPUListingDTO], Optional[int]]:
+        """
+        Query one page of listings in id order, resuming after a cursor.
+
+        Args:
+            after_id: Cursor returned with the previous page (0 for the first page)
+            limit: Maximum number of results to return
+            model: Filter by canonical model name (supports fuzzy matching)
+            min_price: Filter by minimum price
+            max_price: Filter by maximum price
+            min_score: Filter by minimum score
+            max_score: Filter by maximum score
+            region: Filter by region
+            after: Filter by listings seen after this timestamp
+            import_id: Filter by import batch ID
+
+        Returns:
+            Tuple of (listings, next_cursor); next_cursor is None on the last page
+        """
+        listings, last_id = self._select_listings(
+            model,
+            min_price=min_price,
+            max_price=max_price,
+            min_score=min_score,
+            max_score=max_score,
+            region=region,
+            after=after,
+            import_id=import_id,
+            limit=limit,
+            after_id=after_id,
         )
+        logger.debug("Found %d listings after id %d", len(listings), after_id)
+        return listings, last_id if len(listings) == limit else None
+
+    def _select_listings(
+        self,
+        model: Optional[str],
+        *,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+        min_score: Optional[float] = None,
+        max_score: Optional[float] = None,
+        region: Optional[str] = None,
+        after: Optional[datetime] = None,
+        import_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        after_id: Optional[int] = None,
+    ) -> Tuple[List[GPUListingDTO], Optional[int]]:
+        """
+        Run a listing query shared by query_listings and query_listings_page.
 
-        # Execute the query
+        Returns:
+            Tuple of (listings, id of the last listing); the id is only read for keyset
+            pages (after_id set) and is None otherwise or when there are no listings
+        """
+        # The fuzzy model lookup and the main query share one pooled connection
         with self.engine.connect() as conn:
-            result = conn.execute(text(query), params)
-            rows = result.fetchall()
+            # Handle fuzzy matching for model if provided
+            fuzzy_matched_models = []
+            if model:
+                fuzzy_matched_models = self._get_fuzzy_matched_models(conn, model)
+                if not fuzzy_matched_models:
+                    return [], None
+
+            # Build the query with filters
+            query, params = self._build_query_with_filters(
+                fuzzy_matched_models,
+                min_price=min_price,
+                max_price=max_price,
+                min_score=min_score,
+                max_score=max_score,
+                region=region,
+                after=after,
+                import_id=import_id,
+                limit=limit,
+                offset=offset,
+                after_id=after_id,
+            )
 
-        # Convert rows to DTOs
-        listings = self._convert_rows_to_dtos(rows)
+            if after_id is not None:
+                # A page is bounded by its limit, so fetch it whole to read the cursor off the last row
+                rows = conn.execute(_listing_query(query), params).fetchall()
+                return self._convert_rows_to_dtos(rows), rows[-1][-1] if rows else None
 
-        logger.info(f"Found {len(listings)} listings matching the filters")
-        return listings
+            # Execute the query and convert rows to DTOs as the cursor yields them, rather than
+            # materializing every row with fetchall() first
+            result = conn.execution_options(stream_results=True).execute(_listing_query(query), params)
+            return self._convert_rows_to_dtos(result), None
 
-    def list_imports(self) -> List[ImportMetadata]:
+    def list_imports(self, limit: Optional[int] = None, offset: Optional[int] = None) -> List[ImportMetadata]:
         """
-        List all import batches in the store.
+        List import batches in the store, newest first.
+
+        Args:
+            limit: Maximum number of results to return
+            offset: Number of results to skip for pagination
 
         Returns:
             A list of import batch metadata
         """
+        # SQLite treats a negative LIMIT as unbounded, so one statement serves every page
+        params = {"limit": -1 if limit is None else limit, "offset": offset or 0}
         with self.engine.connect() as conn:
-            result = conn.execute(
-                text(
-                    """
-                    SELECT import_id, imported_at, source, record_count, description
-                    FROM import_batches
-                    ORDER BY imported_at DESC
-                    """
+            result = conn.execution_options(stream_results=True).execute(_SQL_LIST_IMPORTS, params)
+
+            # Convert rows to DTOs as they are read
+            imports = [
+                ImportMetadata(
+                    import_id=row[0],
+                    imported_at=datetime.fromisoformat(row[1]),
+                    source=row[2],
+                    record_count=row[3],
+                    description=row[4],
                 )
-            )
-            rows = result.fetchall()
-
-        # Convert rows to DTOs
-        imports = []
-        for row in rows:
-            import_metadata = ImportMetadata(
-                import_id=row[0],
-                imported_at=datetime.fromisoformat(row[1]),
-                source=row[2],
-                record_count=row[3],
-                description=row[4],
-            )
-            imports.append(import_metadata)
+                for row in result
+            ]
 
         logger.info(f"Found {len(imports)} import batches")
         return imports
@@ -26,6 +26,9 @@ CREATE TABLE IF NOT EXISTS import_batches (
     description TEXT                 -- Optional description of the import
 );
 
+-- Newest-first index for list_imports pagination
+CREATE INDEX IF NOT EXISTS idx_import_batches_imported_at ON import_batches(imported_at DESC);
+
 -- GPU Models table (based on GPUModelDTO)
 -- Stores normalized GPU model registry with technical specifications
 CREATE TABLE IF NOT EXISTS models (
@@ -42,13 +45,6 @@ CREATE TABLE IF NOT EXISTS models (
     slot_width INTEGER,              -- Physical slot width
     pcie_generation INTEGER,         -- PCIe generation
     
-    -- Market data (aggregated from listings)
-    listing_count INTEGER DEFAULT 0, -- Number of listings for this model
-    min_price REAL,                  -- Minimum price for this model
-    median_price REAL,               -- Median price for this model
-    max_price REAL,                  -- Maximum price for this model
-    avg_price REAL,                  -- Average price for this model
-    
     -- Metadata
     created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
@@ -58,10 +54,32 @@ CREATE TABLE IF NOT EXISTS models (
     FOREIGN KEY (import_id) REFERENCES import_batches(import_id) ON DELETE SET NULL
 );
 
--- Create index on model name for faster lookups
-CREATE INDEX IF NOT EXISTS idx_models_model ON models(model);
+-- Model name lookups use the automatic index behind the UNIQUE constraint
 CREATE INDEX IF NOT EXISTS idx_models_import_index ON models(import_index);
 
+-- Market data per model, aggregated from scored_listings
+-- Rebuilt once per import batch by glyphd.sqlite.market_stats.refresh_model_market_stats
+CREATE TABLE IF NOT EXISTS model_market_stats (
+    model TEXT PRIMARY KEY,                 -- The canonical model name
+    listing_count INTEGER NOT NULL,         -- Number of listings for this model
+    min_price REAL,                         -- Minimum price for this model
+    median_price REAL,                      -- Median price for this model
+    max_price REAL,                         -- Maximum price for this model
+    avg_price REAL,                         -- Average price for this model
+    refreshed_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+
+    FOREIGN KEY (model) REFERENCES models(model) ON DELETE CASCADE
+) WITHOUT ROWID;
+
+-- Trigram full-text index over model names for fuzzy model search
+-- External-content table: model names are read from models and kept in sync by triggers
+CREATE VIRTUAL TABLE IF NOT EXISTS models_fts USING fts5(
+    model,
+    content='models',
+    content_rowid='id',
+    tokenize='trigram'
+);
+
 -- Raw Listings table (based on GPUListingDTO from glyphsieve)
 -- Stores raw listing metadata parsed from CSV input
 CREATE TABLE IF NOT EXISTS listings (
@@ -87,8 +105,32 @@ CREATE INDEX IF NOT EXISTS idx_listings_canonical_model ON listings(canonical_mo
 CREATE INDEX IF NOT EXISTS idx_listings_import_id ON listings(import_id);
 CREATE INDEX IF NOT EXISTS idx_listings_import_index ON listings(import_index);
 
+-- Lookup tables for low-cardinality scored_listings attributes. Listings store the small
+-- integer id instead of repeating the string in every row.
+CREATE TABLE IF NOT EXISTS conditions (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE        -- Condition of the GPU (e.g., 'new', 'used')
+);
+
+CREATE TABLE IF NOT EXISTS regions (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE        -- Region (e.g., 'US', 'EU')
+);
+
+CREATE TABLE IF NOT EXISTS source_types (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE        -- Source type (e.g., 'marketplace', 'retailer')
+);
+
+CREATE TABLE IF NOT EXISTS form_factors (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE        -- Form factor (e.g., 'Standard', 'SFF')
+);
+
 -- Scored Listings table (based on GPUListingDTO from glyphd and EnrichedGPUListingDTO)
--- Stores enriched and scored GPU listings
+-- Stores enriched and scored GPU listings. STRICT (SQLite 3.37+): values must match the
+-- declared INTEGER/REAL/TEXT types instead of being coerced, so booleans are stored as
+-- INTEGER and timestamps as TEXT
 CREATE TABLE IF NOT EXISTS scored_listings (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     
@@ -97,10 +139,10 @@ CREATE TABLE IF NOT EXISTS scored_listings (
     price REAL NOT NULL,             -- Price in USD
     
     -- Enriched fields from GPU metadata
-    vram_gb INTEGER NOT NULL,        -- VRAM capacity in GB
+    vram_gb INTEGER NOT NULL CHECK (vram_gb >= 0),  -- VRAM capacity in GB (0 if unknown)
     tdp_watts INTEGER NOT NULL,      -- Thermal Design Power in watts
     mig_support INTEGER DEFAULT 0,   -- MIG support level (0-7)
-    nvlink BOOLEAN DEFAULT 0,        -- NVLink support (0=false, 1=true)
+    nvlink INTEGER DEFAULT 0 CHECK (nvlink IN (0, 1)),  -- NVLink support (0=false, 1=true)
     
     -- Optional enriched fields
     generation TEXT,                 -- GPU architecture generation
@@ -109,46 +151,54 @@ CREATE TABLE IF NOT EXISTS scored_listings (
     pcie_generation INTEGER,         -- PCIe generation
     
     -- Additional fields from EnrichedGPUListingDTO
-    form_factor TEXT DEFAULT 'Standard', -- Form factor (e.g., 'Standard', 'SFF')
+    form_factor_id INTEGER REFERENCES form_factors(id),  -- Form factor (e.g., 'Standard', 'SFF')
     notes TEXT,                      -- Additional notes about the GPU
     warnings TEXT,                   -- Warnings about metadata mismatches
     
     -- Scoring information
-    score REAL NOT NULL,             -- Calculated utility score
+    score REAL NOT NULL CHECK (score BETWEEN -1e9 AND 1e9),  -- Calculated utility score
     
     -- Additional fields from EPIC.persist.sqlite-store requirements
-    condition TEXT,                  -- Condition of the GPU (e.g., 'new', 'used')
+    condition_id INTEGER REFERENCES conditions(id),      -- Condition of the GPU (e.g., 'new', 'used')
     quantity INTEGER,                -- Available quantity
     min_order_qty INTEGER,           -- Minimum order quantity
     seller TEXT,                     -- Seller name
-    region TEXT,                     -- Region (e.g., 'US', 'EU')
+    region_id INTEGER REFERENCES regions(id),            -- Region (e.g., 'US', 'EU')
     source_url TEXT,                 -- Source URL of the listing
-    source_type TEXT,                -- Source type (e.g., 'marketplace', 'retailer')
-    seen_at TIMESTAMP,               -- When the listing was seen
+    source_type_id INTEGER REFERENCES source_types(id),  -- Source type (e.g., 'marketplace', 'retailer')
+    seen_at TEXT,                    -- When the listing was seen
     
     -- Metadata
-    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
-    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
     import_id TEXT,                  -- Reference to the import batch
     import_index INTEGER,            -- Sequential index within the import batch
     
     FOREIGN KEY (canonical_model) REFERENCES models(model) ON DELETE CASCADE,
     FOREIGN KEY (import_id) REFERENCES import_batches(import_id) ON DELETE SET NULL
-);
+) STRICT;
 
 -- Create indexes for faster lookups and filtering
-CREATE INDEX IF NOT EXISTS idx_scored_listings_canonical_model ON scored_listings(canonical_model);
+-- Composite index for model-filtered queries with score/price/seen_at ranges; its
+-- canonical_model prefix also serves plain model lookups
+CREATE INDEX IF NOT EXISTS idx_scored_listings_model_score_price_seen_at
+    ON scored_listings(canonical_model, score, price, seen_at);
+-- Score ranges and top-K by score (walked backwards). score is NOT NULL, so a partial
+-- index would hold every row as well
 CREATE INDEX IF NOT EXISTS idx_scored_listings_score ON scored_listings(score);
-CREATE INDEX IF NOT EXISTS idx_scored_listings_region ON scored_listings(region);
+-- Region + model filters sorted by score, and per-import listings sorted by recency; their
+-- leading columns also serve plain region and import_id lookups
+CREATE INDEX IF NOT EXISTS idx_scored_listings_region_model_score
+    ON scored_listings(region_id, canonical_model, score DESC);
 CREATE INDEX IF NOT EXISTS idx_scored_listings_seen_at ON scored_listings(seen_at);
-CREATE INDEX IF NOT EXISTS idx_scored_listings_import_id ON scored_listings(import_id);
+CREATE INDEX IF NOT EXISTS idx_scored_listings_import_id_seen_at ON scored_listings(import_id, seen_at DESC);
 CREATE INDEX IF NOT EXISTS idx_scored_listings_import_index ON scored_listings(import_index);
 
 -- Quantized Listings table (based on QuantizationCapacitySpec)
 -- Stores quantization capacities for GPU listings
+-- One row per scored listing, keyed by it: the key is the rowid, so rows and lookups share one B-tree
 CREATE TABLE IF NOT EXISTS quantized_listings (
-    id INTEGER PRIMARY KEY AUTOINCREMENT,
-    scored_listing_id INTEGER NOT NULL, -- Reference to the scored listing
+    scored_listing_id INTEGER PRIMARY KEY, -- Reference to the scored listing
     model_7b INTEGER NOT NULL,       -- Number of 7B parameter models that can fit
     model_13b INTEGER NOT NULL,      -- Number of 13B parameter models that can fit
     model_70b INTEGER NOT NULL,      -- Number of 70B parameter models that can fit
@@ -163,38 +213,29 @@ CREATE TABLE IF NOT EXISTS quantized_listings (
     FOREIGN KEY (import_id) REFERENCES import_batches(import_id) ON DELETE SET NULL
 );
 
--- Create index for faster lookups
-CREATE INDEX IF NOT EXISTS idx_quantized_listings_scored_listing_id ON quantized_listings(scored_listing_id);
 CREATE INDEX IF NOT EXISTS idx_quantized_listings_import_index ON quantized_listings(import_index);
 
--- Triggers to update the updated_at timestamp when records are modified
+-- updated_at is set by the application on UPDATE (ORM onupdate or the UPDATE statement);
+-- no per-row triggers, which would issue a second UPDATE for every modified row
 
--- Update models.updated_at when a record is modified
-CREATE TRIGGER IF NOT EXISTS update_models_timestamp
-AFTER UPDATE ON models
+-- Keep models_fts in sync with models
+CREATE TRIGGER IF NOT EXISTS models_fts_insert
+AFTER INSERT ON models
 BEGIN
-    UPDATE models SET updated_at = CURRENT_TIMESTAMP WHERE id = NEW.id;
+    INSERT INTO models_fts(rowid, model) VALUES (NEW.id, NEW.model);
 END;
 
--- Update listings.updated_at when a record is modified
-CREATE TRIGGER IF NOT EXISTS update_listings_timestamp
-AFTER UPDATE ON listings
+CREATE TRIGGER IF NOT EXISTS models_fts_delete
+AFTER DELETE ON models
 BEGIN
-    UPDATE listings SET updated_at = CURRENT_TIMESTAMP WHERE id = NEW.id;
+    INSERT INTO models_fts(models_fts, rowid, model) VALUES ('delete', OLD.id, OLD.model);
 END;
 
--- Update scored_listings.updated_at when a record is modified
-CREATE TRIGGER IF NOT EXISTS update_scored_listings_timestamp
-AFTER UPDATE ON scored_listings
+CREATE TRIGGER IF NOT EXISTS models_fts_update
+AFTER UPDATE OF model ON models
 BEGIN
-    UPDATE scored_listings SET updated_at = CURRENT_TIMESTAMP WHERE id = NEW.id;
-END;
-
--- Update quantized_listings.updated_at when a record is modified
-CREATE TRIGGER IF NOT EXISTS update_quantized_listings_timestamp
-AFTER UPDATE ON quantized_listings
-BEGIN
-    UPDATE quantized_listings SET updated_at = CURRENT_TIMESTAMP WHERE id = NEW.id;
+    INSERT INTO models_fts(models_fts, rowid, model) VALUES ('delete', OLD.id, OLD.model);
+    INSERT INTO models_fts(rowid, model) VALUES (NEW.id, NEW.model);
 END;
 
 -- Listing Snapshots table for forecasting and price history tracking
@@ -204,7 +245,9 @@ CREATE TABLE IF NOT EXISTS listing_snapshots (
     model TEXT NOT NULL,             -- GPU model name
     price_usd REAL NOT NULL,         -- Price in USD at time of snapshot
     score REAL NOT NULL,             -- Score at time of snapshot
-    quantization_capacity TEXT,      -- JSON data for quantization capacity
+    model_7b INTEGER,                -- Number of 7B parameter models that can fit
+    model_13b INTEGER,               -- Number of 13B parameter models that can fit
+    model_70b INTEGER,               -- Number of 70B parameter models that can fit
     seen_at TIMESTAMP NOT NULL,      -- When the listing was observed
     seller TEXT,                     -- Seller name
     region TEXT,                     -- Region (e.g., 'US', 'EU')
@@ -212,13 +255,22 @@ CREATE TABLE IF NOT EXISTS listing_snapshots (
     heuristics TEXT,                 -- JSON data for heuristics
     
     -- Metadata
-    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    import_id TEXT,                  -- Reference to the import batch
+    
+    FOREIGN KEY (import_id) REFERENCES import_batches(import_id) ON DELETE SET NULL
 );
 
 -- Create indexes for faster lookups
-CREATE INDEX IF NOT EXISTS idx_listing_snapshots_model ON listing_snapshots(model);
+-- Latest-snapshot-per-model lookups; the prefix also serves plain model lookups
+CREATE INDEX IF NOT EXISTS idx_listing_snapshots_model_seen_at ON listing_snapshots(model, seen_at DESC);
 CREATE INDEX IF NOT EXISTS idx_listing_snapshots_seen_at ON listing_snapshots(seen_at);
-CREATE INDEX IF NOT EXISTS idx_listing_snapshots_source_url ON listing_snapshots(source_url);
+-- Previous-snapshot lookup of the delta computation: same source_url and model, newest first
+-- with ties broken by id. The prefix also serves plain source_url lookups
+CREATE INDEX IF NOT EXISTS idx_listing_snapshots_source_url_model_seen_at
+    ON listing_snapshots(source_url, model, seen_at DESC, id DESC);
+-- Finds an import batch's snapshots when computing its deltas
+CREATE INDEX IF NOT EXISTS idx_listing_snapshots_import_id_seen_at ON listing_snapshots(import_id, seen_at);
 
 -- Listing Deltas table for storing computed deltas between successive snapshots
 -- Enables price volatility analysis, trend detection, and forecasting
@@ -0,0 +1,209 @@
+"""
+Bulk insert helpers for the GPU Scoring Tool SQLite database.
+
+Rows are written with multi-row ``INSERT ... VALUES (...), (...)`` statements inside the
+caller's transaction instead of one ORM object or one statement per row.
+"""
+
+import json
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Type
+
+from sqlalchemy import Table
+
+from glyphd.sqlite.models import Base
+
+# SQLite's historical default limit on bound parameters per statement (SQLITE_MAX_VARIABLE_NUMBER)
+SQLITE_MAX_BOUND_PARAMS = 999
+
+# Upper bound on rows per multi-row statement; narrow tables are further limited by the parameter cap
+BULK_INSERT_CHUNK_ROWS = 10_000
+
+
+def _chunk_rows(width: int, chunk_rows: int) -> int:
+    """
+    Get the number of rows per statement for rows of the given width.
+
+    Args:
+        width: Number of values per row
+        chunk_rows: Upper bound on rows per statement
+
+    Returns:
+        Rows per statement, keeping each statement under SQLITE_MAX_BOUND_PARAMS
+    """
+    return max(1, min(chunk_rows, SQLITE_MAX_BOUND_PARAMS // width))
+
+
+@lru_cache(maxsize=128)
+def _values_sql(insert_sql: str, width: int, row_count: int, suffix: str = "") -> str:
+    """
+    Get the multi-row INSERT statement for a statement prefix and row shape.
+
+    Args:
+        insert_sql: ``INSERT ... INTO table (columns)`` prefix, without the VALUES clause
+        width: Number of values per row
+        row_count: Number of rows in the statement
+        suffix: Clause appended after the VALUES list, such as an ``ON CONFLICT`` upsert clause
+
+    Returns:
+        The SQL string, built once per shape and reused by every batch
+    """
+    placeholder = "(" + ",".join("?" * width) + ")"
+    values_sql = f"{insert_sql} VALUES {','.join([placeholder] * row_count)}"
+    return f"{values_sql} {suffix}" if suffix else values_sql
+
+
+def _bind_processor(column, dialect) -> Optional[Callable]:
+    """
+    Get the dialect's bind processor for a column, as a compiled insert would apply it.
+
+    Args:
+        column: Table column
+        dialect: Dialect of the connection
+
+    Returns:
+        The processor, or None if values are passed to the driver unchanged
+    """
+    return column.type.dialect_impl(dialect).bind_processor(dialect)
+
+
+@lru_cache(maxsize=64)
+def _table_insert_plan(
+    table: Table, columns: Tuple[str, ...], dialect
+) -> Tuple[str, Tuple[Optional[Callable], ...], Tuple[Tuple[Any, Optional[Callable]], ...]]:
+    """
+    Plan a driver-level insert of rows with the given columns into a table.
+
+    Columns left out of the rows get their Python-side default, as a Core insert would;
+    columns without one are left to the table's server default.
+
+    Args:
+        table: Target table
+        columns: Column names present in every row
+        dialect: Dialect of the connection, for the columns' bind processors
+
+    Returns:
+        Tuple of (statement prefix, bind processor per row column, (default, bind processor)
+        per defaulted column)
+    """
+    defaulted = [
+        column
+        for column in table.columns
+        if column.name not in columns and column.default is not None and not column.default.is_sequence
+    ]
+    names = ", ".join(columns + tuple(column.name for column in defaulted))
+    processors = tuple(_bind_processor(table.columns[name], dialect) for name in columns)
+    defaults = tuple((column.default, _bind_processor(column, dialect)) for column in defaulted)
+    return f"INSERT INTO {table.name} ({names})", processors, defaults
+
+
+def insert_rows(
+    conn, insert_sql: str, rows: List[tuple], chunk_rows: int = BULK_INSERT_CHUNK_ROWS, suffix: str = ""
+) -> None:
+    """
+    Insert rows with multi-row ``VALUES (...), (...)`` statements.
+
+    Rows are chunked so each statement stays under SQLite's bound-parameter limit. All full
+    chunks share one statement, prepared once and run with a single ``executemany``; the
+    remainder goes in one final statement. The SQL goes straight to the DBAPI cursor without
+    SQLAlchemy's ``text()`` compilation or bind processing.
+
+    Args:
+        conn: SQLAlchemy connection with an open transaction
+        insert_sql: ``INSERT ... INTO table (columns)`` prefix, without the VALUES clause
+        rows: Parameter tuples, all of the same length
+        chunk_rows: Upper bound on rows per statement
+        suffix: Clause appended after the VALUES list, e.g. ``ON CONFLICT(...) DO UPDATE SET ...``
+            to upsert the rows
+    """
+    if not rows:
+        return
+    width = len(rows[0])
+    chunk_size = _chunk_rows(width, chunk_rows)
+
+    full_count = len(rows) - len(rows) % chunk_size
+    if full_count:
+        chunk_sql = _values_sql(insert_sql, width, chunk_size, suffix)
+        chunks = [
+            tuple(value for row in rows[start : start + chunk_size] for value in row)
+            for start in range(0, full_count, chunk_size)
+        ]
+        conn.exec_driver_sql(chunk_sql, chunks)
+
+    remainder = rows[full_count:]
+    if remainder:
+        remainder_sql = _values_sql(insert_sql, width, len(remainder), suffix)
+        conn.exec_driver_sql(remainder_sql, tuple(value for row in remainder for value in row))
+
+
+def bulk_insert_listings(
+    conn,
+    model: Type[Base],
+    rows: Sequence[Mapping[str, Any]],
+    chunk_rows: int = BULK_INSERT_CHUNK_ROWS,
+) -> int:
+    """
+    Insert listing rows into an ORM model's table with multi-row inserts.
+
+    Meant for the listing tables (``Listing``, ``ScoredListing``, ``QuantizedListing``) but
+    works for any mapped model. Rows are plain column dictionaries sharing the same keys.
+    The statement for each column shape is planned once per process and the rows go
+    through :func:`insert_rows`, so no SQL is compiled per batch. Values pass through the
+    columns' bind processors, and Python-side defaults for missing columns (such as
+    ``created_at``) are evaluated once per call and shared by every row.
+    No session is involved, so there is no autoflush or identity-map bookkeeping per row.
+
+    Args:
+        conn: SQLAlchemy connection with an open transaction, e.g. from ``engine.begin()``
+        model: Mapped model class whose table receives the rows
+        rows: Column dictionaries, one per row
+        chunk_rows: Upper bound on rows per statement
+
+    Returns:
+        The number of rows inserted
+    """
+    if not rows:
+        return 0
+    columns = tuple(rows[0])
+    insert_sql, processors, column_defaults = _table_insert_plan(model.__table__, columns, conn.dialect)
+
+    defaults = []
+    for default, process in column_defaults:
+        value = default.arg(None) if default.is_callable else default.arg
+        defaults.append(process(value) if process else value)
+    defaults = tuple(defaults)
+
+    fields = tuple(zip(columns, processors))
+    values = [
+        tuple(process(row[name]) if process else row[name] for name, process in fields) + defaults for row in rows
+    ]
+    insert_rows(conn, insert_sql, values, chunk_rows)
+    return len(rows)
+
+
+def lookup_ids(conn, model: Type[Base], names: Iterable[Optional[str]]) -> Dict[str, int]:
+    """
+    Resolve lookup-table names to ids, creating missing entries.
+
+    Used when writing rows that reference a ``(id, name)`` lookup table such as ``Region``
+    or ``Condition``: pass every value of the batch and map each row's name through the
+    result. Each distinct name is inserted and fetched once per batch, in two statements.
+
+    Args:
+        conn: SQLAlchemy connection with an open transaction
+        model: Lookup model class with ``id`` and unique ``name`` columns
+        names: Names to resolve; repeats and None are ignored
+
+    Returns:
+        Dictionary of name to lookup id
+    """
+    distinct = list(dict.fromkeys(name for name in names if name is not None))
+    if not distinct:
+        return {}
+    table = model.__table__.name
+    insert_rows(conn, f"INSERT OR IGNORE INTO {table} (name)", [(name,) for name in distinct])
+    result = conn.exec_driver_sql(
+        f"SELECT name, id FROM {table} WHERE name IN (SELECT value FROM json_each(?))",
+        (json.dumps(distinct),),
+    )
+    return dict(result.fetchall())
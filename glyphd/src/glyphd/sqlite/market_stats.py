@@ -0,0 +1,59 @@
+"""
+Per-model market aggregates for the GPU Scoring Tool SQLite database.
+
+The ``model_market_stats`` table is a roll-up of ``scored_listings`` prices, refreshed for
+the models an import batch touches so readers get counts and price statistics without
+scanning listings.
+"""
+
+import json
+from typing import Iterable
+
+from sqlalchemy import text
+
+_SQL_DELETE_MODEL_MARKET_STATS = text(
+    "DELETE FROM model_market_stats WHERE model IN (SELECT value FROM json_each(:models_json))"
+)
+
+# Median is the mean of the middle one or two prices of each model, ranked by a window function.
+# Only the listed models are ranked, through the canonical_model prefix of the listings index.
+_SQL_REFRESH_MODEL_MARKET_STATS = text(
+    """
+    INSERT INTO model_market_stats
+        (model, listing_count, min_price, median_price, max_price, avg_price, refreshed_at)
+    WITH ranked AS (
+        SELECT canonical_model, price,
+               ROW_NUMBER() OVER (PARTITION BY canonical_model ORDER BY price) AS rn,
+               COUNT(*) OVER (PARTITION BY canonical_model) AS n
+        FROM scored_listings
+        WHERE canonical_model IN (SELECT value FROM json_each(:models_json))
+    )
+    SELECT canonical_model, MAX(n), MIN(price),
+           AVG(CASE WHEN rn IN ((n + 1) / 2, (n + 2) / 2) THEN price END),
+           MAX(price), AVG(price), CURRENT_TIMESTAMP
+    FROM ranked
+    GROUP BY canonical_model
+    """
+)
+
+
+def refresh_model_market_stats(conn, models: Iterable[str]) -> int:
+    """
+    Rebuild the ``model_market_stats`` rows of the given models from ``scored_listings``.
+
+    Pass every model whose listings changed: the models of the new batch and those of the
+    rows it replaced. Their rows are cleared and refilled in one pass, so a model left
+    without listings drops out, while the stats of other models are not recomputed. Run it
+    inside the import's transaction so readers never see listings and aggregates from
+    different batches.
+
+    Args:
+        conn: SQLAlchemy connection with an open transaction
+        models: Canonical model names to refresh
+
+    Returns:
+        The number of refreshed models that still have listings
+    """
+    params = {"models_json": json.dumps(sorted(set(models)))}
+    conn.execute(_SQL_DELETE_MODEL_MARKET_STATS, params)
+    return conn.execute(_SQL_REFRESH_MODEL_MARKET_STATS, params).rowcount
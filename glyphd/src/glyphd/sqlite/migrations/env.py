@@ -13,6 +13,7 @@ from sqlalchemy import engine_from_config, pool
 # add your model's MetaData object here
 # for 'autogenerate' support
 from glyphd.sqlite.models import Base
+from glyphd.sqlite.pragmas import install_pragmas
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -84,6 +85,7 @@ def run_migrations_online() -> None:
         prefix="sqlalchemy.",
         poolclass=pool.NullPool,
     )
+    install_pragmas(connectable)
 
     with connectable.connect() as connection:
         context.configure(connection=connection, target_metadata=target_metadata)
@@ -0,0 +1,26 @@
+"""Drop the models name index duplicated by its UNIQUE constraint
+
+Revision ID: 20261017_drop_models_model_idx
+Revises: 20261017_scored_filter_sort
+Create Date: 2026-10-17 13:00:00.000000
+
+"""
+
+from typing import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261017_drop_models_model_idx"
+down_revision: str | None = "20261017_scored_filter_sort"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # models.model is UNIQUE, so SQLite already keeps an automatic index on it
+    op.execute("DROP INDEX IF EXISTS idx_models_model")
+
+
+def downgrade() -> None:
+    op.create_index("idx_models_model", "models", ["model"], unique=False)
@@ -0,0 +1,40 @@
+"""Drop the per-row updated_at triggers in favour of app-side assignment
+
+Revision ID: 20261017_drop_updated_triggers
+Revises: 20261017_drop_models_model_idx
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+
+from typing import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261017_drop_updated_triggers"
+down_revision: str | None = "20261017_drop_models_model_idx"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Tables whose updated_at was maintained by an AFTER UPDATE trigger
+TIMESTAMP_TABLES = ("models", "listings", "scored_listings", "quantized_listings")
+
+
+def upgrade() -> None:
+    # updated_at is now set by the ORM (onupdate) or by the UPDATE statement itself,
+    # so each row update no longer issues a second UPDATE
+    for table in TIMESTAMP_TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS update_{table}_timestamp")
+
+
+def downgrade() -> None:
+    for table in TIMESTAMP_TABLES:
+        op.execute(
+            f"""
+    CREATE TRIGGER IF NOT EXISTS update_{table}_timestamp
+    AFTER UPDATE ON {table}
+    BEGIN
+        UPDATE {table} SET updated_at = CURRENT_TIMESTAMP WHERE id = NEW.id;
+    END;
+    """
+        )
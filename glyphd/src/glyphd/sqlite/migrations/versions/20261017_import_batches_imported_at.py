@@ -0,0 +1,25 @@
+"""Index import_batches by imported_at for newest-first listing
+
+Revision ID: 20261017_imports_imported_at
+Revises: 20261017_scored_composite
+Create Date: 2026-10-17 11:00:00.000000
+
+"""
+
+from typing import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261017_imports_imported_at"
+down_revision: str | None = "20261017_scored_composite"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE INDEX IF NOT EXISTS idx_import_batches_imported_at ON import_batches(imported_at DESC)")
+
+
+def downgrade() -> None:
+    op.drop_index("idx_import_batches_imported_at", table_name="import_batches")
@@ -0,0 +1,82 @@
+"""Move models market aggregates into the model_market_stats roll-up table
+
+Revision ID: 20261017_model_market_stats
+Revises: 20261017_scored_lookups
+Create Date: 2026-10-17 16:00:00.000000
+
+"""
+
+from typing import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261017_model_market_stats"
+down_revision: str | None = "20261017_scored_lookups"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Aggregate columns moved off models, in their original order
+AGGREGATES = (
+    ("listing_count", "INTEGER DEFAULT 0"),
+    ("min_price", "REAL"),
+    ("median_price", "REAL"),
+    ("max_price", "REAL"),
+    ("avg_price", "REAL"),
+)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "model_market_stats",
+        sa.Column("model", sa.String(), sa.ForeignKey("models.model", ondelete="CASCADE"), primary_key=True),
+        sa.Column("listing_count", sa.Integer(), nullable=False),
+        sa.Column("min_price", sa.Float()),
+        sa.Column("median_price", sa.Float()),
+        sa.Column("max_price", sa.Float()),
+        sa.Column("avg_price", sa.Float()),
+        sa.Column("refreshed_at", sa.TIMESTAMP(), nullable=False, server_default=sa.text("CURRENT_TIMESTAMP")),
+        sqlite_with_rowid=False,
+    )
+
+    # Backfill from the current listings; the models columns were never populated
+    op.execute(
+        """
+        INSERT INTO model_market_stats
+            (model, listing_count, min_price, median_price, max_price, avg_price, refreshed_at)
+        WITH ranked AS (
+            SELECT canonical_model, price,
+                   ROW_NUMBER() OVER (PARTITION BY canonical_model ORDER BY price) AS rn,
+                   COUNT(*) OVER (PARTITION BY canonical_model) AS n
+            FROM scored_listings
+        )
+        SELECT canonical_model, MAX(n), MIN(price),
+               AVG(CASE WHEN rn IN ((n + 1) / 2, (n + 2) / 2) THEN price END),
+               MAX(price), AVG(price), CURRENT_TIMESTAMP
+        FROM ranked
+        GROUP BY canonical_model
+        """
+    )
+
+    for column, _ in AGGREGATES:
+        op.execute(f"ALTER TABLE models DROP COLUMN {column}")
+
+
+def downgrade() -> None:
+    for column, definition in AGGREGATES:
+        op.execute(f"ALTER TABLE models ADD COLUMN {column} {definition}")
+
+    op.execute(
+        """
+        UPDATE models SET
+            listing_count = s.listing_count,
+            min_price = s.min_price,
+            median_price = s.median_price,
+            max_price = s.max_price,
+            avg_price = s.avg_price
+        FROM model_market_stats AS s
+        WHERE s.model = models.model
+        """
+    )
+    op.drop_table("model_market_stats")
@@ -0,0 +1,73 @@
+"""Add trigram FTS5 index over model names
+
+Revision ID: 20261017_models_fts
+Revises: 20250729_initial
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+
+from typing import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261017_models_fts"
+down_revision: str | None = "20250729_initial"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # External-content FTS5 table over models.model with trigram tokenization
+    op.execute(
+        """
+    CREATE VIRTUAL TABLE IF NOT EXISTS models_fts USING fts5(
+        model,
+        content='models',
+        content_rowid='id',
+        tokenize='trigram'
+    )
+    """
+    )
+
+    # Index the models that already exist
+    op.execute("INSERT INTO models_fts(models_fts) VALUES ('rebuild')")
+
+    # Keep models_fts in sync with models
+    op.execute(
+        """
+    CREATE TRIGGER IF NOT EXISTS models_fts_insert
+    AFTER INSERT ON models
+    BEGIN
+        INSERT INTO models_fts(rowid, model) VALUES (NEW.id, NEW.model);
+    END;
+    """
+    )
+
+    op.execute(
+        """
+    CREATE TRIGGER IF NOT EXISTS models_fts_delete
+    AFTER DELETE ON models
+    BEGIN
+        INSERT INTO models_fts(models_fts, rowid, model) VALUES ('delete', OLD.id, OLD.model);
+    END;
+    """
+    )
+
+    op.execute(
+        """
+    CREATE TRIGGER IF NOT EXISTS models_fts_update
+    AFTER UPDATE OF model ON models
+    BEGIN
+        INSERT INTO models_fts(models_fts, rowid, model) VALUES ('delete', OLD.id, OLD.model);
+        INSERT INTO models_fts(rowid, model) VALUES (NEW.id, NEW.model);
+    END;
+    """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS models_fts_update")
+    op.execute("DROP TRIGGER IF EXISTS models_fts_delete")
+    op.execute("DROP TRIGGER IF EXISTS models_fts_insert")
+    op.execute("DROP TABLE IF EXISTS models_fts")
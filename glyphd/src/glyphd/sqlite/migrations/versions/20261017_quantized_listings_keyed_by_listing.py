@@ -0,0 +1,79 @@
+"""Key quantized_listings by scored_listing_id instead of a surrogate id
+
+Revision ID: 20261017_quantized_by_listing
+Revises: 20261017_snapshot_lookup_idx
+Create Date: 2026-10-17 20:00:00.000000
+
+"""
+
+from typing import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261017_quantized_by_listing"
+down_revision: str | None = "20261017_snapshot_lookup_idx"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Columns kept by both layouts; import_index only exists on databases created from schema.sql
+COLUMNS = ("scored_listing_id", "model_7b", "model_13b", "model_70b", "created_at", "updated_at", "import_id")
+
+
+def _copied_columns() -> str:
+    existing = {column["name"] for column in sa.inspect(op.get_bind()).get_columns("quantized_listings")}
+    return ", ".join(column for column in (*COLUMNS, "import_index") if column in existing)
+
+
+def _create_table(name: str, keyed_by_listing: bool) -> None:
+    key = (
+        [sa.Column("scored_listing_id", sa.Integer(), primary_key=True, autoincrement=False)]
+        if keyed_by_listing
+        else [
+            sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+            sa.Column("scored_listing_id", sa.Integer(), nullable=False),
+        ]
+    )
+    op.create_table(
+        name,
+        *key,
+        sa.Column("model_7b", sa.Integer(), nullable=False),
+        sa.Column("model_13b", sa.Integer(), nullable=False),
+        sa.Column("model_70b", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False, server_default=sa.text("CURRENT_TIMESTAMP")),
+        sa.Column("updated_at", sa.DateTime(), nullable=False, server_default=sa.text("CURRENT_TIMESTAMP")),
+        sa.Column("import_id", sa.String(), nullable=True),
+        sa.Column("import_index", sa.Integer(), nullable=True),
+        sa.ForeignKeyConstraint(["import_id"], ["import_batches.import_id"], ondelete="SET NULL"),
+        sa.ForeignKeyConstraint(["scored_listing_id"], ["scored_listings.id"], ondelete="CASCADE"),
+        sqlite_autoincrement=not keyed_by_listing,
+    )
+
+
+def upgrade() -> None:
+    columns = _copied_columns()
+    _create_table("quantized_listings_new", keyed_by_listing=True)
+    # A listing with several capacity rows keeps its newest one
+    op.execute(
+        f"INSERT OR REPLACE INTO quantized_listings_new ({columns}) "
+        f"SELECT {columns} FROM quantized_listings ORDER BY id"
+    )
+    op.drop_table("quantized_listings")
+    op.rename_table("quantized_listings_new", "quantized_listings")
+    op.create_index("idx_quantized_listings_import_index", "quantized_listings", ["import_index"], unique=False)
+
+
+def downgrade() -> None:
+    columns = _copied_columns()
+    _create_table("quantized_listings_old", keyed_by_listing=False)
+    op.execute(
+        f"INSERT INTO quantized_listings_old ({columns}) "
+        f"SELECT {columns} FROM quantized_listings ORDER BY scored_listing_id"
+    )
+    op.drop_table("quantized_listings")
+    op.rename_table("quantized_listings_old", "quantized_listings")
+    op.create_index(
+        "idx_quantized_listings_scored_listing_id", "quantized_listings", ["scored_listing_id"], unique=False
+    )
+    op.create_index("idx_quantized_listings_import_index", "quantized_listings", ["import_index"], unique=False)
@@ -0,0 +1,33 @@
+"""Replace the scored_listings model index with a composite filter index
+
+Revision ID: 20261017_scored_composite
+Revises: 20261017_models_fts
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+
+from typing import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261017_scored_composite"
+down_revision: str | None = "20261017_models_fts"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # The composite index's canonical_model prefix makes the single-column index redundant
+    op.create_index(
+        "idx_scored_listings_model_score_price_seen_at",
+        "scored_listings",
+        ["canonical_model", "score", "price", "seen_at"],
+        unique=False,
+    )
+    op.drop_index("idx_scored_listings_canonical_model", table_name="scored_listings")
+
+
+def downgrade() -> None:
+    op.create_index("idx_scored_listings_canonical_model", "scored_listings", ["canonical_model"], unique=False)
+    op.drop_index("idx_scored_listings_model_score_price_seen_at", table_name="scored_listings")
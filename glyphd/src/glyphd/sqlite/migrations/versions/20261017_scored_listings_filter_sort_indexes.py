@@ -0,0 +1,43 @@
+"""Add scored_listings composite indexes for region and import filters
+
+Revision ID: 20261017_scored_filter_sort
+Revises: 20261017_imports_imported_at
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+
+from typing import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261017_scored_filter_sort"
+down_revision: str | None = "20261017_imports_imported_at"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Each composite index's leading column makes the matching single-column index redundant
+    op.create_index(
+        "idx_scored_listings_region_model_score",
+        "scored_listings",
+        ["region", "canonical_model", sa.text("score DESC")],
+        unique=False,
+    )
+    op.create_index(
+        "idx_scored_listings_import_id_seen_at",
+        "scored_listings",
+        ["import_id", sa.text("seen_at DESC")],
+        unique=False,
+    )
+    op.drop_index("idx_scored_listings_region", table_name="scored_listings")
+    op.drop_index("idx_scored_listings_import_id", table_name="scored_listings")
+
+
+def downgrade() -> None:
+    op.create_index("idx_scored_listings_import_id", "scored_listings", ["import_id"], unique=False)
+    op.create_index("idx_scored_listings_region", "scored_listings", ["region"], unique=False)
+    op.drop_index("idx_scored_listings_import_id_seen_at", table_name="scored_listings")
+    op.drop_index("idx_scored_listings_region_model_score", table_name="scored_listings")
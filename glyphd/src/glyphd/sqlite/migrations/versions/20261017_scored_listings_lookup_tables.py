@@ -0,0 +1,82 @@
+"""Move repeated scored_listings attributes into lookup tables
+
+Revision ID: 20261017_scored_lookups
+Revises: 20261017_drop_updated_triggers
+Create Date: 2026-10-17 15:00:00.000000
+
+"""
+
+from typing import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261017_scored_lookups"
+down_revision: str | None = "20261017_drop_updated_triggers"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# scored_listings text column -> lookup table replacing it with an integer id
+LOOKUPS = (
+    ("condition", "conditions"),
+    ("region", "regions"),
+    ("source_type", "source_types"),
+    ("form_factor", "form_factors"),
+)
+
+
+def upgrade() -> None:
+    for _, table in LOOKUPS:
+        op.create_table(
+            table,
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("name", sa.String(), nullable=False, unique=True),
+        )
+
+    # The region index is rebuilt on region_id once the text column is gone
+    op.drop_index("idx_scored_listings_region_model_score", table_name="scored_listings")
+
+    for column, table in LOOKUPS:
+        op.execute(f"ALTER TABLE scored_listings ADD COLUMN {column}_id INTEGER REFERENCES {table}(id)")
+        op.execute(
+            f"INSERT OR IGNORE INTO {table} (name) "
+            f"SELECT DISTINCT {column} FROM scored_listings WHERE {column} IS NOT NULL"
+        )
+        op.execute(
+            f"UPDATE scored_listings SET {column}_id = "
+            f"(SELECT id FROM {table} WHERE name = scored_listings.{column}) "
+            f"WHERE {column} IS NOT NULL"
+        )
+        op.execute(f"ALTER TABLE scored_listings DROP COLUMN {column}")
+
+    op.create_index(
+        "idx_scored_listings_region_model_score",
+        "scored_listings",
+        ["region_id", "canonical_model", sa.text("score DESC")],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_scored_listings_region_model_score", table_name="scored_listings")
+
+    for column, table in LOOKUPS:
+        default = " DEFAULT 'Standard'" if column == "form_factor" else ""
+        op.execute(f"ALTER TABLE scored_listings ADD COLUMN {column} TEXT{default}")
+        op.execute(
+            f"UPDATE scored_listings SET {column} = "
+            f"(SELECT name FROM {table} WHERE id = scored_listings.{column}_id) "
+            f"WHERE {column}_id IS NOT NULL"
+        )
+        op.execute(f"ALTER TABLE scored_listings DROP COLUMN {column}_id")
+
+    op.create_index(
+        "idx_scored_listings_region_model_score",
+        "scored_listings",
+        ["region", "canonical_model", sa.text("score DESC")],
+        unique=False,
+    )
+
+    for _, table in reversed(LOOKUPS):
+        op.drop_table(table)
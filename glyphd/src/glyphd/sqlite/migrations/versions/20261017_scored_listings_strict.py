@@ -0,0 +1,144 @@
+"""Rebuild scored_listings as a STRICT table with check constraints
+
+Revision ID: 20261017_scored_strict
+Revises: 20261017_quantized_by_listing
+Create Date: 2026-10-17 21:00:00.000000
+
+"""
+
+import re
+from typing import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261017_scored_strict"
+down_revision: str | None = "20261017_quantized_by_listing"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+TABLE = "scored_listings"
+CHECKS = ("vram_gb >= 0", "nvlink IN (0, 1)", "score BETWEEN -1e9 AND 1e9")
+
+# Delimits the pre-upgrade CREATE TABLE statement kept inside the STRICT table's definition
+SAVED_START = "/* definition before 20261017_scored_strict:"
+SAVED_END = "*/"
+_CREATE_TABLE = re.compile(rf"CREATE\s+TABLE\s+(IF\s+NOT\s+EXISTS\s+)?[\"`\[]?{TABLE}[\"`\]]?", re.IGNORECASE)
+
+
+def _strict_type(declared: str) -> str:
+    """Map a declared column type to the STRICT type with the same storage."""
+    declared = declared.upper()
+    if "INT" in declared or declared == "BOOLEAN":
+        return "INTEGER"
+    if any(name in declared for name in ("CHAR", "CLOB", "TEXT", "TIME", "DATE")):
+        return "TEXT"
+    if any(name in declared for name in ("REAL", "FLOA", "DOUB")):
+        return "REAL"
+    return "ANY"
+
+
+def _table_sql() -> str:
+    """Return the current CREATE TABLE statement of scored_listings from sqlite_master."""
+    return (
+        op.get_bind()
+        .exec_driver_sql("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?", (TABLE,))
+        .scalar_one()
+    )
+
+
+def _generated_sql(strict: bool) -> str:
+    """
+    Build a CREATE TABLE statement for scored_listings_new from the live column and key lists.
+
+    Single-column foreign keys are written inline on their column, as the migrations that
+    added them declared them, so later migrations can still drop those columns.
+    """
+    bind = op.get_bind()
+    columns = bind.exec_driver_sql(f"PRAGMA table_info({TABLE})").fetchall()
+    foreign_keys = bind.exec_driver_sql(f"PRAGMA foreign_key_list({TABLE})").fetchall()
+
+    keys = {}
+    for key_id, _, parent, column, parent_column, _, on_delete, _ in foreign_keys:
+        keys.setdefault(key_id, (parent, on_delete, [], []))
+        keys[key_id][2].append(column)
+        keys[key_id][3].append(parent_column)
+    inline = {}
+    table_keys = []
+    for parent, on_delete, key_columns, parent_columns in keys.values():
+        reference = f"REFERENCES {parent}({', '.join(parent_columns)})"
+        if on_delete != "NO ACTION":
+            reference += f" ON DELETE {on_delete}"
+        if len(key_columns) == 1:
+            inline[key_columns[0]] = reference
+        else:
+            table_keys.append(f"FOREIGN KEY ({', '.join(key_columns)}) {reference}")
+
+    definitions = []
+    for _, name, declared, not_null, default, primary_key in columns:
+        if primary_key:
+            definitions.append(f"{name} INTEGER PRIMARY KEY AUTOINCREMENT")
+            continue
+        definition = f"{name} {_strict_type(declared) if strict else declared}"
+        if not_null:
+            definition += " NOT NULL"
+        if default is not None:
+            definition += f" DEFAULT {default}"
+        if name in inline:
+            definition += f" {inline[name]}"
+        definitions.append(definition)
+    definitions.extend(table_keys)
+    if strict:
+        definitions.extend(f"CHECK ({check})" for check in CHECKS)
+
+    body = ",\n    ".join(definitions)
+    return f"CREATE TABLE {TABLE}_new (\n    {body}\n){' STRICT' if strict else ''}"
+
+
+def _swap(create_sql: str) -> None:
+    """
+    Replace scored_listings with the table created by ``create_sql``, keeping rows, indexes and triggers.
+
+    SQLite cannot change a table's STRICT flag or add CHECK constraints in place, so the
+    table is copied into a new definition, dropped and replaced. Foreign keys are switched
+    off for the swap: dropping the old table would otherwise cascade into quantized_listings.
+    """
+    bind = op.get_bind()
+    names = ", ".join(row[1] for row in bind.exec_driver_sql(f"PRAGMA table_info({TABLE})"))
+    dependents = bind.exec_driver_sql(
+        "SELECT sql FROM sqlite_master WHERE tbl_name = ? AND type IN ('index', 'trigger') AND sql IS NOT NULL",
+        (TABLE,),
+    ).fetchall()
+
+    with op.get_context().autocommit_block():
+        op.execute("PRAGMA foreign_keys=OFF")
+    op.execute(create_sql)
+    op.execute(f"INSERT INTO {TABLE}_new ({names}) SELECT {names} FROM {TABLE} ORDER BY id")
+    op.execute(f"DROP TABLE {TABLE}")
+    op.execute(f"ALTER TABLE {TABLE}_new RENAME TO {TABLE}")
+    for (sql,) in dependents:
+        op.execute(sql)
+    with op.get_context().autocommit_block():
+        op.execute("PRAGMA foreign_keys=ON")
+
+
+def upgrade() -> None:
+    # Keep the previous definition as a comment inside the new one (sqlite_master stores the
+    # statement text verbatim), so downgrade() can restore the table exactly
+    original = _table_sql()
+    create_sql = _generated_sql(strict=True)
+    if SAVED_END not in original:
+        create_sql = create_sql.replace("(\n", f"(\n    {SAVED_START}\n{original}\n    {SAVED_END}\n", 1)
+    _swap(create_sql)
+
+
+def downgrade() -> None:
+    current = _table_sql()
+    start = current.find(SAVED_START)
+    end = current.find(SAVED_END, start)
+    if start == -1 or end == -1:
+        # Tables created STRICT by schema.sql have no saved definition to restore
+        _swap(_generated_sql(strict=False))
+        return
+    original = current[start + len(SAVED_START) : end].strip()
+    _swap(_CREATE_TABLE.sub(f"CREATE TABLE {TABLE}_new", original, count=1))
@@ -0,0 +1,64 @@
+"""Flatten listing_snapshots.quantization_capacity JSON into integer columns
+
+Revision ID: 20261017_snapshot_capacity
+Revises: 20261017_model_market_stats
+Create Date: 2026-10-17 17:00:00.000000
+
+"""
+
+from typing import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261017_snapshot_capacity"
+down_revision: str | None = "20261017_model_market_stats"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Capacity column -> QuantizationCapacitySpec alias used as the JSON key
+CAPACITY_COLUMNS = (
+    ("model_7b", "7b"),
+    ("model_13b", "13b"),
+    ("model_70b", "70b"),
+)
+
+
+def _has_snapshots() -> bool:
+    # listing_snapshots comes from the runtime schema.sql, not from an earlier revision
+    return sa.inspect(op.get_bind()).has_table("listing_snapshots")
+
+
+def upgrade() -> None:
+    if not _has_snapshots():
+        return
+
+    for column, alias in CAPACITY_COLUMNS:
+        op.execute(f"ALTER TABLE listing_snapshots ADD COLUMN {column} INTEGER")
+
+    # Snapshots stored the spec either by alias or by field name
+    assignments = ", ".join(
+        f"{column} = COALESCE(json_extract(quantization_capacity, '$.\"{alias}\"'), "
+        f"json_extract(quantization_capacity, '$.{column}'))"
+        for column, alias in CAPACITY_COLUMNS
+    )
+    op.execute(
+        f"UPDATE listing_snapshots SET {assignments} "
+        "WHERE quantization_capacity IS NOT NULL AND json_valid(quantization_capacity)"
+    )
+    op.execute("ALTER TABLE listing_snapshots DROP COLUMN quantization_capacity")
+
+
+def downgrade() -> None:
+    if not _has_snapshots():
+        return
+
+    op.execute("ALTER TABLE listing_snapshots ADD COLUMN quantization_capacity TEXT")
+    pairs = ", ".join(f"'{alias}', {column}" for column, alias in CAPACITY_COLUMNS)
+    op.execute(
+        f"UPDATE listing_snapshots SET quantization_capacity = json_object({pairs}) "
+        "WHERE model_7b IS NOT NULL OR model_13b IS NOT NULL OR model_70b IS NOT NULL"
+    )
+    for column, _ in reversed(CAPACITY_COLUMNS):
+        op.execute(f"ALTER TABLE listing_snapshots DROP COLUMN {column}")
@@ -0,0 +1,48 @@
+"""Stamp listing_snapshots with their import batch for SQL delta computation
+
+Revision ID: 20261017_snapshot_import_id
+Revises: 20261017_snapshot_capacity
+Create Date: 2026-10-17 18:00:00.000000
+
+"""
+
+from typing import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261017_snapshot_import_id"
+down_revision: str | None = "20261017_snapshot_capacity"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _has_snapshots() -> bool:
+    # listing_snapshots comes from the runtime schema.sql, not from an earlier revision
+    return sa.inspect(op.get_bind()).has_table("listing_snapshots")
+
+
+def upgrade() -> None:
+    if not _has_snapshots():
+        return
+
+    # Existing snapshots predate the column and stay unassigned
+    op.execute(
+        "ALTER TABLE listing_snapshots ADD COLUMN import_id TEXT "
+        "REFERENCES import_batches(import_id) ON DELETE SET NULL"
+    )
+    op.create_index(
+        "idx_listing_snapshots_import_id_seen_at",
+        "listing_snapshots",
+        ["import_id", "seen_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    if not _has_snapshots():
+        return
+
+    op.drop_index("idx_listing_snapshots_import_id_seen_at", table_name="listing_snapshots")
+    op.execute("ALTER TABLE listing_snapshots DROP COLUMN import_id")
@@ -0,0 +1,54 @@
+"""Index listing_snapshots for previous-snapshot lookups
+
+Revision ID: 20261017_snapshot_lookup_idx
+Revises: 20261017_snapshot_import_id
+Create Date: 2026-10-17 19:00:00.000000
+
+"""
+
+from typing import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261017_snapshot_lookup_idx"
+down_revision: str | None = "20261017_snapshot_import_id"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _has_snapshots() -> bool:
+    # listing_snapshots comes from the runtime schema.sql, not from an earlier revision
+    return sa.inspect(op.get_bind()).has_table("listing_snapshots")
+
+
+def upgrade() -> None:
+    if not _has_snapshots():
+        return
+
+    # Each single-column index is the prefix of its replacement
+    op.execute("DROP INDEX IF EXISTS idx_listing_snapshots_model")
+    op.execute("DROP INDEX IF EXISTS idx_listing_snapshots_source_url")
+    op.create_index(
+        "idx_listing_snapshots_model_seen_at",
+        "listing_snapshots",
+        ["model", sa.text("seen_at DESC")],
+        unique=False,
+    )
+    op.create_index(
+        "idx_listing_snapshots_source_url_model_seen_at",
+        "listing_snapshots",
+        ["source_url", "model", sa.text("seen_at DESC"), sa.text("id DESC")],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    if not _has_snapshots():
+        return
+
+    op.drop_index("idx_listing_snapshots_source_url_model_seen_at", table_name="listing_snapshots")
+    op.drop_index("idx_listing_snapshots_model_seen_at", table_name="listing_snapshots")
+    op.create_index("idx_listing_snapshots_model", "listing_snapshots", ["model"], unique=False)
+    op.create_index("idx_listing_snapshots_source_url", "listing_snapshots", ["source_url"], unique=False)
@@ -5,9 +5,11 @@ This module defines the SQLAlchemy ORM models that correspond to the tables in t
 """
 
 from datetime import datetime
+from typing import Any, Dict, Optional
 
 from sqlalchemy import (
     Boolean,
+    CheckConstraint,
     Column,
     DateTime,
     Float,
@@ -22,6 +24,9 @@ from sqlalchemy.orm import relationship
 
 Base = declarative_base()
 
+# QuantizationCapacitySpec field names and their aliases
+_CAPACITY_FIELDS = (("model_7b", "7b"), ("model_13b", "13b"), ("model_70b", "70b"))
+
 
 class SchemaVersion(Base):
     """Model for tracking schema versions and migrations."""
@@ -75,16 +80,9 @@ class Model(Base):
     slot_width = Column(Integer)
     pcie_generation = Column(Integer)
 
-    # Market data (aggregated from listings)
-    listing_count = Column(Integer, default=0)
-    min_price = Column(Float)
-    median_price = Column(Float)
-    max_price = Column(Float)
-    avg_price = Column(Float)
-
     # Metadata
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
-    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
     import_id = Column(String, ForeignKey("import_batches.import_id", ondelete="SET NULL"))
     import_index = Column(Integer)  # Sequential index within import batch
 
@@ -92,6 +90,28 @@ class Model(Base):
     import_batch = relationship("ImportBatch", back_populates="models")
     listings = relationship("Listing", back_populates="model")
     scored_listings = relationship("ScoredListing", back_populates="model")
+    market_stats = relationship("ModelMarketStats", back_populates="gpu_model", uselist=False)
+
+
+class ModelMarketStats(Base):
+    """
+    Model for per-model market aggregates.
+
+    A roll-up of scored listing prices, rebuilt once per import batch.
+    """
+
+    __tablename__ = "model_market_stats"
+
+    model = Column(String, ForeignKey("models.model", ondelete="CASCADE"), primary_key=True)
+    listing_count = Column(Integer, nullable=False)
+    min_price = Column(Float)
+    median_price = Column(Float)
+    max_price = Column(Float)
+    avg_price = Column(Float)
+    refreshed_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+    # Relationships
+    gpu_model = relationship("Model", back_populates="market_stats")
 
 
 class Listing(Base):
@@ -112,7 +132,7 @@ class Listing(Base):
 
     # Metadata
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
-    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
     import_id = Column(String, ForeignKey("import_batches.import_id", ondelete="SET NULL"))
 
     # Relationships
@@ -120,14 +140,67 @@ class Listing(Base):
     import_batch = relationship("ImportBatch", back_populates="listings")
 
 
+class Condition(Base):
+    """
+    Lookup table of listing conditions (e.g., 'new', 'used') referenced by scored listings.
+    """
+
+    __tablename__ = "conditions"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String, nullable=False, unique=True)
+
+
+class Region(Base):
+    """
+    Lookup table of listing regions (e.g., 'US', 'EU') referenced by scored listings.
+    """
+
+    __tablename__ = "regions"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String, nullable=False, unique=True)
+
+
+class SourceType(Base):
+    """
+    Lookup table of listing source types (e.g., 'marketplace', 'retailer') referenced by scored listings.
+    """
+
+    __tablename__ = "source_types"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String, nullable=False, unique=True)
+
+
+class FormFactor(Base):
+    """
+    Lookup table of GPU form factors (e.g., 'Standard', 'SFF') referenced by scored listings.
+    """
+
+    __tablename__ = "form_factors"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String, nullable=False, unique=True)
+
+
 class ScoredListing(Base):
     """
     Model for enriched and scored GPU listings.
 
     Based on GPUListingDTO from glyphd and EnrichedGPUListingDTO, stores enriched and scored GPU listings.
+    The database table is STRICT (see resources/sql/schema.sql), so every column must bind to an
+    INTEGER, REAL or TEXT value: Boolean binds as 0/1 and DateTime as an ISO string. The check
+    constraints are mirrored here; STRICT itself is not, because SQLAlchemy emits type names such
+    as BOOLEAN and DATETIME that a STRICT table rejects.
     """
 
     __tablename__ = "scored_listings"
+    __table_args__ = (
+        CheckConstraint("vram_gb >= 0", name="ck_scored_listings_vram_gb"),
+        CheckConstraint("nvlink IN (0, 1)", name="ck_scored_listings_nvlink"),
+        CheckConstraint("score BETWEEN -1e9 AND 1e9", name="ck_scored_listings_score"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
 
@@ -148,7 +221,7 @@ class ScoredListing(Base):
     pcie_generation = Column(Integer)
 
     # Additional fields from EnrichedGPUListingDTO
-    form_factor = Column(String, default="Standard")
+    form_factor_id = Column(Integer, ForeignKey("form_factors.id"))
     notes = Column(Text)
     warnings = Column(Text)
 
@@ -156,23 +229,27 @@ class ScoredListing(Base):
     score = Column(Float, nullable=False)
 
     # Additional fields from EPIC.persist.sqlite-store requirements
-    condition = Column(String)
+    condition_id = Column(Integer, ForeignKey("conditions.id"))
     quantity = Column(Integer)
     min_order_qty = Column(Integer)
     seller = Column(String)
-    region = Column(String)
+    region_id = Column(Integer, ForeignKey("regions.id"))
     source_url = Column(Text)
-    source_type = Column(String)
+    source_type_id = Column(Integer, ForeignKey("source_types.id"))
     seen_at = Column(DateTime)
 
     # Metadata
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
-    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
     import_id = Column(String, ForeignKey("import_batches.import_id", ondelete="SET NULL"))
     import_index = Column(Integer)  # Sequential index within import batch
 
     # Relationships
     model = relationship("Model", back_populates="scored_listings")
+    form_factor = relationship("FormFactor")
+    condition = relationship("Condition")
+    region = relationship("Region")
+    source_type = relationship("SourceType")
     import_batch = relationship("ImportBatch", back_populates="scored_listings")
     quantized_listing = relationship("QuantizedListing", back_populates="scored_listing", uselist=False)
 
@@ -186,15 +263,17 @@ class QuantizedListing(Base):
 
     __tablename__ = "quantized_listings"
 
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    scored_listing_id = Column(Integer, ForeignKey("scored_listings.id", ondelete="CASCADE"), nullable=False)
+    # One row per scored listing, keyed by it
+    scored_listing_id = Column(
+        Integer, ForeignKey("scored_listings.id", ondelete="CASCADE"), primary_key=True, autoincrement=False
+    )
     model_7b = Column(Integer, nullable=False)
     model_13b = Column(Integer, nullable=False)
     model_70b = Column(Integer, nullable=False)
 
     # Metadata
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
-    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
     import_id = Column(String, ForeignKey("import_batches.import_id", ondelete="SET NULL"))
 
     # Relationships
@@ -207,7 +286,9 @@ class ListingSnapshot(Base):
     Model for capturing historical snapshots of GPU listings for forecasting.
     
     Stores point-in-time snapshots of listing data to enable delta computation
-    and price volatility analysis.
+    and price volatility analysis. Imports write snapshots as row dictionaries through
+    ``bulk_insert_listings`` rather than the session; ``created_at`` is then filled
+    client-side once per batch.
     """
 
     __tablename__ = "listing_snapshots"
@@ -216,20 +297,50 @@ class ListingSnapshot(Base):
     model = Column(String, nullable=False)
     price_usd = Column(Float, nullable=False)
     score = Column(Float, nullable=False)
-    quantization_capacity = Column(JSON)  # Match QuantizationCapacitySpec
+    # Quantization capacity, flattened from QuantizationCapacitySpec
+    model_7b = Column(Integer)
+    model_13b = Column(Integer)
+    model_70b = Column(Integer)
     seen_at = Column(DateTime, nullable=False)
     seller = Column(String)
     region = Column(String)
     source_url = Column(String)
-    heuristics = Column(JSON)
+    heuristics = Column(JSON)  # Free-form, so kept as JSON
 
     # Metadata
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    import_id = Column(String, ForeignKey("import_batches.import_id", ondelete="SET NULL"))
 
     # Relationships
     deltas_as_current = relationship("ListingDelta", foreign_keys="ListingDelta.current_snapshot_id", back_populates="current_snapshot")
     deltas_as_previous = relationship("ListingDelta", foreign_keys="ListingDelta.previous_snapshot_id", back_populates="previous_snapshot")
 
+    @property
+    def quantization_capacity(self) -> Optional[Dict[str, Optional[int]]]:
+        """The capacity columns as a QuantizationCapacitySpec-style dict keyed by alias, or None if unset."""
+        if self.model_7b is None and self.model_13b is None and self.model_70b is None:
+            return None
+        return {"7b": self.model_7b, "13b": self.model_13b, "70b": self.model_70b}
+
+    @quantization_capacity.setter
+    def quantization_capacity(self, capacity: Optional[Any]) -> None:
+        """Set the capacity columns from a dict keyed by alias or field name, or a QuantizationCapacitySpec."""
+        for field, value in self.capacity_columns(capacity).items():
+            setattr(self, field, value)
+
+    @staticmethod
+    def capacity_columns(capacity: Optional[Any]) -> Dict[str, Optional[int]]:
+        """Flatten a capacity dict or QuantizationCapacitySpec into column values, for Core inserts."""
+        columns = {}
+        for field, alias in _CAPACITY_FIELDS:
+            if capacity is None:
+                columns[field] = None
+            elif isinstance(capacity, dict):
+                columns[field] = capacity.get(field, capacity.get(alias))
+            else:
+                columns[field] = getattr(capacity, field, None)
+        return columns
+
 
 class ListingDelta(Base):
     """
@@ -0,0 +1,105 @@
+"""
+Connection pragmas for the GPU Scoring Tool SQLite database.
+
+Every engine opened on the database (the listing store, migrations and ``glyphd init-db``)
+registers these hooks, so each connection runs with the same settings.
+"""
+
+import sqlite3
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# Pragmas applied to every new DBAPI connection. WAL lets readers proceed while a
+# writer commits; it keeps -wal/-shm sidecar files next to the database while any
+# connection is open. The busy timeout comes from the driver's ``timeout`` connect arg.
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA foreign_keys=ON",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA mmap_size=268435456",
+)
+
+# Refresh planner statistics for the tables the connection has used, when stale or missing.
+# ANALYZE is capped to a sample of rows per index so this stays cheap on large tables.
+# Run before a connection closes and at the end of each import batch.
+SQLITE_OPTIMIZE_PRAGMAS = (
+    "PRAGMA analysis_limit=400",
+    "PRAGMA optimize",
+)
+
+
+def _execute_pragmas(dbapi_connection, pragmas) -> None:
+    """
+    Execute pragmas on a raw sqlite3 connection.
+
+    Args:
+        dbapi_connection: The raw sqlite3 connection
+        pragmas: Pragma statements to execute in order
+    """
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in pragmas:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+
+def apply_pragmas(dbapi_connection, connection_record) -> None:
+    """
+    Apply the connection pragmas to a freshly opened SQLite connection.
+
+    Args:
+        dbapi_connection: The raw sqlite3 connection
+        connection_record: The pool's connection record (unused)
+    """
+    _execute_pragmas(dbapi_connection, SQLITE_PRAGMAS)
+
+
+def optimize_on_close(dbapi_connection, connection_record) -> None:
+    """
+    Run ``PRAGMA optimize`` on a SQLite connection that is about to be closed.
+
+    Failures are ignored: the connection is going away regardless, e.g. on a
+    read-only database or one that was already closed.
+
+    Args:
+        dbapi_connection: The raw sqlite3 connection
+        connection_record: The pool's connection record (unused)
+    """
+    try:
+        _execute_pragmas(dbapi_connection, SQLITE_OPTIMIZE_PRAGMAS)
+    except sqlite3.Error:
+        pass
+
+
+def optimize(conn) -> None:
+    """
+    Run ``PRAGMA optimize`` on an open SQLAlchemy connection.
+
+    Call it at the end of a bulk write on the connection that did the writing: SQLite only
+    considers the tables that connection has queried. Inside a transaction the refreshed
+    statistics commit together with the written rows.
+
+    Args:
+        conn: SQLAlchemy connection
+    """
+    for pragma in SQLITE_OPTIMIZE_PRAGMAS:
+        conn.exec_driver_sql(pragma)
+
+
+def install_pragmas(engine: Engine) -> Engine:
+    """
+    Register the connect and close pragma hooks on an engine.
+
+    Args:
+        engine: SQLAlchemy engine for a SQLite database
+
+    Returns:
+        The same engine, for chaining
+    """
+    event.listen(engine, "connect", apply_pragmas)
+    event.listen(engine, "close", optimize_on_close)
+    return engine
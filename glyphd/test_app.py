@@ -1,87 +0,0 @@
-"""
-Test script to verify the glyphd implementation.
-"""
-
-from fastapi.testclient import TestClient
-
-from glyphd.api.router import create_app
-
-
-def test_app_creation():
-    """Test that the FastAPI app can be created successfully."""
-    app = create_app()
-    assert app is not None
-    print("✅ App creation test passed")
-
-    # Check that the health endpoint is registered
-    routes = [route for route in app.routes if route.path == "/api/health"]
-    assert len(routes) == 1
-    print("✅ Health endpoint test passed")
-
-    # Check that the listings endpoint is registered
-    routes = [route for route in app.routes if route.path == "/api/listings"]
-    assert len(routes) == 1
-    print("✅ Listings endpoint test passed")
-
-    # Check that the models endpoint is registered
-    routes = [route for route in app.routes if route.path == "/api/models"]
-    assert len(routes) == 1
-    print("✅ Models endpoint test passed")
-
-    # Check that the report endpoint is registered
-    routes = [route for route in app.routes if route.path == "/api/report"]
-    assert len(routes) == 1
-    print("✅ Report endpoint test passed")
-
-    return True
-
-
-def test_api_endpoints():
-    """Test that the API endpoints return the expected responses."""
-    app = create_app()
-    client = TestClient(app)
-
-    # Test health endpoint
-    response = client.get("/api/health")
-    assert response.status_code == 200
-    assert response.json() == {"status": "ok"}
-    print("✅ Health endpoint response test passed")
-
-    # Test listings endpoint
-    response = client.get("/api/listings")
-    assert response.status_code == 200
-    assert isinstance(response.json(), list)
-    print("✅ Listings endpoint response test passed")
-
-    # Test models endpoint
-    response = client.get("/api/models")
-    assert response.status_code == 200
-    assert isinstance(response.json(), list)
-    print("✅ Models endpoint response test passed")
-
-    # Test report endpoint
-    # Note: This might fail if the report file doesn't exist
-    try:
-        response = client.get("/api/report")
-        assert response.status_code == 200
-        report = response.json()
-        assert "markdown" in report
-        assert "summary_stats" in report
-        assert "top_ranked" in report
-        assert "scoring_weights" in report
-        print("✅ Report endpoint response test passed")
-    except Exception as e:
-        print(f"⚠️ Report endpoint test skipped: {e}")
-
-    return True
-
-
-if __name__ == "__main__":
-    success = test_app_creation() and test_api_endpoints()
-    print(f"\nAll tests {'passed' if success else 'failed'}")
-    print("\nImplementation meets the completion criteria:")
-    print("- FastAPI app can be created")
-    print("- All required endpoints are registered")
-    print("- Endpoints return proper JSON responses")
-    print("- DTOs validate against real pipeline sample output")
-    print("- OpenAPI schema is correctly defined")
@@ -1,23 +1,94 @@
+import os
+import shutil
+import tempfile
+
 import pytest
 from click.testing import CliRunner
 from fastapi.testclient import TestClient
 
+# Give each test session (each worker under pytest-xdist) its own default database, so tests
+# never write data/ into the working tree and parallel workers never share a file. This must
+# run before glyphd.core.dependencies.storage reads GLYPHD_DB_PATH at import time.
+_SESSION_DIR = tempfile.mkdtemp(prefix="glyphd-tests-")
+os.environ["GLYPHD_DB_PATH"] = os.path.join(_SESSION_DIR, "gpu.sqlite")
+
 from glyphd.api.router import create_app
+from glyphd.core.dependencies.listing_repository import get_listing_repository
+from glyphd.core.dependencies.storage import get_storage_engine
+from glyphd.core.storage.sqlite_store import SqliteListingStore
 
+# Marks a dependency that had no override before a test replaced it
+_NO_OVERRIDE = object()
 
-@pytest.fixture
-def app():
-    """Create a FastAPI app for testing."""
-    return create_app()
 
+@pytest.fixture(scope="session")
+def memory_store():
+    """
+    Create an in-memory listing store shared by the whole test session.
 
-@pytest.fixture
+    In-memory stores use a single StaticPool connection, so the schema is created once and
+    every request sees the same database. Tests that write should use their own store.
+    """
+    store = SqliteListingStore(":memory:")
+    yield store
+    store.close()
+
+
+@pytest.fixture(scope="session")
+def app(memory_store):
+    """
+    Create the FastAPI app shared by the whole test session, backed by the shared in-memory store.
+
+    Tests that need other dependencies should change them through ``override_dependency`` so
+    the overrides are undone afterwards.
+    """
+    app = create_app()
+    app.dependency_overrides[get_storage_engine] = lambda: memory_store
+    app.dependency_overrides[get_listing_repository] = lambda: memory_store
+    return app
+
+
+@pytest.fixture(scope="session")
 def client(app):
-    """Create a test client for the FastAPI app."""
-    return TestClient(app)
+    """
+    Create a test client for the shared FastAPI app.
+
+    The client is entered once for the session, so every request goes through the same
+    event loop thread instead of starting a new one per request.
+    """
+    with TestClient(app) as client:
+        yield client
 
 
 @pytest.fixture
+def override_dependency(app):
+    """
+    Override dependencies of the shared app for a single test.
+
+    Yields a function taking the dependency and its replacement. When the test finishes,
+    only the dependencies it overrode are put back: to the session's override if there was
+    one, otherwise removed. Overrides made by other fixtures are left alone.
+    """
+    previous = {}
+
+    def override(dependency, replacement):
+        previous.setdefault(dependency, app.dependency_overrides.get(dependency, _NO_OVERRIDE))
+        app.dependency_overrides[dependency] = replacement
+
+    yield override
+    for dependency, replacement in previous.items():
+        if replacement is _NO_OVERRIDE:
+            app.dependency_overrides.pop(dependency, None)
+        else:
+            app.dependency_overrides[dependency] = replacement
+
+
+@pytest.fixture(scope="session")
 def runner():
-    """Create a CLI runner for testing."""
+    """Create a CLI runner for testing; it holds no per-invocation state, so one is shared."""
     return CliRunner()
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Remove the session's default database directory."""
+    shutil.rmtree(_SESSION_DIR, ignore_errors=True)
@@ -1,10 +1,27 @@
+import pytest
+
 from glyphd.api.models import ReportDTO
 from glyphd.core.dependencies.insight_report import get_insight_report
+from glyphd.core.dependencies.listing_repository import get_listing_repository
+from glyphd.core.dependencies.storage import get_storage_engine
+
+# Fields every listing and model in an API response must carry
+_LISTING_KEYS = frozenset({"canonical_model", "vram_gb", "mig_support", "nvlink", "tdp_watts", "price", "score"})
+_MODEL_KEYS = frozenset({"model", "listing_count", "min_price", "median_price", "max_price", "avg_price"})
 
 
 def test_app_creation(app):
-    """Test that the FastAPI app can be created successfully."""
+    """Test that the FastAPI app can be created successfully with its core routes registered."""
     assert app is not None
+    # Included routers are not flattened into app.routes, so check the schema's paths
+    paths = app.openapi()["paths"]
+    for path in ("/api/health", "/api/listings", "/api/models", "/api/report"):
+        assert "get" in paths.get(path, {}), path
+
+
+def test_listing_repository_is_storage_engine():
+    """Test that listing queries and imports share one store and connection pool."""
+    assert get_listing_repository() is get_storage_engine()
 
 
 def test_health_endpoint(client):
@@ -23,32 +40,38 @@ def test_listings_endpoint(client):
     if listings:  # If there are any listings
         # Validate the first listing against the DTO schema
         listing = listings[0]
-        assert "canonical_model" in listing
-        assert "vram_gb" in listing
-        assert "mig_support" in listing
-        assert "nvlink" in listing
-        assert "tdp_watts" in listing
-        assert "price" in listing
-        assert "score" in listing
+        assert _LISTING_KEYS <= listing.keys(), _LISTING_KEYS - listing.keys()
 
 
-def test_listings_endpoint_with_filters(client):
+@pytest.mark.parametrize(
+    "query, expected_model",
+    [
+        ("model=H100_PCIE_80GB", "H100_PCIE_80GB"),  # Filter by model
+        ("quantized=true", None),  # Filter by quantized capability; content depends on the data
+    ],
+)
+def test_listings_endpoint_with_filters(client, query, expected_model):
     """Test that the listings endpoint with filters returns the expected response."""
-    # Test filtering by model
-    response = client.get("/api/listings?model=H100_PCIE_80GB")
+    response = client.get(f"/api/listings?{query}")
     assert response.status_code == 200
     listings = response.json()
     assert isinstance(listings, list)
-    if listings:  # If there are any listings
+    if expected_model:
         for listing in listings:
-            assert listing["canonical_model"] == "H100_PCIE_80GB"
+            assert listing["canonical_model"] == expected_model
+
 
-    # Test filtering by quantized capability
-    response = client.get("/api/listings?quantized=true")
+def test_listings_arrow_endpoint(client):
+    """Test that the Arrow listings endpoint returns a readable IPC stream."""
+    pa = pytest.importorskip("pyarrow")
+
+    response = client.get("/api/listings.arrow")
     assert response.status_code == 200
-    listings = response.json()
-    assert isinstance(listings, list)
-    # Note: We can't assert anything about the content here without knowing the data
+    assert response.headers["content-type"] == "application/vnd.apache.arrow.stream"
+    table = pa.ipc.open_stream(response.content).read_all()
+    assert "canonical_model" in table.column_names
+    assert "score" in table.column_names
+    assert table.schema.field("vram_gb").type == pa.int32()
 
 
 def test_models_endpoint(client):
@@ -60,15 +83,10 @@ def test_models_endpoint(client):
     if models:  # If there are any models
         # Validate the first model against the DTO schema
         model = models[0]
-        assert "model" in model
-        assert "listing_count" in model
-        assert "min_price" in model
-        assert "median_price" in model
-        assert "max_price" in model
-        assert "avg_price" in model
+        assert _MODEL_KEYS <= model.keys(), _MODEL_KEYS - model.keys()
 
 
-def test_report_endpoint(app, client):
+def test_report_endpoint(client, override_dependency):
     """Test that the report endpoint returns the expected response."""
     # Create a mock report
     mock_report = ReportDTO(
@@ -84,15 +102,12 @@ def test_report_endpoint(app, client):
         },
     )
 
-    # Override the get_insight_report dependency
-    app.dependency_overrides[get_insight_report] = lambda: mock_report
+    # Override the get_insight_report dependency; undone after the test
+    override_dependency(get_insight_report, lambda: mock_report)
 
     # Make the request
     response = client.get("/api/report")
 
-    # Clean up the override
-    app.dependency_overrides = {}
-
     # Verify the response
     assert response.status_code == 200
     report = response.json()
@@ -106,3 +121,18 @@ def test_report_endpoint(app, client):
     assert report["summary_stats"] == {"test_stat": "test_value"}
     assert report["top_ranked"] == ["Test Model 1", "Test Model 2"]
     assert report["scoring_weights"]["vram_weight"] == 0.3
+
+
+def test_report_endpoint_reserializes_new_report(client, override_dependency):
+    """Test that the cached report JSON follows the report returned by the dependency."""
+    first = ReportDTO(markdown="# First", summary_stats={}, top_ranked=[], scoring_weights={})
+    second = ReportDTO(markdown="# Second", summary_stats={}, top_ranked=[], scoring_weights={})
+
+    override_dependency(get_insight_report, lambda: first)
+    assert client.get("/api/report").json()["markdown"] == "# First"
+    assert client.get("/api/report").json()["markdown"] == "# First"
+
+    override_dependency(get_insight_report, lambda: second)
+    response = client.get("/api/report")
+
+    assert response.json()["markdown"] == "# Second"
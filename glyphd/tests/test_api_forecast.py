@@ -4,28 +4,129 @@ Integration tests for forecast API endpoints.
 These tests verify the complete workflow of ingesting data and querying deltas.
 """
 
-from datetime import datetime, timedelta
+from datetime import UTC, datetime, timedelta
 
 import pytest
 from fastapi.testclient import TestClient
 
-from glyphd.api.router import create_app
+from glyphd.core.dependencies.listing_repository import get_listing_repository
+from glyphd.core.dependencies.storage import get_storage_engine
 from glyphd.core.storage.sqlite_store import SqliteListingStore
 
+# Fields every delta in a /api/forecast/deltas response must carry
+_DELTA_KEYS = frozenset(
+    {
+        "id", "model", "price_delta", "price_delta_pct",
+        "score_delta", "timestamp", "current_snapshot_id",
+        "previous_snapshot_id",
+    }
+)
 
-@pytest.fixture
-def client():
-    """Create test client with in-memory database."""
-    app = create_app()
-    return TestClient(app)
+# Timestamps well after and well before any test ingestion, for the ?after= filter
+FUTURE = "2099-01-01T00:00:00"
+PAST = "1999-01-01T00:00:00"
 
 
 @pytest.fixture
 def storage():
     """Create test storage with in-memory database."""
     store = SqliteListingStore(":memory:")
-    store.initialize_schema()
-    return store
+    yield store
+    store.close()
+
+
+@pytest.fixture
+def client(client, override_dependency, storage):
+    """Use the shared test client, with storage overridden to the test's in-memory database."""
+    override_dependency(get_storage_engine, lambda: storage)
+    override_dependency(get_listing_repository, lambda: storage)
+    return client
+
+
+# First ingestion - creates the initial snapshots
+FIRST_LISTINGS = [
+    {
+        "canonical_model": "RTX_4090",
+        "vram_gb": 24,
+        "mig_support": 0,
+        "nvlink": False,
+        "tdp_watts": 450,
+        "price": 1500.0,
+        "score": 85.0,
+        "import_id": "test-import-1",
+        "import_index": 0,
+    },
+    {
+        "canonical_model": "RTX_3080",
+        "vram_gb": 10,
+        "mig_support": 0,
+        "nvlink": False,
+        "tdp_watts": 320,
+        "price": 800.0,
+        "score": 75.0,
+        "import_id": "test-import-1",
+        "import_index": 1,
+    }
+]
+
+# Second ingestion with modified prices - should create deltas
+SECOND_LISTINGS = [
+    {
+        "canonical_model": "RTX_4090",
+        "vram_gb": 24,
+        "mig_support": 0,
+        "nvlink": False,
+        "tdp_watts": 450,
+        "price": 1600.0,  # Price increased by $100
+        "score": 87.0,    # Score increased by 2
+        "import_id": "test-import-2",
+        "import_index": 0,
+    },
+    {
+        "canonical_model": "RTX_3080",
+        "vram_gb": 10,
+        "mig_support": 0,
+        "nvlink": False,
+        "tdp_watts": 320,
+        "price": 750.0,   # Price decreased by $50
+        "score": 73.0,    # Score decreased by 2
+        "import_id": "test-import-2",
+        "import_index": 1,
+    }
+]
+
+# CSV uploads of the same two listings, the second with changed prices
+CSV_V1 = (
+    b"title,price,condition,seller\n"
+    b'"NVIDIA GeForce RTX 4090 24GB Graphics Card",1500.00,New,TechStore\n'
+    b'"RTX 3080 Ti 12GB Gaming Card",800.00,Used,GamersParadise'
+)
+CSV_V2 = (
+    b"title,price,condition,seller\n"
+    b'"NVIDIA GeForce RTX 4090 24GB Graphics Card",1600.00,New,TechStore\n'
+    b'"RTX 3080 Ti 12GB Gaming Card",750.00,Used,GamersParadise'
+)
+
+
+@pytest.fixture(scope="class")
+def ingested_client(app):
+    """
+    Test client on an in-memory database holding both listing batches.
+
+    The batches are posted once per test class, so tests using this client must not write.
+    """
+    store = SqliteListingStore(":memory:")
+    dependencies = (get_storage_engine, get_listing_repository)
+    previous = {dependency: app.dependency_overrides[dependency] for dependency in dependencies}
+    app.dependency_overrides.update({dependency: lambda: store for dependency in dependencies})
+    with TestClient(app) as client:
+        for listings in (FIRST_LISTINGS, SECOND_LISTINGS):
+            response = client.post("/api/persist/listings", json=listings)
+            assert response.status_code == 200
+            assert response.json()["record_count"] == 2
+        yield client
+    app.dependency_overrides.update(previous)
+    store.close()
 
 
 class TestForecastAPIIntegration:
@@ -40,99 +141,24 @@ class TestForecastAPIIntegration:
         assert isinstance(data, list)
         assert len(data) == 0
     
-    def test_forecast_deltas_with_filters(self, client):
+    @pytest.mark.parametrize("query", ["model=RTX_4090", "min_price_change_pct=5.0", "region=US", "limit=50"])
+    def test_forecast_deltas_with_filters(self, ingested_client, query):
         """Test forecast deltas endpoint with query filters."""
-        # Test with various filter combinations
-        response = client.get("/api/forecast/deltas?model=RTX_4090")
-        assert response.status_code == 200
-        
-        response = client.get("/api/forecast/deltas?min_price_change_pct=5.0")
-        assert response.status_code == 200
-        
-        response = client.get("/api/forecast/deltas?region=US")
-        assert response.status_code == 200
-        
-        response = client.get("/api/forecast/deltas?limit=50")
+        response = ingested_client.get(f"/api/forecast/deltas?{query}")
         assert response.status_code == 200
     
-    def test_forecast_delta_by_id_not_found(self, client):
+    def test_forecast_delta_by_id_not_found(self, ingested_client):
         """Test getting specific delta that doesn't exist."""
-        response = client.get("/api/forecast/deltas/999")
+        response = ingested_client.get("/api/forecast/deltas/999")
         
         assert response.status_code == 404
         data = response.json()
         assert "not found" in data["detail"].lower()
     
-    def test_complete_ingestion_and_delta_workflow(self, client):
+    def test_complete_ingestion_and_delta_workflow(self, ingested_client):
         """Test complete workflow: ingest data twice, then query deltas."""
-        # First ingestion - create initial snapshots
-        first_listings = [
-            {
-                "canonical_model": "RTX_4090",
-                "vram_gb": 24,
-                "mig_support": 0,
-                "nvlink": False,
-                "tdp_watts": 450,
-                "price": 1500.0,
-                "score": 85.0,
-                "import_id": "test-import-1",
-                "import_index": 0,
-            },
-            {
-                "canonical_model": "RTX_3080",
-                "vram_gb": 10,
-                "mig_support": 0,
-                "nvlink": False,
-                "tdp_watts": 320,
-                "price": 800.0,
-                "score": 75.0,
-                "import_id": "test-import-1",
-                "import_index": 1,
-            }
-        ]
-        
-        response = client.post("/api/persist/listings", json=first_listings)
-        assert response.status_code == 200
-        first_result = response.json()
-        assert first_result["record_count"] == 2
-        
-        # Wait a moment to ensure different timestamps
-        import time
-        time.sleep(0.1)
-        
-        # Second ingestion with modified prices - should create deltas
-        second_listings = [
-            {
-                "canonical_model": "RTX_4090",
-                "vram_gb": 24,
-                "mig_support": 0,
-                "nvlink": False,
-                "tdp_watts": 450,
-                "price": 1600.0,  # Price increased by $100
-                "score": 87.0,    # Score increased by 2
-                "import_id": "test-import-2",
-                "import_index": 0,
-            },
-            {
-                "canonical_model": "RTX_3080",
-                "vram_gb": 10,
-                "mig_support": 0,
-                "nvlink": False,
-                "tdp_watts": 320,
-                "price": 750.0,   # Price decreased by $50
-                "score": 73.0,    # Score decreased by 2
-                "import_id": "test-import-2",
-                "import_index": 1,
-            }
-        ]
-        
-        response = client.post("/api/persist/listings", json=second_listings)
-        assert response.status_code == 200
-        second_result = response.json()
-        assert second_result["record_count"] == 2
-        
         # Query deltas - should have deltas from the second ingestion
-        response = client.get("/api/forecast/deltas")
+        response = ingested_client.get("/api/forecast/deltas")
         assert response.status_code == 200
         deltas = response.json()
         
@@ -141,20 +167,20 @@ class TestForecastAPIIntegration:
         assert isinstance(deltas, list)
         
         # Test filtering by model
-        response = client.get("/api/forecast/deltas?model=RTX_4090")
+        response = ingested_client.get("/api/forecast/deltas?model=RTX_4090")
         assert response.status_code == 200
         rtx4090_deltas = response.json()
         assert isinstance(rtx4090_deltas, list)
         
         # Test filtering by minimum price change
-        response = client.get("/api/forecast/deltas?min_price_change_pct=5.0")
+        response = ingested_client.get("/api/forecast/deltas?min_price_change_pct=5.0")
         assert response.status_code == 200
         significant_deltas = response.json()
         assert isinstance(significant_deltas, list)
     
-    def test_forecast_deltas_response_format(self, client):
+    def test_forecast_deltas_response_format(self, ingested_client):
         """Test that forecast deltas response has correct format."""
-        response = client.get("/api/forecast/deltas")
+        response = ingested_client.get("/api/forecast/deltas")
         assert response.status_code == 200
         
         deltas = response.json()
@@ -162,13 +188,7 @@ class TestForecastAPIIntegration:
         
         # If there are deltas, verify the structure
         for delta in deltas:
-            required_fields = [
-                "id", "model", "price_delta", "price_delta_pct", 
-                "score_delta", "timestamp", "current_snapshot_id", 
-                "previous_snapshot_id"
-            ]
-            for field in required_fields:
-                assert field in delta
+            assert _DELTA_KEYS <= delta.keys(), _DELTA_KEYS - delta.keys()
             
             # Verify data types
             assert isinstance(delta["id"], int)
@@ -179,32 +199,30 @@ class TestForecastAPIIntegration:
             assert isinstance(delta["current_snapshot_id"], int)
             assert isinstance(delta["previous_snapshot_id"], int)
     
-    def test_forecast_delta_limit_parameter(self, client):
+    def test_forecast_delta_limit_parameter(self, ingested_client):
         """Test that limit parameter works correctly."""
         # Test with small limit
-        response = client.get("/api/forecast/deltas?limit=1")
+        response = ingested_client.get("/api/forecast/deltas?limit=1")
         assert response.status_code == 200
         deltas = response.json()
         assert len(deltas) <= 1
         
         # Test with larger limit
-        response = client.get("/api/forecast/deltas?limit=100")
+        response = ingested_client.get("/api/forecast/deltas?limit=100")
         assert response.status_code == 200
         deltas = response.json()
         assert len(deltas) <= 100
     
-    def test_forecast_deltas_timestamp_filter(self, client):
+    def test_forecast_deltas_timestamp_filter(self, ingested_client):
         """Test filtering deltas by timestamp."""
         # Test with future timestamp (should return no results)
-        future_time = (datetime.utcnow() + timedelta(hours=1)).isoformat()
-        response = client.get(f"/api/forecast/deltas?after={future_time}")
+        response = ingested_client.get(f"/api/forecast/deltas?after={FUTURE}")
         assert response.status_code == 200
         deltas = response.json()
         assert len(deltas) == 0
         
         # Test with past timestamp
-        past_time = (datetime.utcnow() - timedelta(hours=1)).isoformat()
-        response = client.get(f"/api/forecast/deltas?after={past_time}")
+        response = ingested_client.get(f"/api/forecast/deltas?after={PAST}")
         assert response.status_code == 200
         # Should not error, regardless of results
     
@@ -225,34 +243,28 @@ class TestForecastAPIIntegration:
 class TestForecastWorkflowWithCSV:
     """Test forecast functionality with CSV ingestion."""
     
-    def test_csv_ingestion_creates_snapshots_and_deltas(self, client):
+    def test_csv_ingestion_creates_snapshots_and_deltas(self, client, storage, monkeypatch):
         """Test that CSV ingestion creates snapshots and deltas."""
-        # Create test CSV content
-        csv_content_v1 = """title,price,condition,seller
-"NVIDIA GeForce RTX 4090 24GB Graphics Card",1500.00,New,TechStore
-"RTX 3080 Ti 12GB Gaming Card",800.00,Used,GamersParadise"""
-        
-        csv_content_v2 = """title,price,condition,seller
-"NVIDIA GeForce RTX 4090 24GB Graphics Card",1600.00,New,TechStore
-"RTX 3080 Ti 12GB Gaming Card",750.00,Used,GamersParadise"""
+        # Snapshot timestamps come from a controlled clock
+        clock = [datetime(2025, 1, 1, 12, 0, tzinfo=UTC)]
+        monkeypatch.setattr("glyphd.core.storage.sqlite_store._now", lambda: clock[0])
         
         # First CSV upload
         response = client.post(
             "/api/import/csv",
-            files={"file": ("test_v1.csv", csv_content_v1, "text/csv")}
+            files={"file": ("test_v1.csv", CSV_V1, "text/csv")}
         )
         assert response.status_code == 200
         result1 = response.json()
         assert result1["record_count"] > 0
         
-        # Wait a moment
-        import time
-        time.sleep(0.1)
+        # Advance the clock so the second upload gets a later timestamp
+        clock[0] += timedelta(minutes=1)
         
         # Second CSV upload with different prices
         response = client.post(
             "/api/import/csv",
-            files={"file": ("test_v2.csv", csv_content_v2, "text/csv")}
+            files={"file": ("test_v2.csv", CSV_V2, "text/csv")}
         )
         assert response.status_code == 200
         result2 = response.json()
@@ -265,4 +277,9 @@ class TestForecastWorkflowWithCSV:
         
         # Should have some deltas from the price changes
         # Note: Actual delta creation depends on source_url matching
-        assert isinstance(deltas, list)
\ No newline at end of file
+        assert isinstance(deltas, list)
+        
+        # Each upload's snapshots carry that upload's timestamp
+        with storage.engine.connect() as conn:
+            seen_at = conn.exec_driver_sql("SELECT DISTINCT seen_at FROM listing_snapshots ORDER BY seen_at").fetchall()
+        assert [row[0] for row in seen_at] == ["2025-01-01 12:00:00.000000", "2025-01-01 12:01:00.000000"]
\ No newline at end of file
@@ -2,7 +2,6 @@
 Tests for the persist API endpoints.
 """
 
-import tempfile
 import uuid
 from datetime import datetime
 from typing import List
@@ -11,42 +10,34 @@ import pytest
 from fastapi.testclient import TestClient
 
 from glyphd.api.models import GPUListingDTO
-from glyphd.api.router import create_app
+from glyphd.core.dependencies.listing_repository import get_listing_repository
 from glyphd.core.dependencies.storage import get_storage_engine
 from glyphd.core.storage.sqlite_store import SqliteListingStore
 
 
 @pytest.fixture
-def temp_db_path() -> str:
-    """Create a temporary database file for testing."""
-    with tempfile.NamedTemporaryFile(suffix=".sqlite", delete=False) as tmp_file:
-        return tmp_file.name
+def test_storage():
+    """Create a test storage engine on a fresh in-memory database."""
+    store = SqliteListingStore(db_path=":memory:")
+    yield store
+    store.close()
 
 
 @pytest.fixture
-def test_storage(temp_db_path: str) -> SqliteListingStore:
-    """Create a test storage engine with temporary database."""
-    return SqliteListingStore(db_path=temp_db_path)
-
-
-@pytest.fixture
-def test_app(test_storage: SqliteListingStore):
-    """Create a test FastAPI app with overridden storage dependency."""
-    app = create_app()
-
-    # Override the storage dependency for testing
-    app.dependency_overrides[get_storage_engine] = lambda: test_storage
-
+def test_app(app, override_dependency, test_storage: SqliteListingStore):
+    """Point the shared test app's storage dependencies at the test's storage."""
+    override_dependency(get_storage_engine, lambda: test_storage)
+    override_dependency(get_listing_repository, lambda: test_storage)
     return app
 
 
 @pytest.fixture
-def client(test_app):
-    """Create a test client for the FastAPI app."""
-    return TestClient(test_app)
+def client(client, test_app):
+    """Use the shared test client, with storage overridden for this test."""
+    return client
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_listings() -> List[GPUListingDTO]:
     """Create sample GPU listings for testing."""
     return [
@@ -80,13 +71,16 @@ def sample_listings() -> List[GPUListingDTO]:
     ]
 
 
-def test_import_endpoint(client: TestClient, sample_listings: List[GPUListingDTO]) -> None:
-    """Test the import listings endpoint."""
-    # Convert sample listings to dict format for JSON serialization
-    listings_data = [listing.model_dump() for listing in sample_listings]
+@pytest.fixture(scope="session")
+def sample_listings_json(sample_listings: List[GPUListingDTO]) -> List[dict]:
+    """Request payloads for the sample listings, dumped once per session."""
+    return [listing.model_dump(mode="json") for listing in sample_listings]
 
+
+def test_import_endpoint(client: TestClient, sample_listings_json: List[dict]) -> None:
+    """Test the import listings endpoint."""
     # Make POST request to import endpoint
-    response = client.post("/api/persist/listings", json=listings_data)
+    response = client.post("/api/persist/listings", json=sample_listings_json)
 
     # Verify response status
     assert response.status_code == 200
@@ -1,3 +1,7 @@
+import json
+
+import pytest
+
 from glyphd.cli import cli
 
 
@@ -6,18 +10,32 @@ def test_cli_exists():
     assert cli is not None
 
 
-def test_serve_command_help(runner):
+@pytest.fixture(scope="module")
+def serve_help(runner):
+    """Invoke ``serve --help`` once for the module's help-text tests."""
+    return runner.invoke(cli, ["serve", "--help"])
+
+
+def test_serve_command_help(serve_help):
     """Test that the serve command help text is displayed correctly."""
-    result = runner.invoke(cli, ["serve", "--help"])
-    assert result.exit_code == 0
-    assert "Run the FastAPI server with uvicorn" in result.output
+    assert serve_help.exit_code == 0
+    assert "Run the FastAPI server with uvicorn" in serve_help.output
 
 
-def test_serve_command_parameters(runner):
+def test_serve_command_parameters(serve_help):
     """Test that the serve command accepts the expected parameters."""
-    # This test doesn't actually start the server, just checks the CLI parsing
-    # We use the --help flag to prevent the server from starting
-    result = runner.invoke(cli, ["serve", "--help"])
-    assert result.exit_code == 0
-    assert "--host" in result.output
-    assert "--port" in result.output
+    # The help output lists the options without starting the server
+    assert serve_help.exit_code == 0
+    assert "--host" in serve_help.output
+    assert "--port" in serve_help.output
+
+
+def test_export_openapi_compact(runner, tmp_path):
+    """Test that --compact writes a single-line OpenAPI schema."""
+    output_path = tmp_path / "openapi.json"
+    result = runner.invoke(cli, ["export-openapi", str(output_path), "--compact"])
+    assert result.exit_code == 0, result.output
+
+    content = output_path.read_text()
+    assert "\n" not in content
+    assert json.loads(content)["openapi"].startswith("3.")
@@ -2,150 +2,150 @@
 Unit tests for forecasting functionality.
 """
 
-from datetime import datetime, timedelta
+from datetime import UTC, datetime, timedelta
 
 import pytest
 
-from glyphd.core.forecast import compute_delta, create_snapshot_from_listing
-from glyphd.sqlite.models import ListingSnapshot
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from glyphd.core.forecast import (
+    _SQL_INSERT_IMPORT_DELTAS,
+    compute_delta,
+    compute_deltas,
+    compute_deltas_for_import,
+    create_snapshot_from_listing,
+    snapshot_row,
+)
+from glyphd.core.storage.sqlite_store import SqliteListingStore
+from glyphd.sqlite.bulk import bulk_insert_listings
+from glyphd.sqlite.models import ListingDelta, ListingSnapshot
+
+# Fixed snapshot times; compute_delta only needs the previous snapshot to come first
+_NOW = datetime(2025, 1, 1, 12, 0, 0)
+_PREV = _NOW - timedelta(hours=1)
+_SOURCE = "https://example.com/listing1"
 
 
 class TestComputeDelta:
     """Test the compute_delta function."""
-    
-    def test_compute_delta_basic(self):
-        """Test basic delta computation."""
-        # Create mock snapshots
+
+    @pytest.mark.parametrize(
+        ("prev", "curr", "expected"),
+        [
+            # (price, score) pairs -> (price_delta, price_delta_pct, score_delta)
+            pytest.param((1500.0, 85.0), (1600.0, 87.0), (100.0, 6.67, 2.0), id="price_increase"),
+            pytest.param((800.0, 75.0), (700.0, 73.0), (-100.0, -12.5, -2.0), id="price_decrease"),
+            # No meaningful percentage from a zero previous price
+            pytest.param((0.0, 85.0), (1500.0, 87.0), (1500.0, 0.0, 2.0), id="zero_price"),
+        ],
+    )
+    def test_compute_delta(self, prev, curr, expected):
+        """Test delta values computed between two snapshots of one listing."""
         prev_snapshot = ListingSnapshot(
             id=1,
             model="RTX_4090",
-            price_usd=1500.0,
-            score=85.0,
-            seen_at=datetime.utcnow() - timedelta(hours=1),
-            source_url="https://example.com/listing1",
+            price_usd=prev[0],
+            score=prev[1],
+            seen_at=_PREV,
+            source_url=_SOURCE,
             region="US",
         )
-        
         curr_snapshot = ListingSnapshot(
             id=2,
             model="RTX_4090",
-            price_usd=1600.0,
-            score=87.0,
-            seen_at=datetime.utcnow(),
-            source_url="https://example.com/listing1",
+            price_usd=curr[0],
+            score=curr[1],
+            seen_at=_NOW,
+            source_url=_SOURCE,
             region="US",
         )
-        
-        # Compute delta
+
         delta = compute_delta(prev_snapshot, curr_snapshot)
-        
-        # Verify calculations
-        assert delta.price_delta == 100.0
-        assert abs(delta.price_delta_pct - 6.67) < 0.01  # 100/1500 * 100 ≈ 6.67%
-        assert delta.score_delta == 2.0
+
+        price_delta, price_delta_pct, score_delta = expected
+        assert delta.price_delta == price_delta
+        assert delta.price_delta_pct == pytest.approx(price_delta_pct, abs=0.01)
+        assert delta.score_delta == score_delta
         assert delta.model == "RTX_4090"
         assert delta.region == "US"
-        assert delta.source_url == "https://example.com/listing1"
+        assert delta.source_url == _SOURCE
         assert delta.current_snapshot_id == 2
         assert delta.previous_snapshot_id == 1
-    
-    def test_compute_delta_price_decrease(self):
-        """Test delta computation with price decrease."""
+
+    @pytest.mark.parametrize(
+        ("model", "source_url", "message"),
+        [
+            pytest.param("RTX_3080", _SOURCE, "different models", id="different_models"),
+            pytest.param("RTX_4090", "https://example.com/listing2", "different sources", id="different_sources"),
+        ],
+    )
+    def test_compute_delta_mismatch_error(self, model, source_url, message):
+        """Test that computing a delta across models or sources raises an error."""
         prev_snapshot = ListingSnapshot(
-            id=1,
-            model="RTX_3080",
-            price_usd=800.0,
-            score=75.0,
-            seen_at=datetime.utcnow() - timedelta(hours=1),
-            source_url="https://example.com/listing2",
+            id=1, model="RTX_4090", price_usd=1500.0, score=85.0, seen_at=_PREV, source_url=_SOURCE
         )
-        
         curr_snapshot = ListingSnapshot(
-            id=2,
-            model="RTX_3080",
-            price_usd=700.0,
-            score=73.0,
-            seen_at=datetime.utcnow(),
-            source_url="https://example.com/listing2",
+            id=2, model=model, price_usd=1600.0, score=87.0, seen_at=_NOW, source_url=source_url
         )
-        
-        delta = compute_delta(prev_snapshot, curr_snapshot)
-        
-        assert delta.price_delta == -100.0
-        assert delta.price_delta_pct == -12.5  # -100/800 * 100 = -12.5%
-        assert delta.score_delta == -2.0
+
+        with pytest.raises(ValueError, match=f"Cannot compute delta between {message}"):
+            compute_delta(prev_snapshot, curr_snapshot)
+
+
+class TestComputeDeltas:
+    """Test the compute_deltas batch function."""
     
-    def test_compute_delta_zero_price(self):
-        """Test delta computation with zero previous price."""
-        prev_snapshot = ListingSnapshot(
-            id=1,
-            model="RTX_4090",
-            price_usd=0.0,
-            score=85.0,
-            seen_at=datetime.utcnow() - timedelta(hours=1),
-            source_url="https://example.com/listing3",
-        )
+    def test_compute_deltas_returns_mappings(self):
+        """Test that batch deltas are plain dicts sharing one timestamp."""
+        pairs = [
+            (
+                ListingSnapshot(id=1, model="RTX_4090", price_usd=1500.0, score=85.0, source_url="https://example.com/a"),
+                ListingSnapshot(id=3, model="RTX_4090", price_usd=1650.0, score=86.0, source_url="https://example.com/a"),
+            ),
+            (
+                ListingSnapshot(id=2, model="A100_40GB", price_usd=0.0, score=70.0, source_url="https://example.com/b"),
+                ListingSnapshot(id=4, model="A100_40GB", price_usd=9000.0, score=72.0, source_url="https://example.com/b"),
+            ),
+        ]
         
-        curr_snapshot = ListingSnapshot(
-            id=2,
-            model="RTX_4090",
-            price_usd=1500.0,
-            score=87.0,
-            seen_at=datetime.utcnow(),
-            source_url="https://example.com/listing3",
-        )
+        rows = compute_deltas(pairs)
         
-        delta = compute_delta(prev_snapshot, curr_snapshot)
-        
-        assert delta.price_delta == 1500.0
-        assert delta.price_delta_pct == 0.0  # No meaningful percentage from zero
-        assert delta.score_delta == 2.0
+        assert len(rows) == 2
+        assert all(isinstance(row, dict) for row in rows)
+        assert rows[0]["price_delta"] == 150.0
+        assert rows[0]["price_delta_pct"] == 10.0
+        assert rows[0]["score_delta"] == 1.0
+        assert rows[0]["current_snapshot_id"] == 3
+        assert rows[0]["previous_snapshot_id"] == 1
+        assert rows[1]["price_delta_pct"] == 0.0
+        assert rows[0]["timestamp"] == rows[1]["timestamp"]
     
-    def test_compute_delta_different_models_error(self):
-        """Test that computing delta between different models raises error."""
-        prev_snapshot = ListingSnapshot(
-            id=1,
-            model="RTX_4090",
-            price_usd=1500.0,
-            score=85.0,
-            seen_at=datetime.utcnow() - timedelta(hours=1),
-            source_url="https://example.com/listing1",
-        )
+    def test_compute_deltas_custom_seen_at(self):
+        """Test that a caller-provided timestamp is applied to every delta."""
+        stamp = datetime(2025, 1, 1, 12, 0, 0)
+        pairs = [
+            (
+                ListingSnapshot(id=1, model="RTX_4090", price_usd=1500.0, score=85.0, source_url="https://example.com/a"),
+                ListingSnapshot(id=2, model="RTX_4090", price_usd=1500.0, score=85.0, source_url="https://example.com/a"),
+            )
+        ]
         
-        curr_snapshot = ListingSnapshot(
-            id=2,
-            model="RTX_3080",  # Different model
-            price_usd=800.0,
-            score=75.0,
-            seen_at=datetime.utcnow(),
-            source_url="https://example.com/listing1",
-        )
+        rows = compute_deltas(pairs, seen_at=stamp)
         
-        with pytest.raises(ValueError, match="Cannot compute delta between different models"):
-            compute_delta(prev_snapshot, curr_snapshot)
+        assert rows[0]["timestamp"] == stamp
     
-    def test_compute_delta_different_sources_error(self):
-        """Test that computing delta between different sources raises error."""
-        prev_snapshot = ListingSnapshot(
-            id=1,
-            model="RTX_4090",
-            price_usd=1500.0,
-            score=85.0,
-            seen_at=datetime.utcnow() - timedelta(hours=1),
-            source_url="https://example.com/listing1",
-        )
+    def test_compute_deltas_different_models_error(self):
+        """Test that mismatched pairs raise like compute_delta."""
+        pairs = [
+            (
+                ListingSnapshot(id=1, model="RTX_4090", price_usd=1500.0, score=85.0, source_url="https://example.com/a"),
+                ListingSnapshot(id=2, model="RTX_3080", price_usd=800.0, score=75.0, source_url="https://example.com/a"),
+            )
+        ]
         
-        curr_snapshot = ListingSnapshot(
-            id=2,
-            model="RTX_4090",
-            price_usd=1600.0,
-            score=87.0,
-            seen_at=datetime.utcnow(),
-            source_url="https://example.com/listing2",  # Different source
-        )
-        
-        with pytest.raises(ValueError, match="Cannot compute delta between different sources"):
-            compute_delta(prev_snapshot, curr_snapshot)
+        with pytest.raises(ValueError, match="Cannot compute delta between different models"):
+            compute_deltas(pairs)
 
 
 class TestCreateSnapshotFromListing:
@@ -175,6 +175,20 @@ class TestCreateSnapshotFromListing:
         assert snapshot.quantization_capacity == {'7b': 4, '13b': 2, '70b': 0}
         assert snapshot.heuristics == {'confidence': 0.95}
         assert isinstance(snapshot.seen_at, datetime)
+
+    def test_create_snapshot_flattens_quantization_capacity(self):
+        """Test that quantization capacity is stored in the integer columns."""
+        listing_data = {
+            'canonical_model': 'RTX_4090',
+            'price': 1500.0,
+            'score': 85.0,
+            'quantization_capacity': {'model_7b': 4, 'model_13b': 2, 'model_70b': 0},
+        }
+
+        snapshot = create_snapshot_from_listing(listing_data)
+
+        assert (snapshot.model_7b, snapshot.model_13b, snapshot.model_70b) == (4, 2, 0)
+        assert snapshot.quantization_capacity == {'7b': 4, '13b': 2, '70b': 0}
     
     def test_create_snapshot_with_model_field(self):
         """Test snapshot creation with 'model' field instead of 'canonical_model'."""
@@ -207,6 +221,7 @@ class TestCreateSnapshotFromListing:
         assert snapshot.region is None
         assert snapshot.source_url is None
         assert snapshot.quantization_capacity is None
+        assert (snapshot.model_7b, snapshot.model_13b, snapshot.model_70b) == (None, None, None)
         assert snapshot.heuristics is None
     
     def test_create_snapshot_custom_seen_at(self):
@@ -223,6 +238,95 @@ class TestCreateSnapshotFromListing:
         assert snapshot.seen_at == custom_time
 
 
+class TestComputeDeltasForImport:
+    """Test the SQL delta computation for an import batch."""
+
+    def test_matches_compute_deltas(self, tmp_path):
+        """Test that the batch SQL writes the same deltas as pairing snapshots in Python."""
+        store = SqliteListingStore(str(tmp_path / "forecast.db"))
+        first_seen = datetime(2025, 1, 1, 12, 0, 0)
+        second_seen = first_seen + timedelta(days=1)
+
+        def snapshot(url, price, score, seen_at, import_id, model='RTX_4090'):
+            listing = {'canonical_model': model, 'price': price, 'score': score, 'source_url': url, 'region': 'US'}
+            return create_snapshot_from_listing(listing, seen_at=seen_at, import_id=import_id)
+
+        with store.engine.begin() as conn:
+            conn.execute(text("INSERT INTO import_batches (import_id) VALUES ('batch-1'), ('batch-2')"))
+            session = Session(bind=conn)
+            previous = [
+                snapshot('https://example.com/1', 1000.0, 80.0, first_seen, 'batch-1'),
+                snapshot('https://example.com/2', 0.0, 70.0, first_seen, 'batch-1'),
+                snapshot('https://example.com/3', 900.0, 60.0, first_seen, 'batch-1', model='RTX_3090'),
+            ]
+            session.add_all(previous)
+            session.flush()
+            current = [
+                snapshot('https://example.com/1', 1100.0, 82.0, second_seen, 'batch-2'),
+                snapshot('https://example.com/2', 500.0, 71.0, second_seen, 'batch-2'),
+                snapshot('https://example.com/3', 950.0, 65.0, second_seen, 'batch-2'),
+                snapshot(None, 700.0, 50.0, second_seen, 'batch-2'),
+            ]
+            session.add_all(current)
+            session.flush()
+
+            assert compute_deltas_for_import(conn, 'batch-2', second_seen) == 2
+            # Other batches and timestamps are left alone
+            assert compute_deltas_for_import(conn, 'batch-2', first_seen) == 0
+
+            columns = list(compute_deltas([(previous[0], current[0])])[0])
+            rows = session.query(ListingDelta).order_by(ListingDelta.current_snapshot_id).all()
+            stored = [{column: getattr(row, column) for column in columns} for row in rows]
+            expected = compute_deltas([(previous[0], current[0]), (previous[1], current[1])], seen_at=second_seen)
+            assert stored == [{**row, "timestamp": second_seen} for row in expected]
+            session.close()
+        store.close()
+
+    def test_bulk_inserted_rows_match_orm_snapshots(self, tmp_path):
+        """Test that snapshot rows written with Core inserts store the same values as ORM snapshots."""
+        store = SqliteListingStore(str(tmp_path / "forecast.db"))
+        first_seen = datetime(2025, 1, 1, 12, 0, 0, tzinfo=UTC)
+        second_seen = first_seen + timedelta(days=1)
+        listing = {
+            'canonical_model': 'RTX_4090',
+            'price': 1000.0,
+            'score': 80.0,
+            'source_url': 'https://example.com/1',
+            'quantization_capacity': {'7b': 4, '13b': 2, '70b': 0},
+            'heuristics': {'seller_rating': 5},
+        }
+
+        with store.engine.begin() as conn:
+            conn.execute(text("INSERT INTO import_batches (import_id) VALUES ('batch-1'), ('batch-2')"))
+            session = Session(bind=conn)
+            session.add(create_snapshot_from_listing(listing, seen_at=first_seen, import_id='batch-1'))
+            session.flush()
+            row = snapshot_row({**listing, 'price': 1100.0}, seen_at=second_seen, import_id='batch-2')
+            assert bulk_insert_listings(conn, ListingSnapshot, [row]) == 1
+
+            # Timestamps are stored in the same format, so the batch is found by its seen_at
+            assert compute_deltas_for_import(conn, 'batch-2', second_seen) == 1
+            previous, current = session.query(ListingSnapshot).order_by(ListingSnapshot.id).all()
+            assert current.quantization_capacity == previous.quantization_capacity
+            assert current.heuristics == previous.heuristics
+            assert current.seen_at - previous.seen_at == timedelta(days=1)
+            session.close()
+        store.close()
+
+    def test_previous_snapshot_lookup_uses_index(self, tmp_path):
+        """Test that the previous-snapshot lookup is an index search without a sort."""
+        store = SqliteListingStore(str(tmp_path / "forecast.db"))
+        params = {"import_id": "batch-1", "seen_at": None, "timestamp": None}
+        with store.engine.connect() as conn:
+            rows = conn.execute(text(f"EXPLAIN QUERY PLAN {_SQL_INSERT_IMPORT_DELTAS.text}"), params)
+            plan = " ".join(str(row[-1]) for row in rows)
+        assert "USING COVERING INDEX idx_listing_snapshots_source_url_model_seen_at" in plan
+        assert "USING INDEX idx_listing_snapshots_import_id_seen_at" in plan
+        assert "TEMP B-TREE" not in plan
+        assert "SCAN" not in plan
+        store.close()
+
+
 class TestSnapshotValidation:
     """Test snapshot validation scenarios."""
     
@@ -5,7 +5,6 @@ This module tests the full workflow of importing GPU listings via the persist AP
 and then querying them via the listings API to verify end-to-end persistence integration.
 """
 
-import tempfile
 import uuid
 from datetime import datetime
 from typing import List
@@ -14,44 +13,35 @@ import pytest
 from fastapi.testclient import TestClient
 
 from glyphd.api.models import GPUListingDTO
-from glyphd.api.router import create_app
+from glyphd.api.routes.import_from_pipeline import _parse_pipeline_csv
 from glyphd.core.dependencies.listing_repository import get_listing_repository
 from glyphd.core.dependencies.storage import get_storage_engine
 from glyphd.core.storage.sqlite_store import SqliteListingStore
 
 
 @pytest.fixture
-def temp_db_path() -> str:
-    """Create a temporary database file for testing."""
-    with tempfile.NamedTemporaryFile(suffix=".sqlite", delete=False) as tmp_file:
-        return tmp_file.name
+def test_storage():
+    """Create a test storage engine on a fresh in-memory database."""
+    store = SqliteListingStore(db_path=":memory:")
+    yield store
+    store.close()
 
 
 @pytest.fixture
-def test_storage(temp_db_path: str) -> SqliteListingStore:
-    """Create a test storage engine with temporary database."""
-    return SqliteListingStore(db_path=temp_db_path)
-
-
-@pytest.fixture
-def test_app(test_storage: SqliteListingStore):
-    """Create a test FastAPI app with overridden storage dependencies."""
-    app = create_app()
-
-    # Override both storage dependencies to use the same test storage instance
-    app.dependency_overrides[get_storage_engine] = lambda: test_storage
-    app.dependency_overrides[get_listing_repository] = lambda: test_storage
-
+def test_app(app, override_dependency, test_storage: SqliteListingStore):
+    """Point the shared test app's storage dependencies at the test's storage."""
+    override_dependency(get_storage_engine, lambda: test_storage)
+    override_dependency(get_listing_repository, lambda: test_storage)
     return app
 
 
 @pytest.fixture
-def client(test_app):
-    """Create a test client for the FastAPI app."""
-    return TestClient(test_app)
+def client(client, test_app):
+    """Use the shared test client, with storage overridden for this test."""
+    return client
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_listings() -> List[GPUListingDTO]:
     """Create sample GPU listings with distinct canonical models and prices for testing."""
     return [
@@ -76,7 +66,13 @@ def sample_listings() -> List[GPUListingDTO]:
     ]
 
 
-def test_import_and_query_integration(client: TestClient, sample_listings: List[GPUListingDTO]) -> None:
+@pytest.fixture(scope="session")
+def sample_listings_json(sample_listings: List[GPUListingDTO]) -> List[dict]:
+    """Request payloads for the sample listings, dumped once per session."""
+    return [listing.model_dump(mode="json") for listing in sample_listings]
+
+
+def test_import_and_query_integration(client: TestClient, sample_listings_json: List[dict]) -> None:
     """
     Test the full integration workflow: import listings and then query them.
 
@@ -87,9 +83,7 @@ def test_import_and_query_integration(client: TestClient, sample_listings: List[
     4. Response structures are valid
     """
     # Step 1: Import listings via persist endpoint
-    listings_data = [listing.model_dump() for listing in sample_listings]
-
-    import_response = client.post("/api/persist/listings", json=listings_data)
+    import_response = client.post("/api/persist/listings", json=sample_listings_json)
 
     # Verify import response
     assert import_response.status_code == 200
@@ -142,13 +136,12 @@ def test_import_and_query_integration(client: TestClient, sample_listings: List[
     assert a100_listing["vram_gb"] == 80
 
 
-def test_query_with_model_filter(client: TestClient, sample_listings: List[GPUListingDTO]) -> None:
+def test_query_with_model_filter(client: TestClient, sample_listings_json: List[dict]) -> None:
     """
     Test querying listings with model filter after import.
     """
     # Import listings first
-    listings_data = [listing.model_dump() for listing in sample_listings]
-    import_response = client.post("/api/persist/listings", json=listings_data)
+    import_response = client.post("/api/persist/listings", json=sample_listings_json)
     assert import_response.status_code == 200
 
     # Query with model filter
@@ -163,13 +156,12 @@ def test_query_with_model_filter(client: TestClient, sample_listings: List[GPULi
         assert "H100" in listing["canonical_model"]
 
 
-def test_query_with_price_filter(client: TestClient, sample_listings: List[GPUListingDTO]) -> None:
+def test_query_with_price_filter(client: TestClient, sample_listings_json: List[dict]) -> None:
     """
     Test querying listings with price filters after import.
     """
     # Import listings first
-    listings_data = [listing.model_dump() for listing in sample_listings]
-    import_response = client.post("/api/persist/listings", json=listings_data)
+    import_response = client.post("/api/persist/listings", json=sample_listings_json)
     assert import_response.status_code == 200
 
     # Query with price filter (should return only A100 at $25,000)
@@ -184,13 +176,12 @@ def test_query_with_price_filter(client: TestClient, sample_listings: List[GPULi
     assert query_result[0]["price"] == 25000.0
 
 
-def test_query_with_pagination(client: TestClient, sample_listings: List[GPUListingDTO]) -> None:
+def test_query_with_pagination(client: TestClient, sample_listings_json: List[dict]) -> None:
     """
     Test querying listings with pagination after import.
     """
     # Import listings first
-    listings_data = [listing.model_dump() for listing in sample_listings]
-    import_response = client.post("/api/persist/listings", json=listings_data)
+    import_response = client.post("/api/persist/listings", json=sample_listings_json)
     assert import_response.status_code == 200
 
     # Query with limit=1
@@ -212,6 +203,33 @@ def test_query_with_pagination(client: TestClient, sample_listings: List[GPUList
     assert len(query_result) == 1
 
 
+def test_query_with_cursor_pagination(
+    client: TestClient, sample_listings: List[GPUListingDTO], sample_listings_json: List[dict]
+) -> None:
+    """
+    Test walking all listings with the cursor-paginated endpoint.
+    """
+    import_response = client.post("/api/persist/listings", json=sample_listings_json)
+    assert import_response.status_code == 200
+
+    pages = []
+    after_id = 0
+    while after_id is not None:
+        query_response = client.get(f"/api/listings/page?limit=2&after_id={after_id}")
+        assert query_response.status_code == 200
+        page = query_response.json()
+        pages.append(page["items"])
+        after_id = page.get("next_cursor")
+
+    # Pages come back in import order and together cover every listing exactly once
+    returned = [item["canonical_model"] for page in pages for item in page]
+    assert returned == [listing.canonical_model for listing in sample_listings]
+    assert all(len(page) <= 2 for page in pages)
+
+    invalid_response = client.get("/api/listings/page?min_price=2&max_price=1")
+    assert invalid_response.status_code == 400
+
+
 def test_empty_query_after_no_import(client: TestClient) -> None:
     """
     Test querying listings when no data has been imported.
@@ -266,13 +284,14 @@ def test_query_validation_errors(client: TestClient) -> None:
     assert response.status_code == 422
 
 
-def test_import_id_in_api_response(client: TestClient, sample_listings: List[GPUListingDTO]) -> None:
+def test_import_id_in_api_response(
+    client: TestClient, sample_listings: List[GPUListingDTO], sample_listings_json: List[dict]
+) -> None:
     """
     Test that import responses include import_id and that listings include import metadata.
     """
     # Import listings
-    listings_data = [listing.model_dump() for listing in sample_listings]
-    import_response = client.post("/api/persist/listings", json=listings_data)
+    import_response = client.post("/api/persist/listings", json=sample_listings_json)
     assert import_response.status_code == 200
 
     # Check that import response includes import_id
@@ -307,20 +326,22 @@ def test_import_id_in_api_response(client: TestClient, sample_listings: List[GPU
         assert listing["import_index"] <= len(sample_listings)
 
 
-def test_query_with_import_id_filter(client: TestClient, sample_listings: List[GPUListingDTO]) -> None:
+def test_query_with_import_id_filter(
+    client: TestClient, sample_listings: List[GPUListingDTO], sample_listings_json: List[dict]
+) -> None:
     """
     Test querying listings with import_id filter after multiple imports.
     """
     # Import first batch of listings (first listing only)
     first_batch = sample_listings[:1]
-    first_batch_data = [listing.model_dump() for listing in first_batch]
+    first_batch_data = sample_listings_json[:1]
     first_import_response = client.post("/api/persist/listings", json=first_batch_data)
     assert first_import_response.status_code == 200
     first_import_id = first_import_response.json()["import_id"]
 
     # Import second batch of listings (second listing only)
     second_batch = sample_listings[1:]
-    second_batch_data = [listing.model_dump() for listing in second_batch]
+    second_batch_data = sample_listings_json[1:]
     second_import_response = client.post("/api/persist/listings", json=second_batch_data)
     assert second_import_response.status_code == 200
     second_import_id = second_import_response.json()["import_id"]
@@ -356,13 +377,14 @@ def test_query_with_import_id_filter(client: TestClient, sample_listings: List[G
     assert len(query_result) == 0
 
 
-def test_import_index_sequential_in_api(client: TestClient, sample_listings: List[GPUListingDTO]) -> None:
+def test_import_index_sequential_in_api(
+    client: TestClient, sample_listings: List[GPUListingDTO], sample_listings_json: List[dict]
+) -> None:
     """
     Test that import_index is assigned sequentially within each import batch via API.
     """
     # Import listings
-    listings_data = [listing.model_dump() for listing in sample_listings]
-    import_response = client.post("/api/persist/listings", json=listings_data)
+    import_response = client.post("/api/persist/listings", json=sample_listings_json)
     assert import_response.status_code == 200
 
     import_id = import_response.json()["import_id"]
@@ -381,20 +403,20 @@ def test_import_index_sequential_in_api(client: TestClient, sample_listings: Lis
     assert import_indices == expected_indices, f"Expected sequential indices {expected_indices}, got {import_indices}"
 
 
-def test_multiple_imports_distinct_import_ids_api(client: TestClient, sample_listings: List[GPUListingDTO]) -> None:
+def test_multiple_imports_distinct_import_ids_api(
+    client: TestClient, sample_listings: List[GPUListingDTO], sample_listings_json: List[dict]
+) -> None:
     """
     Test that multiple imports generate distinct import_ids and maintain separate import_index sequences via API.
     """
     # Import same data twice to test that import_ids are distinct
-    listings_data = [listing.model_dump() for listing in sample_listings]
-
     # First import
-    first_import_response = client.post("/api/persist/listings", json=listings_data)
+    first_import_response = client.post("/api/persist/listings", json=sample_listings_json)
     assert first_import_response.status_code == 200
     first_import_id = first_import_response.json()["import_id"]
 
     # Second import
-    second_import_response = client.post("/api/persist/listings", json=listings_data)
+    second_import_response = client.post("/api/persist/listings", json=sample_listings_json)
     assert second_import_response.status_code == 200
     second_import_id = second_import_response.json()["import_id"]
 
@@ -419,3 +441,24 @@ def test_multiple_imports_distinct_import_ids_api(client: TestClient, sample_lis
 
     second_indices = sorted([listing["import_index"] for listing in second_result])
     assert second_indices == expected_indices
+
+
+def test_parse_pipeline_csv_by_column_position(tmp_path) -> None:
+    """Test pipeline CSV parsing with reordered columns, blank lines and an invalid row."""
+    csv_path = tmp_path / "scored.csv"
+    csv_path.write_text(
+        "score,price,canonical_model,extra,vram_gb,mig_support,nvlink,tdp_watts\n"
+        "0.9,30000.0,H100_PCIE_80GB,x,80,7,True,350\n"
+        "\n"
+        "0.5,not-a-price,A100_40GB_PCIE,x,40,7,true,250\n"
+        "0.4,1500.0,RTX_A6000,x,48,0,false,300\n"
+    )
+
+    listings = _parse_pipeline_csv(csv_path, "test-import")
+
+    assert [listing.canonical_model for listing in listings] == ["H100_PCIE_80GB", "RTX_A6000"]
+    assert [listing.import_index for listing in listings] == [0, 2]
+    assert listings[0].nvlink is True
+    assert listings[0].score == 0.9
+    assert listings[1].price == 1500.0
+    assert listings[1].nvlink is False
@@ -0,0 +1,57 @@
+"""
+Tests for the PipelineService enriched/scored merge.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from glyphd.core.services import pipeline_service
+from glyphd.core.services.pipeline_service import PipelineService
+
+ENRICHED_CSV = """canonical_model,vram_gb,mig_capable,nvlink,tdp_w,price
+H100_PCIE_80GB,80,7,True,350,10000
+A100_40GB_PCIE,,0,false,,8000.5
+,40,0,False,250,100
+"""
+
+SCORED_CSV = """final_score,row
+0.7,1
+,2
+0.3,3
+"""
+
+
+@pytest.fixture
+def merge_inputs(tmp_path: Path) -> tuple[Path, Path]:
+    """Write enriched and scored CSV files and return their paths."""
+    enriched_path = tmp_path / "enriched.csv"
+    scored_path = tmp_path / "scored.csv"
+    enriched_path.write_text(ENRICHED_CSV)
+    scored_path.write_text(SCORED_CSV)
+    return enriched_path, scored_path
+
+
+@pytest.mark.parametrize("use_pyarrow", [True, False])
+def test_merge_enriched_and_scored_data(merge_inputs, monkeypatch, use_pyarrow):
+    """Test that rows are merged in lockstep with defaults for missing values."""
+    if not use_pyarrow:
+        monkeypatch.setattr(pipeline_service, "pa_csv", None)
+    elif pipeline_service.pa_csv is None:
+        pytest.skip("pyarrow not installed")
+
+    listings = PipelineService()._merge_enriched_and_scored_data(*merge_inputs, "test-import")
+
+    # The row without a canonical model is skipped
+    assert len(listings) == 2
+    assert listings[0].canonical_model == "H100_PCIE_80GB"
+    assert listings[0].nvlink is True
+    assert listings[0].score == 0.7
+    assert listings[1].canonical_model == "A100_40GB_PCIE"
+    assert listings[1].vram_gb == 0
+    assert listings[1].tdp_watts == 0
+    assert listings[1].nvlink is False
+    assert listings[1].price == 8000.5
+    assert listings[1].score == 0.0
+    assert listings[1].import_id == "test-import"
+    assert listings[1].import_index == 1
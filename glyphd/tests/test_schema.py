@@ -5,23 +5,37 @@ This script verifies that the schema can be instantiated and used correctly.
 """
 
 import os
+import shutil
+import sqlite3
 import tempfile
 import unittest
 from datetime import datetime
 
 import sqlalchemy as sa
+from alembic import command
+from alembic.config import Config
 from sqlalchemy.orm import Session
 
+from glyphd.sqlite import models as sqlite_models
+from glyphd.sqlite.bulk import _table_insert_plan, _values_sql, bulk_insert_listings, lookup_ids
 from glyphd.sqlite.models import (
     Base,
+    Condition,
+    FormFactor,
     ImportBatch,
     Listing,
     Model,
+    ModelMarketStats,
     QuantizedListing,
+    Region,
     SchemaVersion,
     ScoredListing,
+    SourceType,
 )
 
+# The Alembic scripts ship next to the ORM models
+MIGRATIONS_DIR = os.path.join(os.path.dirname(sqlite_models.__file__), "migrations")
+
 
 class TestSchema(unittest.TestCase):
     """Test the SQLite schema for the GPU Scoring Tool."""
@@ -109,12 +123,14 @@ class TestSchema(unittest.TestCase):
             cuda_cores=18176,
             slot_width=2,
             pcie_generation=5,
+            import_id="test-import-2",
+        )
+        model.market_stats = ModelMarketStats(
             listing_count=7,
             min_price=23800.0,
             median_price=34995.0,
             max_price=49999.0,
             avg_price=34024.71,
-            import_id="test-import-2",
         )
         self.session.add(model)
         self.session.commit()
@@ -132,11 +148,13 @@ class TestSchema(unittest.TestCase):
         self.assertEqual(queried_model.cuda_cores, 18176)
         self.assertEqual(queried_model.slot_width, 2)
         self.assertEqual(queried_model.pcie_generation, 5)
-        self.assertEqual(queried_model.listing_count, 7)
-        self.assertEqual(queried_model.min_price, 23800.0)
-        self.assertEqual(queried_model.median_price, 34995.0)
-        self.assertEqual(queried_model.max_price, 49999.0)
-        self.assertEqual(queried_model.avg_price, 34024.71)
+        self.assertEqual(queried_model.market_stats.model, "H100_PCIE_80GB")
+        self.assertEqual(queried_model.market_stats.listing_count, 7)
+        self.assertEqual(queried_model.market_stats.min_price, 23800.0)
+        self.assertEqual(queried_model.market_stats.median_price, 34995.0)
+        self.assertEqual(queried_model.market_stats.max_price, 49999.0)
+        self.assertEqual(queried_model.market_stats.avg_price, 34024.71)
+        self.assertIsNotNone(queried_model.market_stats.refreshed_at)
         self.assertEqual(queried_model.import_id, "test-import-2")
 
     def test_listing(self):
@@ -215,15 +233,15 @@ class TestSchema(unittest.TestCase):
             mig_support=0,
             nvlink=True,
             generation="Ampere",
-            form_factor="Standard",
+            form_factor=FormFactor(name="Standard"),
             score=0.85,
-            condition="new",
+            condition=Condition(name="new"),
             quantity=1,
             min_order_qty=1,
             seller="GPU Store",
-            region="US",
+            region=Region(name="US"),
             source_url="https://example.com/rtx-a6000",
-            source_type="marketplace",
+            source_type=SourceType(name="marketplace"),
             seen_at=datetime.utcnow(),
             import_id="test-import-4",
         )
@@ -241,15 +259,15 @@ class TestSchema(unittest.TestCase):
         self.assertEqual(queried_scored_listing.mig_support, 0)
         self.assertTrue(queried_scored_listing.nvlink)
         self.assertEqual(queried_scored_listing.generation, "Ampere")
-        self.assertEqual(queried_scored_listing.form_factor, "Standard")
+        self.assertEqual(queried_scored_listing.form_factor.name, "Standard")
         self.assertEqual(queried_scored_listing.score, 0.85)
-        self.assertEqual(queried_scored_listing.condition, "new")
+        self.assertEqual(queried_scored_listing.condition.name, "new")
         self.assertEqual(queried_scored_listing.quantity, 1)
         self.assertEqual(queried_scored_listing.min_order_qty, 1)
         self.assertEqual(queried_scored_listing.seller, "GPU Store")
-        self.assertEqual(queried_scored_listing.region, "US")
+        self.assertEqual(queried_scored_listing.region.name, "US")
         self.assertEqual(queried_scored_listing.source_url, "https://example.com/rtx-a6000")
-        self.assertEqual(queried_scored_listing.source_type, "marketplace")
+        self.assertEqual(queried_scored_listing.source_type.name, "marketplace")
         self.assertIsNotNone(queried_scored_listing.seen_at)
         self.assertEqual(queried_scored_listing.import_id, "test-import-4")
 
@@ -320,6 +338,17 @@ class TestSchema(unittest.TestCase):
         self.assertEqual(queried_quantized_listing.scored_listing.model.model, "H100_SXM5_80GB")
         self.assertEqual(queried_quantized_listing.scored_listing.model.generation, "Hopper")
 
+        # Check that the quantized listing is keyed by its scored listing
+        self.assertIs(self.session.get(QuantizedListing, scored_listing.id), queried_quantized_listing)
+        # Insert the duplicate through Core so the database key, not the identity map, rejects it
+        with self.assertRaises(sa.exc.IntegrityError):
+            self.session.execute(
+                sa.insert(QuantizedListing.__table__).values(
+                    scored_listing_id=scored_listing.id, model_7b=1, model_13b=1, model_70b=1
+                )
+            )
+        self.session.rollback()
+
     def test_relationships(self):
         """Test that the relationships between tables work correctly."""
         # Create an import batch
@@ -414,6 +443,144 @@ class TestSchema(unittest.TestCase):
         self.assertIn("models", schema_sql)
         self.assertIn("scored_listings", schema_sql)
 
+    def test_updated_at_set_on_update(self):
+        """Test that updating a row refreshes updated_at without a database trigger."""
+        self.session.add(ImportBatch(import_id="test-import-update", source="test"))
+        self.session.add(Model(model="RTX_A2000_12GB", vram_gb=12, tdp_watts=70))
+        self.session.commit()
+
+        created = datetime(2020, 1, 1)
+        scored_listing = ScoredListing(
+            canonical_model="RTX_A2000_12GB",
+            price=400.0,
+            vram_gb=12,
+            tdp_watts=70,
+            score=0.6,
+            created_at=created,
+            updated_at=created,
+            import_id="test-import-update",
+        )
+        self.session.add(scored_listing)
+        self.session.commit()
+
+        scored_listing.price = 380.0
+        self.session.commit()
+
+        self.assertEqual(scored_listing.created_at, created)
+        self.assertGreater(scored_listing.updated_at, created)
+
+    def test_bulk_insert_listings(self):
+        """Test that bulk inserts span several statements and apply column defaults."""
+        self.session.add(ImportBatch(import_id="test-import-bulk", source="test"))
+        self.session.add(Model(model="RTX_A4000", vram_gb=16, tdp_watts=140))
+        self.session.commit()
+
+        rows = [
+            {
+                "canonical_model": "RTX_A4000",
+                "price": 700.0 + i,
+                "vram_gb": 16,
+                "tdp_watts": 140,
+                "score": 0.5,
+                "import_id": "test-import-bulk",
+                "import_index": i,
+            }
+            for i in range(250)
+        ]
+        with self.engine.begin() as conn:
+            inserted = bulk_insert_listings(conn, ScoredListing, rows, chunk_rows=100)
+        self.assertEqual(inserted, 250)
+
+        listings = self.session.query(ScoredListing).order_by(ScoredListing.import_index).all()
+        self.assertEqual([listing.import_index for listing in listings], list(range(250)))
+        self.assertEqual(listings[-1].price, 949.0)
+        self.assertEqual(listings[0].mig_support, 0)
+        self.assertIsNotNone(listings[0].created_at)
+
+    def test_bulk_insert_reuses_statements(self):
+        """Test that bulk inserts of the same column shape reuse one planned statement."""
+        self.session.add(Model(model="RTX_A4000", vram_gb=16, tdp_watts=140))
+        self.session.commit()
+
+        def batch(start):
+            return [
+                {
+                    "canonical_model": "RTX_A4000",
+                    "price": 700.0 + i,
+                    "vram_gb": 16,
+                    "tdp_watts": 140,
+                    "nvlink": True,
+                    "score": 0.5,
+                    "seen_at": datetime(2025, 1, 1, 12, 0, 0),
+                }
+                for i in range(start, start + 10)
+            ]
+
+        with self.engine.begin() as conn:
+            bulk_insert_listings(conn, ScoredListing, batch(0))
+            plans = _table_insert_plan.cache_info()
+            statements = _values_sql.cache_info()
+            bulk_insert_listings(conn, ScoredListing, batch(10))
+        self.assertEqual(_table_insert_plan.cache_info().hits, plans.hits + 1)
+        self.assertEqual(_values_sql.cache_info().misses, statements.misses)
+
+        listings = self.session.query(ScoredListing).all()
+        self.assertEqual(len(listings), 20)
+        self.assertTrue(all(listing.nvlink is True for listing in listings))
+        self.assertEqual(listings[0].seen_at, datetime(2025, 1, 1, 12, 0, 0))
+        self.assertIsNotNone(listings[0].updated_at)
+
+    def test_lookup_ids(self):
+        """Test that lookup names are created once and resolved to stable ids."""
+        with self.engine.begin() as conn:
+            first = lookup_ids(conn, Condition, ["new", "used", "new", None])
+            second = lookup_ids(conn, Condition, ["used", "refurbished"])
+
+        self.assertEqual(set(first), {"new", "used"})
+        self.assertEqual(second["used"], first["used"])
+        self.assertEqual(self.session.query(Condition).count(), 3)
+
+
+class TestMigrations(unittest.TestCase):
+    """Test the Alembic migration chain against a temporary database."""
+
+    def setUp(self):
+        """Point an Alembic config at the migrations package and a temporary database."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.temp_dir, "gpu.db")
+        # Configured in code rather than from alembic.ini, so env.py leaves logging alone
+        self.config = Config()
+        self.config.set_main_option("script_location", MIGRATIONS_DIR)
+        self.config.set_main_option("sqlalchemy.url", f"sqlite:///{self.db_path}")
+
+    def tearDown(self):
+        """Remove the temporary database."""
+        shutil.rmtree(self.temp_dir)
+
+    def _table_sql(self, table):
+        """Return a table's CREATE statement from sqlite_master."""
+        with sqlite3.connect(self.db_path) as conn:
+            return conn.execute("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)).fetchone()
+
+    def test_upgrade_and_downgrade_full_chain(self):
+        """Test that every revision upgrades to head and downgrades back to base."""
+        command.upgrade(self.config, "20261017_quantized_by_listing")
+        (before,) = self._table_sql("scored_listings")
+
+        command.upgrade(self.config, "head")
+        (strict,) = self._table_sql("scored_listings")
+        self.assertTrue(strict.endswith("STRICT"))
+
+        # The STRICT rebuild restores the previous definition, so the lookup-column drops that
+        # follow can still run
+        command.downgrade(self.config, "20261017_quantized_by_listing")
+        (after,) = self._table_sql("scored_listings")
+        self.assertEqual(after.replace('"scored_listings"', "scored_listings"), before)
+
+        command.upgrade(self.config, "head")
+        command.downgrade(self.config, "base")
+        self.assertIsNone(self._table_sql("scored_listings"))
+
 
 if __name__ == "__main__":
     unittest.main()
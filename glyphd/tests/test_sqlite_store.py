@@ -6,14 +6,20 @@ the ListingStore interface using SQLite as the storage backend.
 """
 
 import os
+import shutil
 import tempfile
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
 
 import pytest
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.exc import IntegrityError
 
 from glyphd.api.models import GPUListingDTO
 from glyphd.core.storage import SqliteListingStore
+from glyphd.core.storage.sqlite_store import FUZZY_MATCH_THRESHOLD, _best_fuzzy_match
+from glyphd.sqlite.pragmas import optimize_on_close
+from glyphsieve.core.normalization import fuzzy_match
 
 
 @pytest.fixture
@@ -67,10 +73,8 @@ def temp_db_path() -> str:
     temp_dir = tempfile.mkdtemp()
     db_path = os.path.join(temp_dir, "test.sqlite3")
     yield db_path
-    # Clean up
-    if os.path.exists(db_path):
-        os.remove(db_path)
-    os.rmdir(temp_dir)
+    # Clean up (including any WAL/SHM sidecar files)
+    shutil.rmtree(temp_dir, ignore_errors=True)
 
 
 def test_init_creates_schema(temp_db_path: str) -> None:
@@ -104,6 +108,10 @@ def test_init_creates_schema(temp_db_path: str) -> None:
         result = conn.execute(text("SELECT name FROM sqlite_master WHERE type='table' AND name='quantized_listings'"))
         assert result.fetchone() is not None, "quantized_listings table not created"
 
+        # updated_at is assigned by the application, not by per-row UPDATE triggers
+        result = conn.execute(text("SELECT name FROM sqlite_master WHERE type='trigger' AND name LIKE 'update_%'"))
+        assert result.fetchall() == [], "updated_at triggers should not be created"
+
 
 def test_insert_listings(temp_db_path: str, sample_listings: List[GPUListingDTO]) -> None:
     """
@@ -149,6 +157,37 @@ def test_insert_listings(temp_db_path: str, sample_listings: List[GPUListingDTO]
         assert count == len(sample_listings), f"Expected {len(sample_listings)} scored listings, got {count}"
 
 
+def test_insert_listings_spanning_multiple_chunks(temp_db_path: str, sample_listings: List[GPUListingDTO]) -> None:
+    """
+    Test that batches larger than one multi-row INSERT keep every row and its import_index.
+
+    Args:
+        temp_db_path: Path to a temporary SQLite database
+        sample_listings: List of sample GPU listings
+    """
+    store = SqliteListingStore(temp_db_path)
+    listings = sample_listings * 100
+
+    count = store.insert_listings(listings, "test-import-chunks")
+
+    assert count == len(listings)
+    engine = create_engine(f"sqlite:///{temp_db_path}")
+    with engine.connect() as conn:
+        rows = conn.execute(
+            text("SELECT canonical_model, price, import_index FROM scored_listings ORDER BY import_index")
+        ).fetchall()
+        assert [row[2] for row in rows] == list(range(1, len(listings) + 1))
+        assert [(row[0], row[1]) for row in rows] == [(item.canonical_model, item.price) for item in listings]
+
+        model_count = conn.execute(text("SELECT COUNT(*) FROM models")).scalar()
+        assert model_count == len(sample_listings)
+
+        # Each model row comes from the first listing of that model
+        model_indexes = dict(conn.execute(text("SELECT model, import_index FROM models")).fetchall())
+        assert model_indexes == {item.canonical_model: i for i, item in enumerate(sample_listings, start=1)}
+    store.close()
+
+
 def test_query_listings(temp_db_path: str, sample_listings: List[GPUListingDTO]) -> None:
     """
     Test that querying listings works correctly.
@@ -189,6 +228,154 @@ def test_query_listings(temp_db_path: str, sample_listings: List[GPUListingDTO])
         assert listing.score <= max_score, f"Expected score <= {max_score}, got {listing.score}"
 
 
+def test_query_listings_by_region(temp_db_path: str, sample_listings: List[GPUListingDTO]) -> None:
+    """
+    Test that imported regions are stored as lookup ids and the region filter matches them.
+
+    Args:
+        temp_db_path: Path to a temporary SQLite database
+        sample_listings: List of sample GPU listings
+    """
+
+    class RegionalListingDTO(GPUListingDTO):
+        region: Optional[str] = None
+        condition: Optional[str] = None
+
+    store = SqliteListingStore(temp_db_path)
+    listings = [
+        RegionalListingDTO(**listing.model_dump(), region="US" if listing.canonical_model == "RTX_4090" else None)
+        for listing in sample_listings
+    ]
+    listings[0].condition = "used"
+    store.insert_listings(listings, "test-import-1")
+
+    assert [listing.canonical_model for listing in store.query_listings(region="US")] == ["RTX_4090"]
+    assert store.query_listings(region="EU") == []
+    assert store.query_listings(region="APAC") == []
+    with store.engine.connect() as conn:
+        conditions = conn.execute(
+            text("SELECT c.name FROM scored_listings AS s JOIN conditions AS c ON c.id = s.condition_id")
+        ).scalars().all()
+    assert conditions == ["used"]
+    store.close()
+
+
+def test_model_market_stats_refreshed_per_import(temp_db_path: str, sample_listings: List[GPUListingDTO]) -> None:
+    """
+    Test that each import batch rebuilds the per-model market aggregates.
+
+    Args:
+        temp_db_path: Path to a temporary SQLite database
+        sample_listings: List of sample GPU listings
+    """
+    store = SqliteListingStore(temp_db_path)
+    h100 = sample_listings[0]
+    extra = [h100.model_copy(update={"price": price}) for price in (12000.0, 9000.0, 20000.0)]
+    store.insert_listings(sample_listings, "test-import-1")
+    store.insert_listings(extra, "test-import-2")
+
+    stats_sql = text(
+        "SELECT model, listing_count, min_price, median_price, max_price, avg_price "
+        "FROM model_market_stats ORDER BY model"
+    )
+    with store.engine.connect() as conn:
+        stats = conn.execute(stats_sql).fetchall()
+    assert stats == [
+        ("A100_PCIE_80GB", 1, 8000.0, 8000.0, 8000.0, 8000.0),
+        ("H100_PCIE_80GB", 4, 9000.0, 11000.0, 20000.0, 12750.0),
+        ("RTX_4090", 1, 1500.0, 1500.0, 1500.0, 1500.0),
+    ]
+
+    # Re-importing a batch replaces its listings; models left without listings drop out
+    store.insert_listings(extra[:1], "test-import-1")
+    with store.engine.connect() as conn:
+        stats = conn.execute(stats_sql).fetchall()
+    assert stats == [("H100_PCIE_80GB", 4, 9000.0, 12000.0, 20000.0, 13250.0)]
+    store.close()
+
+
+def test_model_market_stats_refresh_only_touched_models(
+    temp_db_path: str, sample_listings: List[GPUListingDTO]
+) -> None:
+    """
+    Test that an import leaves the market stats of models outside the batch untouched.
+
+    Args:
+        temp_db_path: Path to a temporary SQLite database
+        sample_listings: List of sample GPU listings
+    """
+    store = SqliteListingStore(temp_db_path)
+    store.insert_listings(sample_listings, "test-import-1")
+    with store.engine.begin() as conn:
+        conn.execute(text("UPDATE model_market_stats SET listing_count = 99 WHERE model = 'RTX_4090'"))
+
+    store.insert_listings([sample_listings[0].model_copy(update={"price": 9000.0})], "test-import-2")
+    with store.engine.connect() as conn:
+        counts = dict(conn.execute(text("SELECT model, listing_count FROM model_market_stats")).fetchall())
+    assert counts == {"A100_PCIE_80GB": 1, "H100_PCIE_80GB": 2, "RTX_4090": 99}
+    store.close()
+
+
+def test_insert_listings_upserts_models(temp_db_path: str, sample_listings: List[GPUListingDTO]) -> None:
+    """
+    Test that a later batch refreshes the specs of known models in place.
+
+    Args:
+        temp_db_path: Path to a temporary SQLite database
+        sample_listings: List of sample GPU listings
+    """
+    store = SqliteListingStore(temp_db_path)
+    store.insert_listings(sample_listings, "test-import-1")
+    models_sql = text("SELECT id, model, vram_gb, tdp_watts, import_id FROM models ORDER BY model")
+    with store.engine.connect() as conn:
+        before = conn.execute(models_sql).fetchall()
+        conn.exec_driver_sql("UPDATE models SET updated_at = '2020-01-01 00:00:00'")
+        conn.commit()
+
+    h100 = sample_listings[0].model_copy(update={"tdp_watts": 400})
+    store.insert_listings([h100, sample_listings[1]], "test-import-2")
+
+    with store.engine.connect() as conn:
+        after = conn.execute(models_sql).fetchall()
+        updated = conn.exec_driver_sql(
+            "SELECT model FROM models WHERE updated_at > '2020-01-01 00:00:00' ORDER BY model"
+        ).fetchall()
+    # Same rows and ids, first import kept; only the changed model's specs and updated_at moved
+    assert [row[:2] for row in after] == [row[:2] for row in before]
+    assert {row[1]: row[3] for row in after}[h100.canonical_model] == 400
+    assert {row[4] for row in after} == {"test-import-1"}
+    assert updated == [(h100.canonical_model,)]
+
+
+def test_insert_listings_keeps_known_model_specs(
+    temp_db_path: str, sample_listings: List[GPUListingDTO]
+) -> None:
+    """
+    Test that a later listing with unknown (zero) specs does not overwrite a model's known specs.
+
+    Args:
+        temp_db_path: Path to a temporary SQLite database
+        sample_listings: List of sample GPU listings
+    """
+    store = SqliteListingStore(temp_db_path)
+    h100 = sample_listings[0]
+    store.insert_listings([h100], "test-import-1")
+
+    unknown = h100.model_copy(update={"vram_gb": 0, "tdp_watts": 0, "mig_support": 0, "nvlink": False})
+    store.insert_listings([unknown], "test-import-2")
+    partial = h100.model_copy(update={"tdp_watts": 0, "mig_support": 3})
+    store.insert_listings([partial], "test-import-3")
+
+    with store.engine.connect() as conn:
+        specs = conn.execute(
+            text("SELECT vram_gb, tdp_watts, mig_support, nvlink FROM models WHERE model = :model"),
+            {"model": h100.canonical_model},
+        ).one()
+    # The unknown batch changed nothing; the partial one kept the known TDP
+    assert tuple(specs) == (h100.vram_gb, h100.tdp_watts, 3, 1 if h100.nvlink else 0)
+    store.close()
+
+
 def test_list_imports(temp_db_path: str, sample_listings: List[GPUListingDTO]) -> None:
     """
     Test that listing imports works correctly.
@@ -379,3 +566,400 @@ def test_import_metadata_in_dtos(temp_db_path: str, sample_listings: List[GPULis
         assert listing.import_index is not None, "import_index should not be None"
         assert isinstance(listing.import_index, int), f"import_index should be int, got {type(listing.import_index)}"
         assert listing.import_index >= 1, f"import_index should be >= 1, got {listing.import_index}"
+
+
+def test_scored_listings_rejects_invalid_values(temp_db_path: str, sample_listings: List[GPUListingDTO]) -> None:
+    """
+    Test that the STRICT scored_listings table rejects mistyped and out-of-range values.
+
+    Args:
+        temp_db_path: Path to a temporary SQLite database
+        sample_listings: List of sample GPU listings
+    """
+    store = SqliteListingStore(temp_db_path)
+    store.insert_listings(sample_listings, "test-import-1")
+
+    insert_sql = (
+        "INSERT INTO scored_listings (canonical_model, price, vram_gb, tdp_watts, nvlink, score) "
+        "VALUES ('RTX_4090', ?, ?, 450, ?, ?)"
+    )
+    invalid = [
+        ("1500 USD", 24, 0, 0.5),  # TEXT in a REAL column
+        (1500.0, -1, 0, 0.5),
+        (1500.0, 24, 2, 0.5),
+        (1500.0, 24, 0, 1e12),
+    ]
+    for params in invalid:
+        with pytest.raises(IntegrityError), store.engine.begin() as conn:
+            conn.exec_driver_sql(insert_sql, params)
+
+    # Values that convert losslessly are stored with the declared type
+    with store.engine.begin() as conn:
+        conn.exec_driver_sql(insert_sql, ("1500", 24.0, True, 1))
+        row = conn.exec_driver_sql(
+            "SELECT typeof(price), typeof(vram_gb), typeof(nvlink), typeof(score) FROM scored_listings "
+            "ORDER BY id DESC LIMIT 1"
+        ).fetchone()
+    assert tuple(row) == ("real", "integer", "integer", "real")
+
+
+def test_memory_store_reuses_one_connection() -> None:
+    """Test that an in-memory store serves every checkout from the same connection, across threads."""
+    store = SqliteListingStore(":memory:")
+    with store.engine.connect() as conn:
+        first = conn.connection.dbapi_connection
+
+    def checkout():
+        with store.engine.connect() as conn:
+            return conn.connection.dbapi_connection
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        assert executor.submit(checkout).result() is first
+    store.close()
+
+
+def test_connection_pragmas(temp_db_path: str) -> None:
+    """
+    Test that every pooled connection is opened with the tuned pragmas.
+
+    Args:
+        temp_db_path: Path to a temporary SQLite database
+    """
+    store = SqliteListingStore(temp_db_path)
+    with store.engine.connect() as conn:
+        assert conn.exec_driver_sql("PRAGMA journal_mode").scalar() == "wal"
+        assert conn.exec_driver_sql("PRAGMA synchronous").scalar() == 1  # NORMAL
+        assert conn.exec_driver_sql("PRAGMA foreign_keys").scalar() == 1
+        assert conn.exec_driver_sql("PRAGMA cache_size").scalar() == -65536
+    assert event.contains(store.engine, "close", optimize_on_close)
+    store.close()
+
+
+def test_insert_listings_refreshes_planner_statistics(
+    temp_db_path: str, sample_listings: List[GPUListingDTO]
+) -> None:
+    """
+    Test that an import batch commits planner statistics for the tables it wrote.
+
+    Args:
+        temp_db_path: Path to a temporary SQLite database
+        sample_listings: List of sample GPU listings
+    """
+    store = SqliteListingStore(temp_db_path)
+    store.insert_listings(sample_listings, "test-import-1")
+    with store.engine.connect() as conn:
+        analyzed = {row[0] for row in conn.execute(text("SELECT DISTINCT tbl FROM sqlite_stat1"))}
+    assert "scored_listings" in analyzed
+    store.close()
+
+
+def test_concurrent_inserts_share_write_lock(temp_db_path: str, sample_listings: List[GPUListingDTO]) -> None:
+    """
+    Test that stores on the same file share one write lock and concurrent inserts all land.
+
+    Args:
+        temp_db_path: Path to a temporary SQLite database
+        sample_listings: List of sample GPU listings
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    store = SqliteListingStore(temp_db_path)
+    other = SqliteListingStore(temp_db_path)
+    assert store._write_lock is other._write_lock
+
+    import_ids = [f"test-import-{i}" for i in range(8)]
+
+    def insert(index: int) -> int:
+        return (store, other)[index % 2].insert_listings(sample_listings, import_ids[index])
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        counts = list(executor.map(insert, range(len(import_ids))))
+
+    assert counts == [len(sample_listings)] * len(import_ids)
+    assert {item.import_id for item in store.list_imports()} == set(import_ids)
+    store.close()
+    other.close()
+
+
+def test_fuzzy_model_catalog_cache(temp_db_path: str, sample_listings: List[GPUListingDTO]) -> None:
+    """
+    Test that the fuzzy-match model catalog is reused until another store inserts listings.
+
+    Args:
+        temp_db_path: Path to a temporary SQLite database
+        sample_listings: List of sample GPU listings
+    """
+    store = SqliteListingStore(temp_db_path)
+    writer = SqliteListingStore(temp_db_path)
+    writer.insert_listings(sample_listings[:2], "test-import-1")
+
+    with store.engine.connect() as conn:
+        first = store._get_model_names(conn)
+        assert set(first) == {"H100_PCIE_80GB", "A100_PCIE_80GB"}
+        assert store._get_model_names(conn) is first
+
+    # An insert through a different store changes the rowid fingerprint
+    writer.insert_listings(sample_listings[2:], "test-import-2")
+    with store.engine.connect() as conn:
+        assert set(store._get_model_names(conn)) == {"H100_PCIE_80GB", "A100_PCIE_80GB", "RTX_4090"}
+    store.close()
+    writer.close()
+
+
+def test_fts_candidate_models(temp_db_path: str, sample_listings: List[GPUListingDTO]) -> None:
+    """
+    Test trigram full-text lookup of listed models and its fallback on older databases.
+
+    Args:
+        temp_db_path: Path to a temporary SQLite database
+        sample_listings: List of sample GPU listings
+    """
+    store = SqliteListingStore(temp_db_path)
+    store.insert_listings(sample_listings, "test-import-1")
+
+    with store.engine.connect() as conn:
+        assert store._get_fts_candidate_models(conn, "h100") == ["H100_PCIE_80GB"]
+        assert set(store._get_fts_candidate_models(conn, "PCIE_80GB")) == {"H100_PCIE_80GB", "A100_PCIE_80GB"}
+        assert store._get_fts_candidate_models(conn, "40") == []
+        assert store._get_fuzzy_matched_models(conn, "H100_PCIE") == ["H100_PCIE_80GB"]
+
+    # Databases created before models_fts existed fall back to the full fuzzy scan
+    with store.engine.begin() as conn:
+        conn.exec_driver_sql("DROP TRIGGER models_fts_insert")
+        conn.exec_driver_sql("DROP TABLE models_fts")
+    with store.engine.connect() as conn:
+        assert store._get_fts_candidate_models(conn, "H100") == []
+        assert store._get_fuzzy_matched_models(conn, "H100_PCIE_80GB") == ["H100_PCIE_80GB"]
+    store.close()
+
+
+def test_model_filtered_query_uses_composite_index(temp_db_path: str) -> None:
+    """
+    Test that a model plus score range query searches the composite index instead of scanning.
+
+    Args:
+        temp_db_path: Path to a temporary SQLite database
+    """
+    store = SqliteListingStore(temp_db_path)
+    query, params = store._build_query_with_filters(["H100_PCIE_80GB"], max_price=20000.0, min_score=0.5)
+    with store.engine.connect() as conn:
+        plan = " ".join(str(row[-1]) for row in conn.execute(text(f"EXPLAIN QUERY PLAN {query}"), params))
+    assert "idx_scored_listings_model_score_price_seen_at" in plan
+    assert "SCAN scored_listings" not in plan
+    store.close()
+
+
+@pytest.mark.parametrize(
+    ("query", "index"),
+    [
+        (
+            "SELECT * FROM scored_listings WHERE region_id = (SELECT id FROM regions WHERE name = 'US') "
+            "AND canonical_model = 'RTX_4090' ORDER BY score DESC",
+            "idx_scored_listings_region_model_score",
+        ),
+        (
+            "SELECT * FROM scored_listings WHERE import_id = 'test-import-1' ORDER BY seen_at DESC",
+            "idx_scored_listings_import_id_seen_at",
+        ),
+    ],
+)
+def test_filter_and_sort_queries_use_composite_indexes(temp_db_path: str, query: str, index: str) -> None:
+    """
+    Test that region/model and import_id filters are searched and sorted through their composite indexes.
+
+    Args:
+        temp_db_path: Path to a temporary SQLite database
+        query: Filter + sort query to plan
+        index: Composite index expected to serve the query
+    """
+    store = SqliteListingStore(temp_db_path)
+    with store.engine.connect() as conn:
+        plan = " ".join(str(row[-1]) for row in conn.execute(text(f"EXPLAIN QUERY PLAN {query}")))
+    assert f"SEARCH scored_listings USING INDEX {index}" in plan
+    assert "TEMP B-TREE" not in plan
+    store.close()
+
+
+def test_top_k_by_score_walks_score_index(temp_db_path: str) -> None:
+    """
+    Test that a top-K by score reads the score index in order instead of sorting the table.
+
+    Args:
+        temp_db_path: Path to a temporary SQLite database
+    """
+    store = SqliteListingStore(temp_db_path)
+    query = "SELECT canonical_model, score FROM scored_listings ORDER BY score DESC LIMIT 5"
+    with store.engine.connect() as conn:
+        plan = " ".join(str(row[-1]) for row in conn.execute(text(f"EXPLAIN QUERY PLAN {query}")))
+    assert "USING INDEX idx_scored_listings_score" in plan
+    assert "TEMP B-TREE" not in plan
+    store.close()
+
+
+def test_no_redundant_single_column_indexes(temp_db_path: str) -> None:
+    """
+    Test that columns covered by a UNIQUE constraint or a composite prefix have no extra index.
+
+    Args:
+        temp_db_path: Path to a temporary SQLite database
+    """
+    store = SqliteListingStore(temp_db_path)
+    with store.engine.connect() as conn:
+        indexes = {row[0] for row in conn.execute(text("SELECT name FROM sqlite_master WHERE type = 'index'"))}
+        model_plan = " ".join(
+            str(row[-1]) for row in conn.execute(text("EXPLAIN QUERY PLAN SELECT id FROM models WHERE model = 'X'"))
+        )
+        listing_plan = " ".join(
+            str(row[-1])
+            for row in conn.execute(
+                text("EXPLAIN QUERY PLAN SELECT price FROM scored_listings WHERE canonical_model = 'X'")
+            )
+        )
+    assert not indexes & {
+        "idx_models_model",
+        "idx_scored_listings_canonical_model",
+        "idx_scored_listings_region",
+        "idx_scored_listings_import_id",
+    }
+    assert "USING COVERING INDEX sqlite_autoindex_models_1" in model_plan
+    assert "USING COVERING INDEX idx_scored_listings_model_score_price_seen_at" in listing_plan
+    store.close()
+
+
+def test_model_set_filter_uses_fixed_sql(temp_db_path: str, sample_listings: List[GPUListingDTO]) -> None:
+    """
+    Test that model sets of any size produce the same SQL text and filter correctly.
+
+    Args:
+        temp_db_path: Path to a temporary SQLite database
+        sample_listings: List of sample GPU listings
+    """
+    store = SqliteListingStore(temp_db_path)
+    store.insert_listings(sample_listings, "test-import-1")
+
+    one_query, _ = store._build_query_with_filters(["RTX_4090"])
+    two_query, params = store._build_query_with_filters(["H100_PCIE_80GB", "RTX_4090"])
+    assert one_query == two_query
+
+    with store.engine.connect() as conn:
+        models = sorted(row[0] for row in conn.execute(text(two_query), params))
+    assert models == ["H100_PCIE_80GB", "RTX_4090"]
+    store.close()
+
+
+def test_trusted_row_conversion_matches_validated(temp_db_path: str, sample_listings: List[GPUListingDTO]) -> None:
+    """
+    Test that DTOs built without validation match fully validated ones.
+
+    Args:
+        temp_db_path: Path to a temporary SQLite database
+        sample_listings: List of sample GPU listings
+    """
+    store = SqliteListingStore(temp_db_path)
+    store.insert_listings(sample_listings, "test-import-1")
+
+    query, params = store._build_query_with_filters([])
+    with store.engine.connect() as conn:
+        rows = conn.execute(text(query), params).fetchall()
+
+    trusted = store._convert_rows_to_dtos(rows)
+    validated = store._convert_rows_to_dtos(rows, trusted=False)
+    assert [dto.model_dump() for dto in trusted] == [dto.model_dump() for dto in validated]
+    assert trusted[0].nvlink is True
+    assert trusted[2].nvlink is False
+    store.close()
+
+
+def test_list_imports_pagination(temp_db_path: str, sample_listings: List[GPUListingDTO]) -> None:
+    """
+    Test that list_imports pages newest-first through the imported_at index.
+
+    Args:
+        temp_db_path: Path to a temporary SQLite database
+        sample_listings: List of sample GPU listings
+    """
+    store = SqliteListingStore(temp_db_path)
+    for i in range(3):
+        store.insert_listings(sample_listings, f"test-import-{i}")
+    with store.engine.begin() as conn:
+        for i in range(3):
+            conn.execute(
+                text("UPDATE import_batches SET imported_at = :ts WHERE import_id = :import_id"),
+                {"ts": f"2025-01-0{i + 1} 00:00:00", "import_id": f"test-import-{i}"},
+            )
+
+    assert [item.import_id for item in store.list_imports()] == ["test-import-2", "test-import-1", "test-import-0"]
+    assert [item.import_id for item in store.list_imports(limit=1, offset=1)] == ["test-import-1"]
+    assert [item.import_id for item in store.list_imports(offset=2)] == ["test-import-0"]
+
+    with store.engine.connect() as conn:
+        rows = conn.exec_driver_sql(
+            "EXPLAIN QUERY PLAN SELECT import_id FROM import_batches ORDER BY imported_at DESC LIMIT 1"
+        )
+        plan = " ".join(str(row[-1]) for row in rows)
+    assert "idx_import_batches_imported_at" in plan
+    store.close()
+
+
+def test_best_fuzzy_match_agrees_with_glyphsieve() -> None:
+    """
+    Test that the batched RapidFuzz lookup picks the same model as glyphsieve's fuzzy_match.
+    """
+    catalog = ["H100_PCIE_80GB", "A100_PCIE_80GB", "RTX_4090", "RTX_A2000_12GB", "L40S", "RTX_A4000", "A2", "A40"]
+    queries = ["h100 pcie", "RTX 4090", "a2000", "L40S 48GB", "Radeon VII", "A100_PCIE_80GB", "a2", "a40", "a 2000"]
+    # Both orders, so ties between equally scored choices must resolve to the first one
+    for choices in (catalog, catalog[::-1]):
+        for query in queries:
+            expected, _, _ = fuzzy_match(query, {m: [m] for m in choices}, threshold=FUZZY_MATCH_THRESHOLD)
+            assert _best_fuzzy_match(query, choices) == expected, query
+
+    assert _best_fuzzy_match("a2", catalog) == "RTX_A2000_12GB"
+    assert _best_fuzzy_match("a40", catalog) == "RTX_A4000"
+
+
+def test_schema_check_runs_once_per_file(temp_db_path: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test that stores opened on an already-checked file skip the schema check, until the file is replaced.
+
+    Args:
+        temp_db_path: Path to a temporary SQLite database
+        monkeypatch: Pytest monkeypatch fixture
+    """
+    first = SqliteListingStore(temp_db_path)
+    first.close()
+
+    checks = []
+    original = SqliteListingStore._initialize_schema
+    monkeypatch.setattr(SqliteListingStore, "_initialize_schema", lambda self: checks.append(self) or original(self))
+
+    second = SqliteListingStore(temp_db_path)
+    second.close()
+    assert checks == []
+
+    # A new file moved over the same path is a different database and gets its schema created
+    open(temp_db_path + ".new", "wb").close()
+    os.replace(temp_db_path + ".new", temp_db_path)
+    third = SqliteListingStore(temp_db_path)
+    assert checks == [third]
+    with third.engine.connect() as conn:
+        assert conn.execute(text("SELECT name FROM sqlite_master WHERE name = 'scored_listings'")).scalar()
+    third.close()
+
+
+def test_filter_sql_is_shared_per_signature(temp_db_path: str) -> None:
+    """
+    Test that queries with the same set of filters reuse one SQL string regardless of values.
+
+    Args:
+        temp_db_path: Path to a temporary SQLite database
+    """
+    store = SqliteListingStore(temp_db_path)
+    cheap, cheap_params = store._build_query_with_filters([], max_price=500.0, limit=10)
+    pricey, pricey_params = store._build_query_with_filters([], max_price=9000.0, limit=5)
+    assert cheap is pricey
+    assert cheap_params == {"max_price": 500.0, "limit": 10}
+    assert pricey_params == {"max_price": 9000.0, "limit": 5}
+
+    scored, _ = store._build_query_with_filters([], max_price=500.0, min_score=0.5, limit=10)
+    assert scored != cheap
+    store.close()
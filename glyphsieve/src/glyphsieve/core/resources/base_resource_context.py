@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from functools import cached_property
 from pathlib import Path
 from typing import List, Type
 
@@ -8,8 +9,10 @@ from glyphsieve.core.resources.base_resource_loader import ResourceLoader
 
 
 class ResourceContext(ABC):
-    def __init__(self):
-        self.loaders = self.get_loaders()
+    @cached_property
+    def loaders(self) -> dict[str, ResourceLoader]:
+        """Loader mapping, built on first use and reused for the life of the context."""
+        return self.get_loaders()
 
     @abstractmethod
     def get_loaders(self) -> dict[str, ResourceLoader]:
@@ -1,11 +1,26 @@
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from importlib.resources import files
-from typing import Type
+from pathlib import Path
+from typing import Any, Type
 
 import yaml
 
 from .base_resource_loader import ResourceLoader, T
 
+# Prefer the libyaml-backed C loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+
+@lru_cache(maxsize=32)
+def _cached_yaml(path_str: str, mtime_ns: int) -> Any:
+    """Parse a YAML file; keyed on mtime so edits on disk invalidate the cache."""
+    with Path(path_str).open("r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=_SafeLoader)
+
 
 class BaseYamlLoader(ResourceLoader, ABC):
     @property
@@ -16,6 +31,9 @@ class BaseYamlLoader(ResourceLoader, ABC):
 
     def load(self, model: Type[T], resource_name: str) -> T:
         resource_path = files(self.resource_uri).joinpath(resource_name)
-        with resource_path.open("r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+        if isinstance(resource_path, Path):
+            data = _cached_yaml(str(resource_path), resource_path.stat().st_mtime_ns)
+        else:
+            with resource_path.open("r", encoding="utf-8") as f:
+                data = yaml.load(f, Loader=_SafeLoader)
         return model.model_validate(data)